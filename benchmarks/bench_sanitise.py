@@ -0,0 +1,154 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of sanitising a large cube response of ``tabledata()``.
+
+Run it from the root of the repository::
+
+    PYTHONPATH=. python benchmarks/bench_sanitise.py --rows 3000 --repeat 3
+
+Only ``SingStat.sanitise_data()`` is called, so the same script can time an \
+    earlier version of the package, e.g. from a ``git worktree`` of an \
+    earlier commit with ``PYTHONPATH`` set to the worktree.
+
+Three timings are reported, each the best of ``--repeat`` runs with a new \
+    client, i.e. with an empty cache of sanitised strings:
+
+- ``walk``: the response with numbers instead of strings, so that only the \
+    walk of the tree is timed.
+- ``full``: the response with strings, as returned by the endpoint, i.e. \
+    the end-to-end time of sanitising a response.
+- ``schema``: as ``full``, with ``schema=TabledataDict``, if the version \
+    supports it.
+"""
+
+import argparse
+from copy import deepcopy
+from time import perf_counter
+from typing import Any, Callable
+
+from singstat.singstat import SingStat
+from singstat.client.constants import TABLEDATA_SANITISE_IGNORE_KEYS
+from singstat.client.types import TabledataDict
+
+COLUMNS_PER_ROW = 9
+PERIODS = ('2018', '2019', '2020', '2021')
+VALUES = ('1234.5', 'na', '12', '-', '0.25', '98765')
+
+def cube_response(rows: int, as_strings: bool=True) -> dict[str, Any]:
+    """Return a cube response of ``tabledata()`` with ``rows`` rows, each \
+        with 9 columns of 4 periods."""
+    def leaf(value: str) -> Any:
+        return value if as_strings else len(value)
+
+    return {
+        'Data': {
+            'id': 'M000001',
+            'title': 'Benchmark table',
+            'footnote': '',
+            'frequency': 'Annual',
+            'datasource': 'Benchmark',
+            'generatedBy': 'SingStat Table Builder',
+            'dataLastUpdated': leaf('01/10/2026'),
+            'dateGenerated': leaf('17/10/2026'),
+            'offset': None,
+            'limit': 3000,
+            'tableType': 'Cross-Sectional Multi-Dimensional Cube',
+            'row': [
+                {
+                    'rowNo': str(i + 1),
+                    'rowText': f'Row {i + 1}',
+                    'uoM': 'Number',
+                    'footnote': '',
+                    'columns': [
+                        {
+                            'key': f'Column {j + 1}',
+                            'columns': [
+                                {
+                                    'key': period,
+                                    'value': leaf(
+                                        VALUES[(i + j + k) % len(VALUES)],
+                                    ),
+                                }
+                                for k, period in enumerate(PERIODS)
+                            ],
+                        }
+                        for j in range(COLUMNS_PER_ROW)
+                    ],
+                }
+                for i in range(rows)
+            ],
+        },
+        'DataCount': rows,
+        'StatusCode': 200,
+        'Message': '',
+    }
+
+def best_of(repeat: int, response: Any, sanitise: Callable) -> float:
+    """Return the shortest time, in seconds, of sanitising a copy of the \
+        response with a new client."""
+    timings = []
+    for _ in range(repeat):
+        client = SingStat(cache_backend='memory')
+        value = deepcopy(response)
+        start = perf_counter()
+        _ = sanitise(client, value)
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+def main() -> None:
+    """Print the timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=3000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    def sanitise(client: SingStat, value: Any) -> Any:
+        return client.sanitise_data(
+            value,
+            ignore_keys=TABLEDATA_SANITISE_IGNORE_KEYS,
+        )
+
+    def sanitise_with_schema(client: SingStat, value: Any) -> Any:
+        return client.sanitise_data(
+            value,
+            ignore_keys=TABLEDATA_SANITISE_IGNORE_KEYS,
+            schema=TabledataDict,
+        )
+
+    timings = {
+        'walk': best_of(
+            args.repeat,
+            cube_response(args.rows, as_strings=False),
+            sanitise,
+        ),
+        'full': best_of(args.repeat, cube_response(args.rows), sanitise),
+    }
+    try:
+        timings['schema'] = best_of(
+            args.repeat,
+            cube_response(args.rows),
+            sanitise_with_schema,
+        )
+    except TypeError:
+        # This version has no ``schema`` argument.
+        pass
+
+    leaves = args.rows * COLUMNS_PER_ROW * len(PERIODS)
+    print(f'{args.rows} rows, {leaves} values, best of {args.repeat}:')
+    for name, seconds in timings.items():
+        print(f'  {name:<6} {seconds * 1000:10.1f} ms')
+
+if __name__ == '__main__':
+    main()
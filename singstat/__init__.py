@@ -14,12 +14,13 @@
 
 from datetime import datetime
 
-from .client import Client
+from .client import AsyncClient, Client
 
 from .author import AUTHOR
 from .version import VERSION
 
 __all__ = [
+    'AsyncClient',
     'Client',
 ]
 __author__ = AUTHOR
@@ -0,0 +1,293 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Management of a client's cache of responses."""
+
+from datetime import datetime, timedelta, timezone
+from threading import Event, Thread
+from typing import Any
+from weakref import ReferenceType, ref
+
+from requests_cache import BaseCache
+from requests_cache.backends import init_backend
+from requests_cache.backends.sqlite import SQLiteDict
+
+from .compression import (
+    CompressionInfo,
+    CompressionStage,
+    compressed_serializer,
+)
+from .constants import CACHE_NAME, MEMORY_CACHE_BYTES, SQLITE_BUSY_TIMEOUT
+from .eviction import EVICTION_POLICY_LRU, CacheEvictor, CompactionInfo
+from .result_cache import ResultCache
+from .typechecking import typechecked
+
+class CacheManager:
+    """Cache backend of a client's responses, with the cache of their \
+        sanitised results, the limits of the cache's size, its compaction, \
+        and the caching of responses that raise ``APIError``.
+
+    Normally, it does not need to be created by applications. It is created \
+        by ``SingStat`` from the arguments of the same names, which are \
+        documented there.
+
+    :raises ValueError: ``cache_compression`` is set and ``cache_backend`` \
+        is a backend instance.
+    :raises ValueError: ``memory_cache_size`` is set and ``cache_results`` \
+        is ``False``, or ``memory_cache_bytes`` is set and \
+        ``memory_cache_size`` is ``0``.
+    :raises ValueError: ``negative_cache_duration`` is less than 1.
+    :raises ValueError: Refer to ``CompressionStage``, ``ResultCache`` and \
+        ``CacheEvictor``.
+    """
+
+    backend: BaseCache
+    result_cache: ResultCache | None
+    evictor: CacheEvictor | None
+    negative_cache_duration: int | None
+
+    @typechecked
+    def __init__(
+        self,
+        cache_backend: str | BaseCache='sqlite',
+        *,
+        thread_safe: bool=False,
+        cache_results: bool=False,
+        memory_cache_size: int=0,
+        memory_cache_bytes: int=MEMORY_CACHE_BYTES,
+        cache_compression: str | None=None,
+        cache_compression_level: int | None=None,
+        cache_max_bytes: int | None=None,
+        cache_max_entries: int | None=None,
+        cache_eviction_policy: str=EVICTION_POLICY_LRU,
+        negative_cache_duration: int | None=None,
+    ) -> None:
+        """Constructor method"""
+        if negative_cache_duration is not None and negative_cache_duration < 1:
+            raise ValueError(
+                'argument "negative_cache_duration" must be 1 or greater.'
+            )
+        self.negative_cache_duration = negative_cache_duration
+
+        # The memory tier is part of the cache of results, and its size in
+        # bytes only limits the memory tier.
+        if memory_cache_size != 0 and not cache_results:
+            raise ValueError(
+                'argument "memory_cache_size" can only be used with '
+                '"cache_results".'
+            )
+        if memory_cache_bytes != MEMORY_CACHE_BYTES and memory_cache_size == 0:
+            raise ValueError(
+                'argument "memory_cache_bytes" can only be used with '
+                '"memory_cache_size".'
+            )
+
+        backend_kwargs: dict[str, Any] = {}
+        if cache_compression is not None:
+            if isinstance(cache_backend, BaseCache):
+                raise ValueError(
+                    'argument "cache_compression" cannot be used with a '
+                    'cache backend instance.'
+                )
+            backend_kwargs['serializer'] = compressed_serializer(
+                cache_compression,
+                cache_compression_level,
+            )
+
+        if isinstance(cache_backend, BaseCache):
+            self.backend = cache_backend
+        elif thread_safe and cache_backend == 'sqlite':
+            self.backend = init_backend(
+                CACHE_NAME,
+                cache_backend,
+                wal=True,
+                busy_timeout=SQLITE_BUSY_TIMEOUT,
+                **backend_kwargs,
+            )
+        else:
+            self.backend = init_backend(
+                CACHE_NAME,
+                cache_backend,
+                **backend_kwargs,
+            )
+
+        self.result_cache = ResultCache(
+            self.backend,
+            memory_size=memory_cache_size,
+            memory_bytes=memory_cache_bytes,
+        ) if cache_results else None
+
+        self.evictor = CacheEvictor(
+            self.backend,
+            max_bytes=cache_max_bytes,
+            max_entries=cache_max_entries,
+            policy=cache_eviction_policy,
+            result_cache=self.result_cache,
+        ) if cache_max_bytes is not None or cache_max_entries is not None \
+            else None
+
+        self.__compaction_stop = Event()
+
+    @typechecked
+    def record_use(self, key: str, is_new: bool=False) -> None:
+        """Record a use of a response, if the cache has limits. Refer to \
+            ``CacheEvictor.record_use()``.
+
+        :param key: Key of the response in the cache.
+        :type key: str
+
+        :param is_new: Whether the response was just cached. Defaults to \
+            ``False``.
+        :type is_new: bool
+        """
+        if self.evictor is not None:
+            self.evictor.record_use(key, is_new)
+
+    @typechecked
+    def compression_info(self) -> CompressionInfo | None:
+        """Return the statistics of the responses that were compressed. \
+            Refer to ``SingStat.cache_compression_info()``.
+
+        :return: The statistics, or ``None`` if the cached responses are not \
+            compressed.
+        :rtype: CompressionInfo or None
+        """
+        serializer = getattr(self.backend.responses, 'serializer', None)
+        for stage in getattr(serializer, 'stages', ()):
+            if isinstance(stage, CompressionStage):
+                return stage.info()
+        return None
+
+    @typechecked
+    def compact(self, vacuum: bool=True) -> CompactionInfo:
+        """Delete the expired responses and their sanitised results, and \
+            evict responses if the cache is bigger than its limits. Refer to \
+            ``SingStat.compact_cache()``.
+
+        :param vacuum: If ``True`` and the cache is a SQLite cache, then the \
+            database is vacuumed afterwards. Defaults to ``True``.
+        :type vacuum: bool
+
+        :return: Result of the compaction.
+        :rtype: CompactionInfo
+        """
+        responses = self.backend.responses
+        is_sqlite = isinstance(responses, SQLiteDict)
+
+        bytes_before = responses.size() if is_sqlite else 0
+        entries_before = len(responses)
+        if is_sqlite:
+            self.backend.delete(expired=True, vacuum=False)
+        else:
+            self.backend.delete(expired=True)
+        expired = entries_before - len(responses)
+
+        evicted = 0
+        if self.evictor is not None:
+            evicted = self.evictor.evict()
+            self.evictor.prune()
+
+        if self.result_cache is not None:
+            _ = self.result_cache.delete_expired()
+
+        if vacuum and is_sqlite:
+            responses.vacuum()
+
+        return CompactionInfo(
+            expired=expired,
+            evicted=evicted,
+            bytes_before=bytes_before,
+            bytes_after=responses.size() if is_sqlite else 0,
+        )
+
+    @typechecked
+    def start_compaction(self, client: Any, interval: int) -> None:
+        """Call ``compact_cache()`` of a client every ``interval`` seconds on \
+            a background thread, until ``stop_compaction()`` is called or the \
+            client is deleted.
+
+        :param client: The client.
+        :type client: SingStat
+
+        :param interval: Number of seconds between compactions.
+        :type interval: int
+
+        :raises ValueError: ``interval`` is less than 1.
+        """
+        if interval < 1:
+            raise ValueError(
+                'argument "cache_compaction_interval" must be 1 or greater.'
+            )
+
+        Thread(
+            target=_compact_periodically,
+            # Only keep a weak reference, so that the client can still be
+            # deleted while the thread is running.
+            args=(ref(client), interval, self.__compaction_stop),
+            name=f'{client.__class__.__name__}-compaction',
+            daemon=True,
+        ).start()
+
+    @typechecked
+    def stop_compaction(self) -> None:
+        """Stop compacting the cache on the background thread, if it was \
+            started."""
+        self.__compaction_stop.set()
+
+    @typechecked
+    def close(self) -> None:
+        """Stop the compaction, save the recorded uses of the responses, and \
+            close the databases of the cache."""
+        self.stop_compaction()
+        if self.evictor is not None:
+            self.evictor.flush()
+        if self.result_cache is not None:
+            self.result_cache.close()
+        self.backend.close()
+
+    @typechecked
+    def save_negative_response(self, response: Any) -> None:
+        """Cache a response that raised ``APIError`` for \
+            ``negative_cache_duration`` seconds, replacing the response that \
+            was cached for the request's cache duration, if any.
+
+        :param response: The response.
+        :type response: requests.Response
+        """
+        # Responses that were not cached, e.g. with HTTP 400 status, have no
+        # cache key yet.
+        cache_key = response.cache_key \
+            or self.backend.create_key(response.request)
+        expires = datetime.now(timezone.utc) \
+            + timedelta(seconds=self.negative_cache_duration)
+        self.backend.save_response(response, cache_key, expires)
+        self.record_use(cache_key, is_new=True)
+
+def _compact_periodically(
+    client_ref: ReferenceType,
+    interval: int,
+    stop: Event,
+) -> None:
+    """Compact the cache of a client every ``interval`` seconds, until \
+        ``stop`` is set or the client is deleted."""
+    while not stop.wait(interval):
+        client = client_ref()
+        if client is None:
+            return
+        _ = client.compact_cache()
+        del client
+
+__all__ = [
+    'CacheManager',
+]
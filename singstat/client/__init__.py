@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from .async_client import AsyncClient
+from .catalogue import Catalogue
 from .client import Client
 
 __all__ = [
+    'AsyncClient',
+    'Catalogue',
     'Client',
 ]
@@ -0,0 +1,778 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous client for interacting with the SingStat API endpoints.
+
+``httpx`` is optional. Install it with ``pip install singstat[async]``.
+"""
+
+import logging
+from asyncio import Task, gather, get_running_loop, shield, sleep, to_thread
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from typing import Any, Unpack
+from warnings import warn
+
+from requests import Request
+from requests import codes as requests_codes
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import RequestException
+from requests_cache import BaseCache, CachedResponse
+from requests_cache.models import CachedRequest
+from urllib3 import HTTPResponse
+
+try:
+    import httpx
+except ImportError: # pragma: no cover
+    httpx = None # type: ignore[assignment]
+
+from ..constants import (
+    CACHE_TWELVE_HOURS,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_FORCELIST,
+    RETRY_TOTAL,
+)
+from ..exceptions import APIError
+from ..sanitise import SanitisedMapping
+from ..typechecking import typechecked
+from ..types import Url
+from ..types_args import SingStatArgsDict
+
+from .client_base import ClientBase
+from .constants import (
+    ASYNC_MAX_CONNECTIONS,
+    ASYNC_SANITISE_THREAD_BYTES,
+
+    METADATA_ENDPOINT,
+    RESOURCE_ID_ENDPOINT,
+    TABLEDATA_ENDPOINT,
+
+    METADATA_SANITISE_IGNORE_KEYS,
+
+    TABLEDATA_SANITISE_IGNORE_KEYS,
+    TABLEDATA_METADATA_CHECK_INTERVAL,
+)
+from .types_args import ResourceIdArgsDict, TabledataArgsDict
+from .types import MetadataDict, ResourceIdDict, TabledataDict
+
+logger = logging.getLogger(__name__)
+
+class AsyncClient(ClientBase):
+    """Interact with SingStat's API asynchronously, so that many requests \
+        can be in flight on one event loop.
+
+    Requests are sent with ``httpx``. Arguments are validated and responses \
+        are sanitised in the same way as ``Client``. Responses are cached in \
+        the same cache as ``Client``, which is read and written on a thread \
+        so that the event loop is not blocked. Responses of 64 KiB or more \
+        are decoded and sanitised on a thread too.
+
+    Close the client with ``aclose()``, or use it as an asynchronous context \
+        manager.
+
+    :example:
+
+        async with AsyncClient() as client:
+            tabledata = await client.tabledata('M212151')
+
+    :param max_connections: Maximum number of connections that are open at \
+        the same time. Defaults to ``100``.
+    :type max_connections: int
+
+    :param kwargs: Keyword-only arguments of ``SingStat``, e.g. \
+        ``cache_results``. Refer to ``SingStat`` for them and for \
+        ``cache_backend`` and ``is_test_api``.
+    :type kwargs: SingStatArgsDict
+
+    :raises ValueError: ``max_connections`` is less than 1.
+    :raises ImportError: ``httpx`` is not installed.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        cache_backend: str | BaseCache='sqlite',
+        is_test_api: bool=False,
+        *,
+        max_connections: int=ASYNC_MAX_CONNECTIONS,
+        **kwargs: Unpack[SingStatArgsDict]
+    ) -> None:
+        """Constructor method"""
+        if httpx is None:
+            raise ImportError('"httpx" must be installed to use AsyncClient.')
+
+        if max_connections < 1:
+            raise ValueError('argument "max_connections" must be 1 or greater.')
+
+        super().__init__(cache_backend, is_test_api, **kwargs)
+
+        self.__in_flight: dict[tuple, Task] = {}
+        self.__revalidating: dict[str, Task] = {}
+
+        self.async_session = httpx.AsyncClient(
+            headers=dict(self.session.headers),
+            limits=httpx.Limits(max_connections=max_connections),
+            follow_redirects=True,
+        )
+
+    @typechecked
+    async def __aenter__(self) -> 'AsyncClient':
+        """Enter the asynchronous context manager"""
+        return self
+
+    @typechecked
+    async def __aexit__(self, *args: Any) -> None:
+        """Exit the asynchronous context manager"""
+        await self.aclose()
+
+    @typechecked
+    async def aclose(self) -> None:
+        """Close the connections of the client, after cancelling the \
+            background refreshes of stale responses, and close the cache. \
+            Refer to ``SingStat.close()``."""
+        tasks = list(self.__revalidating.values())
+        for task in tasks:
+            _ = task.cancel()
+        _ = await gather(*tasks, return_exceptions=True)
+
+        await self.async_session.aclose()
+        await to_thread(self.close)
+
+    @typechecked
+    async def metadata(
+        self,
+        resource_id: str,
+    ) -> MetadataDict | SanitisedMapping:
+        """Return the metadata of a resource.
+
+        Refer to ``Client.metadata()`` for more information.
+
+        :param resource_id: ID of the resource.
+        :type resource_id: str
+
+        :warns RuntimeWarning: "Empty data set returned" when response's \
+            ``Data.records`` list has 0 items.
+
+        :return: Metadata of the requested resource.
+        :rtype: MetadataDict or SanitisedMapping
+        """
+        metadata: MetadataDict | SanitisedMapping
+
+        metadata_endpoint = f'{METADATA_ENDPOINT}/{resource_id}'
+        metadata = await self.send_request(
+            metadata_endpoint,
+            cache_duration=CACHE_TWELVE_HOURS,
+            sanitise_ignore_keys=METADATA_SANITISE_IGNORE_KEYS,
+            sanitise_schema=MetadataDict,
+        )
+
+        records = metadata['Data']['records']
+        if len(records) == 0:
+            warn('Empty data set returned', RuntimeWarning)
+
+        return metadata
+
+    @typechecked
+    async def resource_id(
+        self,
+        **kwargs: Unpack[ResourceIdArgsDict]
+    ) -> ResourceIdDict | SanitisedMapping:
+        """Search for a list of resources.
+
+        Refer to ``Client.resource_id()`` for more information.
+
+        :param kwargs: Key-value arguments to be passed as parameters \
+            to the endpoint URL.
+        :type kwargs: ResourceIdArgsDict
+
+        :raises ValueError: ``search_option`` is not ``"all"``, ``"title"`` \
+            or ``"variable"``.
+
+        :warns RuntimeWarning: "Empty data set returned" when response's \
+            ``Data.total`` is 0.
+
+        :return: List of resources.
+        :rtype: ResourceIdDict or SanitisedMapping
+        """
+        resources: ResourceIdDict | SanitisedMapping
+
+        params = self.build_resource_id_params(**kwargs)
+
+        resources = await self.send_request(
+            RESOURCE_ID_ENDPOINT,
+            params=params,
+            cache_duration=CACHE_TWELVE_HOURS,
+            sanitise_schema=ResourceIdDict,
+        )
+
+        total = resources['Data']['total']
+        if total == 0:
+            warn('Empty data set returned', RuntimeWarning)
+
+        return resources
+
+    @typechecked
+    async def tabledata(
+        self,
+        resource_id: str,
+        check_metadata: bool=False,
+        **kwargs: Unpack[TabledataArgsDict]
+    ) -> TabledataDict | SanitisedMapping:
+        """Retrieve data in a resource.
+
+        Refer to ``Client.tabledata()`` for more information.
+
+        :param resource_id: ID of the resource.
+        :type resource_id: str
+
+        :param check_metadata: If ``True``, then check whether the cached \
+            data is current with the resource's metadata. Refer to \
+            ``Client.tabledata()``. Defaults to ``False``.
+        :type check_metadata: bool
+
+        :param kwargs: Key-value arguments to be passed as parameters \
+            to the endpoint URL.
+        :type kwargs: TabledataArgsDict
+
+        :raises ValueError: Refer to ``build_tabledata_params()``.
+
+        :warns RuntimeWarning: "Empty data set returned" when response's \
+            ``Data.row`` list has 0 items.
+
+        :return: Records of data that match the search criteria.
+        :rtype: TabledataDict or SanitisedMapping
+        """
+        tabledata: TabledataDict | SanitisedMapping
+
+        params = self.build_tabledata_params(**kwargs)
+
+        cache_duration = CACHE_TWELVE_HOURS
+        data_last_updated = None
+        if check_metadata:
+            metadata = await self.__current_metadata(resource_id)
+            records = metadata['Data']['records']
+            cache_duration = self.tabledata_cache_duration(
+                records.get('frequency'),
+            )
+            data_last_updated = records.get('dataLastUpdated')
+
+        tabledata_endpoint = f'{TABLEDATA_ENDPOINT}/{resource_id}'
+        tabledata = await self.send_request(
+            tabledata_endpoint,
+            params=params,
+            cache_duration=cache_duration,
+            sanitise_ignore_keys=TABLEDATA_SANITISE_IGNORE_KEYS,
+            sanitise_schema=TabledataDict,
+        )
+
+        if self.is_tabledata_outdated(tabledata, data_last_updated):
+            tabledata = await self.send_request(
+                tabledata_endpoint,
+                params=params,
+                cache_duration=cache_duration,
+                sanitise_ignore_keys=TABLEDATA_SANITISE_IGNORE_KEYS,
+                sanitise_schema=TabledataDict,
+                force_refresh=True,
+            )
+
+        rows = tabledata['Data']['row']
+        if len(rows) == 0:
+            warn('Empty data set returned', RuntimeWarning)
+
+        return tabledata
+
+    @typechecked
+    async def send_request( # type: ignore[override] # pylint: disable=invalid-overridden-method
+        self,
+        url: Url,
+        params: dict[str, Any] | None=None,
+        cache_duration: int=0,
+        sanitise: bool=True,
+        sanitise_ignore_keys: list[str] | None=None,
+        sanitise_schema: Any=None,
+        force_refresh: bool=False,
+    ) -> Any:
+        """Send a request to an endpoint and return its response.
+
+        Refer to ``SingStat.send_request()`` for more information.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL. \
+            Defaults to ``{}``, i.e. empty ``dict``.
+        :type params: dict[str, Any] or None
+
+        :param cache_duration: Number of seconds before the cache expires. \
+            Defaults to ``0``, i.e. do not cache.
+        :type cache_duration: int
+
+        :param sanitise: If ``True``, then the response's values are \
+            sanitised using the ``sanitise_data()`` method. Defaults to \
+            ``True``.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: List of keys to ignore in the response \
+            value during sanitising. Defaults to ``[]``, i.e. empty ``list``.
+        :type sanitise_ignore_keys: list[str] or None
+
+        :param sanitise_schema: Type definition of the response value. \
+            Defaults to ``None``, i.e. guess the types of all strings.
+        :type sanitise_schema: Any
+
+        :param force_refresh: If ``True``, then the request is sent to the \
+            endpoint even if its response is in the cache. Defaults to \
+            ``False``.
+        :type force_refresh: bool
+
+        :raises APIError: "No data records returned." when count of data is 0.
+        :raises APIError: "One or more validation errors occurred." when HTTP \
+            400 status is returned.
+        :raises requests.exceptions.HTTPError: Error occurred during the \
+            request process.
+        :raises requests.exceptions.ConnectionError: The endpoint could not \
+            be connected to, after retrying.
+        :raises requests.exceptions.JSONDecodeError: Error occurred when \
+            JSON-parsing the response.
+
+        :return: Response JSON content of the request.
+        :rtype: Any
+        """
+        data: Any
+
+        if params is None:
+            params = {}
+
+        # Add ``isTestApi`` parameter, if necessary.
+        if self.is_test_api:
+            params['isTestApi'] = 'true'
+
+        if not self.single_flight:
+            return await self.__fetch_data(
+                url,
+                params,
+                cache_duration,
+                sanitise,
+                sanitise_ignore_keys,
+                sanitise_schema,
+                force_refresh,
+            )
+
+        loop = get_running_loop()
+        flight_key = (
+            id(loop),
+            self.create_cache_key(url, params),
+            sanitise,
+            tuple(sanitise_ignore_keys or ()),
+            sanitise_schema,
+            force_refresh,
+        )
+        task = self.__in_flight.get(flight_key)
+        if task is None:
+            task = loop.create_task(self.__fetch_data(
+                url,
+                params,
+                cache_duration,
+                sanitise,
+                sanitise_ignore_keys,
+                sanitise_schema,
+                force_refresh,
+            ))
+            self.__in_flight[flight_key] = task
+            task.add_done_callback(
+                lambda task: self.__end_flight(flight_key, task),
+            )
+
+        # The request is sent in its own task, which every identical call
+        # waits for, so that cancelling one of the calls does not cancel the
+        # request for the others.
+        data = await shield(task)
+
+        return data
+
+# private
+
+    @typechecked
+    async def __current_metadata(
+        self,
+        resource_id: str,
+    ) -> MetadataDict | SanitisedMapping:
+        """Return the metadata of a resource, requesting it again if it was \
+            cached more than 5 minutes ago.
+
+        :param resource_id: ID of the resource.
+        :type resource_id: str
+
+        :return: Metadata of the resource.
+        :rtype: MetadataDict or SanitisedMapping
+        """
+        metadata_endpoint = f'{METADATA_ENDPOINT}/{resource_id}'
+
+        # ``metadata()`` caches the metadata for longer, so check its age.
+        # The metadata that is requested again is cached for as long as
+        # ``metadata()`` caches it, so that it does not expire any sooner.
+        params = {'isTestApi': 'true'} if self.is_test_api else {}
+        cached_response = await to_thread(
+            self.session.cache.get_response,
+            self.create_cache_key(metadata_endpoint, params),
+        )
+        force_refresh = cached_response is not None \
+            and cached_response.is_older_than(TABLEDATA_METADATA_CHECK_INTERVAL)
+
+        return await self.send_request(
+            metadata_endpoint,
+            cache_duration=CACHE_TWELVE_HOURS,
+            sanitise_ignore_keys=METADATA_SANITISE_IGNORE_KEYS,
+            sanitise_schema=MetadataDict,
+            force_refresh=force_refresh,
+        )
+
+    @typechecked
+    async def __fetch_data(
+        self,
+        url: Url,
+        params: dict[str, Any],
+        cache_duration: int,
+        sanitise: bool,
+        sanitise_ignore_keys: list[str] | None,
+        sanitise_schema: Any,
+        force_refresh: bool,
+    ) -> Any:
+        """Send a request to an endpoint and return its sanitised response.
+
+        Refer to ``send_request()`` for the parameters.
+
+        :return: Response JSON content of the request.
+        :rtype: Any
+        """
+        result_key = http_key = None
+        if self.result_cache is not None and not self.lazy_sanitise:
+            http_key = self.create_cache_key(url, params)
+            result_key = self.result_cache.create_key(
+                http_key,
+                sanitise,
+                sanitise_ignore_keys,
+                sanitise_schema,
+            )
+            result = None if force_refresh \
+                else await to_thread(self.result_cache.get, result_key, http_key)
+            if result is not None:
+                # The cached response is used, even though it is not read.
+                if self.cache_evictor is not None and cache_duration != 0:
+                    await to_thread(self.cache_evictor.record_use, http_key)
+                return result.value
+
+        response, is_stale, is_new = await self.__get(
+            url,
+            params,
+            cache_duration,
+            force_refresh,
+        )
+        try:
+            if len(response.content) < ASYNC_SANITISE_THREAD_BYTES:
+                data = self.__parse(
+                    response,
+                    sanitise,
+                    sanitise_ignore_keys,
+                    sanitise_schema,
+                )
+            else:
+                # Decoding and sanitising a large response would block the
+                # other coroutines on the event loop for too long.
+                data = await to_thread(
+                    self.__parse,
+                    response,
+                    sanitise,
+                    sanitise_ignore_keys,
+                    sanitise_schema,
+                )
+        except APIError:
+            if self.negative_cache_duration is not None \
+                and cache_duration != 0 and is_new:
+                await self.__save(
+                    self.session.prepare_request(
+                        Request('GET', url, params=params),
+                    ),
+                    self.create_cache_key(url, params),
+                    self.negative_cache_duration,
+                    response,
+                    is_negative=True,
+                )
+            raise
+
+        # A stale response may be replaced by the background refresh before
+        # the result is saved, which would keep the stale result as if it
+        # were fresh.
+        if result_key is not None and not is_stale:
+            _ = await to_thread(self.result_cache.save, result_key, http_key, data)
+
+        return data
+
+    @typechecked
+    def __parse(
+        self,
+        response: CachedResponse,
+        sanitise: bool,
+        sanitise_ignore_keys: list[str] | None,
+        sanitise_schema: Any,
+    ) -> Any:
+        """Decode a response and return its sanitised content.
+
+        Refer to ``send_request()`` for the parameters.
+
+        :raises APIError: Refer to ``parse_response()``.
+
+        :return: Response JSON content of the request.
+        :rtype: Any
+        """
+        response_val = self.parse_response(response)
+
+        return self.sanitise_data(
+            response_val,
+            ignore_keys=sanitise_ignore_keys,
+            schema=sanitise_schema,
+            lazy=self.lazy_sanitise,
+            # The response value was just decoded and is not used elsewhere.
+            in_place=True,
+        ) if sanitise else response_val
+
+    @typechecked
+    def __end_flight(self, flight_key: tuple, task: Task) -> None:
+        """Forget a request that is no longer in flight.
+
+        :param flight_key: Key of the request in flight.
+        :type flight_key: tuple
+
+        :param task: Task that sent the request.
+        :type task: Task
+        """
+        if self.__in_flight.get(flight_key) is task:
+            del self.__in_flight[flight_key]
+
+        # Mark the error as retrieved, in case every call that waited for it
+        # was cancelled.
+        if not task.cancelled():
+            _ = task.exception()
+
+    @typechecked
+    async def __get(
+        self,
+        url: Url,
+        params: dict,
+        cache_duration: int,
+        force_refresh: bool=False,
+    ) -> tuple[CachedResponse, bool, bool]:
+        """Return the response of an endpoint, from the cache if it is there \
+            and has not expired.
+
+        With ``stale_while_revalidate``, an expired response is returned if \
+            it expired within that time, and it is refreshed in a background \
+            task.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param force_refresh: If ``True``, then the cached response, if any, \
+            is not used. Defaults to ``False``.
+        :type force_refresh: bool
+
+        :raises requests.exceptions.ConnectionError: The endpoint could not \
+            be connected to, after retrying.
+
+        :return: The response, whether it is an expired response that is \
+            being refreshed, and whether it was just sent by the endpoint.
+        :rtype: tuple[CachedResponse, bool, bool]
+        """
+        # Prepare the request in the same way as ``Client``, so that both
+        # clients use the same cache keys.
+        request = self.session.prepare_request(
+            Request('GET', url, params=params),
+        )
+        cache = self.session.cache
+        cache_key = self.create_cache_key(url, params)
+
+        if cache_duration > 0 and not force_refresh:
+            cached_response = await to_thread(cache.get_response, cache_key)
+            if cached_response is not None and not cached_response.is_expired:
+                if self.cache_evictor is not None:
+                    await to_thread(self.cache_evictor.record_use, cache_key)
+                return cached_response, False, False
+
+            if (
+                cached_response is not None
+                and self.stale_while_revalidate is not None
+                and cached_response.expires
+                    + timedelta(seconds=self.stale_while_revalidate)
+                    > datetime.now(timezone.utc)
+            ):
+                self.__revalidate(request, cache_key, cache_duration)
+                return cached_response, True, False
+
+        response = await self.__send(request)
+        await self.__save(request, cache_key, cache_duration, response)
+
+        return response, False, True
+
+    @typechecked
+    def __revalidate(
+        self,
+        request: Any,
+        cache_key: str,
+        cache_duration: int,
+    ) -> None:
+        """Refresh a cached response in a background task, unless it is \
+            already being refreshed.
+
+        :param request: The prepared request.
+        :type request: requests.PreparedRequest
+
+        :param cache_key: Key of the response in the cache.
+        :type cache_key: str
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+        """
+        if cache_key in self.__revalidating:
+            return
+
+        async def revalidate() -> None:
+            try:
+                response = await self.__send(request)
+                await self.__save(request, cache_key, cache_duration, response)
+            except RequestException:
+                # Keep the stale response until it can be refreshed.
+                pass
+            except Exception: # pylint: disable=broad-exception-caught
+                # No call waits for the task, so its error is logged instead
+                # of raised.
+                logger.exception('Failed to refresh %s', request.url)
+            finally:
+                del self.__revalidating[cache_key]
+
+        # Keep a reference to the task, so that it is not garbage-collected
+        # before it is done.
+        self.__revalidating[cache_key] = get_running_loop().create_task(
+            revalidate(),
+        )
+
+    @typechecked
+    async def __save(
+        self,
+        request: Any,
+        cache_key: str,
+        cache_duration: int,
+        response: CachedResponse,
+        is_negative: bool=False,
+    ) -> None:
+        """Save a response in the cache, if it is to be cached and has no \
+            errors, or if it is a response that raised ``APIError``.
+
+        :param request: The prepared request.
+        :type request: requests.PreparedRequest
+
+        :param cache_key: Key of the response in the cache.
+        :type cache_key: str
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param response: The response.
+        :type response: CachedResponse
+
+        :param is_negative: Whether the response raised ``APIError``, so that \
+            it is saved whatever its status. Defaults to ``False``.
+        :type is_negative: bool
+        """
+        if (
+            cache_duration > 0
+            and (is_negative or response.status_code == requests_codes['ok'])
+        ):
+            response.expires = datetime.now(timezone.utc) \
+                + timedelta(seconds=cache_duration)
+            response.request = CachedRequest.from_request(request)
+            await to_thread(
+                self.session.cache.save_response,
+                response,
+                cache_key,
+                response.expires,
+            )
+            if self.cache_evictor is not None:
+                await to_thread(
+                    self.cache_evictor.record_use,
+                    cache_key,
+                    True,
+                )
+
+    @typechecked
+    async def __send(self, request: Any) -> CachedResponse:
+        """Send a request, retrying with exponential backoff when it cannot \
+            connect or when the server errs, like ``Client`` does.
+
+        :param request: The prepared request.
+        :type request: requests.PreparedRequest
+
+        :raises requests.exceptions.ConnectionError: The endpoint could not \
+            be connected to, after retrying.
+
+        :return: The response.
+        :rtype: CachedResponse
+        """
+        for retry in range(RETRY_TOTAL + 1):
+            if retry > 0:
+                await sleep(RETRY_BACKOFF_FACTOR * (2 ** (retry - 1)))
+
+            try:
+                response = await self.async_session.get(request.url)
+            except httpx.TransportError as e:
+                if retry == RETRY_TOTAL:
+                    raise RequestsConnectionError(str(e)) from e
+                continue
+
+            if (
+                response.status_code not in RETRY_STATUS_FORCELIST
+                or retry == RETRY_TOTAL
+            ):
+                break
+
+        # Keep the response as a ``requests`` response, so that it can be
+        # parsed by ``parse_response()`` and saved to the cache. ``httpx``
+        # has already decoded the content, so its encoding and length
+        # headers no longer apply.
+        raw = HTTPResponse(
+            body=BytesIO(response.content),
+            headers={
+                key: value for key, value in response.headers.items()
+                if key.lower() not in ('content-encoding', 'content-length')
+            },
+            status=response.status_code,
+            reason=response.reason_phrase,
+            preload_content=False,
+            decode_content=False,
+            request_url=str(response.url),
+        )
+        adapter = self.session.get_adapter(request.url)
+
+        return CachedResponse.from_response(
+            adapter.build_response(request, raw),
+        )
+
+__all__ = [
+    'AsyncClient',
+]
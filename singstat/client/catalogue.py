@@ -0,0 +1,288 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Offline full-text index of the catalogue of resources."""
+
+import re
+import sqlite3
+from collections.abc import Mapping
+from datetime import date
+from os import PathLike
+from threading import Lock
+from typing import Any
+
+from ..typechecking import typechecked
+
+from .constants import CATALOGUE_SEARCH_LIMIT, CATALOGUE_SEARCH_OPTIONS
+
+# Indexed columns, and the weights of their matches when ranking.
+_SEARCH_COLUMNS = {
+    'title': 10.0,
+    'theme': 2.0,
+    'subject': 2.0,
+    'topic': 2.0,
+    'variables': 1.0,
+}
+_SEARCH_OPTION_COLUMNS = {
+    'all': tuple(_SEARCH_COLUMNS),
+    'title': ('title',),
+    'variable': ('variables',),
+    'theme': ('theme',),
+    'subject': ('subject',),
+    'topic': ('topic',),
+}
+# Columns that are kept but not indexed, and their keys in the records.
+_RECORD_COLUMNS = {
+    'frequency': 'frequency',
+    'table_type': 'tableType',
+    'data_last_updated': 'dataLastUpdated',
+}
+
+class Catalogue:
+    """Offline full-text index of resources, which is searched in \
+        milliseconds without requesting ``resource_id()``.
+
+    The index is a SQLite FTS5 table. Build it from the response of \
+        ``resource_id()`` with ``add_resources()``, and optionally from the \
+        responses of ``metadata()`` with ``add_variables()``, or with \
+        ``Client.build_catalogue()``.
+
+    :example:
+
+        catalogue = client.build_catalogue('catalogue.sqlite')
+        resources = catalogue.search('household income')
+
+    :param path: Path of the SQLite database of the index. Defaults to \
+        ``":memory:"``, i.e. keep the index in memory.
+    :type path: str or PathLike
+
+    :raises sqlite3.OperationalError: SQLite was built without FTS5.
+    """
+
+    @typechecked
+    def __init__(self, path: str | PathLike=':memory:') -> None:
+        """Constructor method"""
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.__lock = Lock()
+
+        columns = ', '.join(
+            ['id UNINDEXED']
+            + list(_SEARCH_COLUMNS)
+            + [f'{column} UNINDEXED' for column in _RECORD_COLUMNS]
+        )
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'CREATE VIRTUAL TABLE IF NOT EXISTS resources '
+                f'USING fts5({columns})'
+            )
+
+    @typechecked
+    def __len__(self) -> int:
+        """Number of resources in the index"""
+        with self.__lock:
+            return self.__connection.execute(
+                'SELECT COUNT(*) FROM resources'
+            ).fetchone()[0]
+
+    @typechecked
+    def add_resources(self, resources: Mapping[str, Any]) -> int:
+        """Add resources to the index, replacing those with the same IDs.
+
+        :param resources: Resources, as returned by ``resource_id()``.
+        :type resources: ResourceIdDict or Mapping[str, Any]
+
+        :return: Number of resources that were added.
+        :rtype: int
+        """
+        rows = []
+        for record in resources['Data']['records']:
+            data_last_updated = record.get('dataLastUpdated')
+            rows.append((
+                record['id'],
+                record.get('title', ''),
+                record.get('theme', ''),
+                record.get('subject', ''),
+                record.get('topic', ''),
+                '',
+                record.get('frequency'),
+                record.get('tableType'),
+                data_last_updated.isoformat() \
+                    if isinstance(data_last_updated, date) \
+                    else data_last_updated,
+            ))
+
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                'DELETE FROM resources WHERE id = ?',
+                [(row[0],) for row in rows],
+            )
+            self.__connection.executemany(
+                f'INSERT INTO resources VALUES ({", ".join("?" * 9)})',
+                rows,
+            )
+
+        return len(rows)
+
+    @typechecked
+    def add_variables(
+        self,
+        resource_id: str,
+        metadata: Mapping[str, Any],
+    ) -> bool:
+        """Add the variables of a resource to the index, i.e. the texts of \
+            its rows and columns, so that they can be searched with \
+            ``search_option="variable"``.
+
+        :param resource_id: ID of the resource, which must have been added \
+            with ``add_resources()``.
+        :type resource_id: str
+
+        :param metadata: Metadata of the resource, as returned by \
+            ``metadata()``.
+        :type metadata: MetadataDict or Mapping[str, Any]
+
+        :return: ``True`` if the resource is in the index.
+        :rtype: bool
+        """
+        records = metadata['Data']['records']
+
+        texts = [row.get('rowText', '') for row in records.get('row', [])]
+        for i in range(1, 11):
+            texts.extend(
+                column.get('columnText', '')
+                for column in records.get(f'column{i}', [])
+            )
+
+        with self.__lock, self.__connection:
+            cursor = self.__connection.execute(
+                'UPDATE resources SET variables = ? WHERE id = ?',
+                ('\n'.join(text for text in texts if text), resource_id),
+            )
+
+        return cursor.rowcount > 0
+
+    @typechecked
+    def search(
+        self,
+        keyword: str,
+        search_option: str='all',
+        limit: int=CATALOGUE_SEARCH_LIMIT,
+    ) -> list[dict[str, Any]]:
+        """Search for resources, ranking the best matches first.
+
+        Resources match when all of the words in ``keyword`` are in them, \
+            including words that start with them, e.g. ``"house"`` matches \
+            "households". Matches in titles rank above matches in themes, \
+            subjects and topics, which rank above matches in variables.
+
+        :param keyword: Keyword to search resources by. If it has no words, \
+            e.g. ``"%"``, then all of the resources are returned, in the \
+            order of their titles.
+        :type keyword: str
+
+        :param search_option: Where to search the keyword in, i.e. \
+            ``"all"``, ``"title"``, ``"variable"``, ``"theme"``, \
+            ``"subject"`` or ``"topic"``. Defaults to ``"all"``.
+        :type search_option: str
+
+        :param limit: Maximum number of resources to return. Defaults to \
+            ``20``.
+        :type limit: int
+
+        :raises ValueError: ``search_option`` is not one of the options.
+        :raises ValueError: ``limit`` is less than 1.
+
+        :return: The resources, in the same format as the records of \
+            ``resource_id()``.
+        :rtype: list[dict[str, Any]]
+        """
+        if search_option not in CATALOGUE_SEARCH_OPTIONS:
+            search_options = f'"{('", "').join(CATALOGUE_SEARCH_OPTIONS)}"'
+            raise ValueError(
+                f'Argument "search_option" must be one of {search_options}.'
+            )
+        if limit < 1:
+            raise ValueError('argument "limit" must be 1 or greater.')
+
+        record_columns = ', '.join(
+            ['id', 'title', 'theme', 'subject', 'topic']
+            + list(_RECORD_COLUMNS)
+        )
+
+        words = re.findall(r'\w+', keyword)
+        if not words:
+            statement = f'SELECT {record_columns} FROM resources ' \
+                'ORDER BY title LIMIT ?'
+            params: tuple = (limit,)
+        else:
+            columns = ' '.join(_SEARCH_OPTION_COLUMNS[search_option])
+            words_query = ' '.join(f'"{word}"*' for word in words)
+            weights = ', '.join(
+                str(weight) for weight in _SEARCH_COLUMNS.values()
+            )
+            statement = f'SELECT {record_columns} FROM resources ' \
+                'WHERE resources MATCH ? ' \
+                f'ORDER BY bm25(resources, 0, {weights}) LIMIT ?'
+            params = (f'{{{columns}}} : ({words_query})', limit)
+
+        with self.__lock:
+            rows = self.__connection.execute(statement, params).fetchall()
+
+        return [self.__to_record(row) for row in rows]
+
+    @typechecked
+    def clear(self) -> None:
+        """Delete all of the resources from the index."""
+        with self.__lock, self.__connection:
+            self.__connection.execute('DELETE FROM resources')
+
+    @typechecked
+    def close(self) -> None:
+        """Close the database of the index."""
+        with self.__lock:
+            self.__connection.close()
+
+# private
+
+    @typechecked
+    def __to_record(self, row: tuple) -> dict[str, Any]:
+        """Convert a row of the index to a record like those of \
+            ``resource_id()``.
+
+        :param row: The row.
+        :type row: tuple
+
+        :return: The record, without the values that are not known.
+        :rtype: dict[str, Any]
+        """
+        keys = ['id', 'title', 'theme', 'subject', 'topic'] \
+            + list(_RECORD_COLUMNS.values())
+        record = {
+            key: value for key, value in zip(keys, row)
+            if value not in (None, '')
+        }
+
+        if 'dataLastUpdated' in record:
+            try:
+                record['dataLastUpdated'] = date.fromisoformat(
+                    record['dataLastUpdated'],
+                )
+            except ValueError:
+                pass
+
+        return record
+
+__all__ = [
+    'Catalogue',
+]
@@ -14,42 +14,59 @@
 
 """Client for interacting with the SingStat API endpoints."""
 
-import re
-from typing import Unpack
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+)
+from os import PathLike
+from typing import Any, Unpack
 from warnings import warn
 
-from typeguard import typechecked
+from requests.exceptions import RequestException
 
 from ..constants import CACHE_TWELVE_HOURS
-from ..singstat import SingStat
+from ..exceptions import APIError
+from ..sanitise import SanitisedMapping
+from ..typechecking import typechecked
 
+from .catalogue import Catalogue
+from .client_base import ClientBase
 from .constants import (
+    MAX_WORKERS,
+
     METADATA_ENDPOINT,
     RESOURCE_ID_ENDPOINT,
     TABLEDATA_ENDPOINT,
 
-    RESOURCE_ID_ARGS_KEY_MAP,
-    RESOURCE_ID_DEFAULT_ARGS,
-    RESOURCE_ID_SEARCH_OPTIONS,
-
     METADATA_SANITISE_IGNORE_KEYS,
-
-    TABLEDATA_ARGS_KEY_MAP,
     TABLEDATA_SANITISE_IGNORE_KEYS,
-    TABLEDATA_SORT_BY_REGEXP,
+    TABLEDATA_LIMIT_MAX,
+    TABLEDATA_METADATA_CHECK_INTERVAL,
 )
+from .local_query import query_tabledata
+from .periods import latest_period, parse_period, periods_after
 from .types_args import ResourceIdArgsDict, TabledataArgsDict
 from .types import MetadataDict, ResourceIdDict, TabledataDict
 
-class Client(SingStat):
+class Client(ClientBase):
     """Interact with SingStat's API to access its catalogue of datasets.
 
     References: \
         https://tablebuilder.singstat.gov.sg/view-api/for-developers
+
+    If the client is instantiated with ``lazy_sanitise=True``, then responses \
+        are returned as ``SanitisedMapping`` views instead of ``dict``, \
+        which are read in the same way.
     """
 
     @typechecked
-    def metadata(self, resource_id: str) -> MetadataDict:
+    def metadata(
+        self,
+        resource_id: str,
+    ) -> MetadataDict | SanitisedMapping:
         """Return the metadata of a resource.
 
         :param resource_id: ID of the resource.
@@ -59,15 +76,16 @@ class Client(SingStat):
             ``Data.records`` list has 0 items.
 
         :return: Metadata of the requested resource.
-        :rtype: MetadataDict
+        :rtype: MetadataDict or SanitisedMapping
         """
-        metadata: MetadataDict
+        metadata: MetadataDict | SanitisedMapping
 
         metadata_endpoint = f'{METADATA_ENDPOINT}/{resource_id}'
         metadata = self.send_request(
             metadata_endpoint,
             cache_duration=CACHE_TWELVE_HOURS,
             sanitise_ignore_keys=METADATA_SANITISE_IGNORE_KEYS,
+            sanitise_schema=MetadataDict,
         )
 
         records = metadata['Data']['records']
@@ -80,7 +98,7 @@ class Client(SingStat):
     def resource_id(
         self,
         **kwargs: Unpack[ResourceIdArgsDict]
-    ) -> ResourceIdDict:
+    ) -> ResourceIdDict | SanitisedMapping:
         """Search for a list of resources.
 
         :param kwargs: Key-value arguments to be passed as parameters \
@@ -94,31 +112,17 @@ class Client(SingStat):
             ``Data.total`` is 0.
 
         :return: List of resources.
-        :rtype: ResourceIdDict
+        :rtype: ResourceIdDict or SanitisedMapping
         """
-        resources: ResourceIdDict
-
-        # Validate inputs
-        if (
-            'search_option' in kwargs
-            and kwargs['search_option'] not in RESOURCE_ID_SEARCH_OPTIONS
-        ):
-            search_options = f'"{('", "').join(RESOURCE_ID_SEARCH_OPTIONS)}"'
-            raise ValueError(
-                f'Argument "search_option" must be one of {search_options}.'
-            )
+        resources: ResourceIdDict | SanitisedMapping
 
-        params = self.build_params(
-            params_expected_type=ResourceIdArgsDict,
-            original_params=kwargs,
-            default_params=RESOURCE_ID_DEFAULT_ARGS,
-            key_map=RESOURCE_ID_ARGS_KEY_MAP,
-        )
+        params = self.build_resource_id_params(**kwargs)
 
         resources = self.send_request(
             RESOURCE_ID_ENDPOINT,
             params=params,
             cache_duration=CACHE_TWELVE_HOURS,
+            sanitise_schema=ResourceIdDict,
         )
 
         total = resources['Data']['total']
@@ -131,17 +135,54 @@ class Client(SingStat):
     def tabledata(
         self,
         resource_id: str,
+        check_metadata: bool=False,
+        use_cached_table: bool=False,
         **kwargs: Unpack[TabledataArgsDict]
-    ) -> TabledataDict:
+    ) -> TabledataDict | SanitisedMapping:
         """Retrieve data in a resource.
 
+        With ``check_metadata=True``, the cached data is kept according to \
+            the resource's metadata instead of for 12 hours:
+
+        - The metadata is requested again if it was cached more than 5 \
+            minutes ago.
+        - The data is cached for a duration that depends on the metadata's \
+            ``frequency``, e.g. 1 day for monthly data.
+        - If the cached data's ``dataLastUpdated`` is before the metadata's, \
+            then the data is requested again.
+
+        So data that has not been updated is not downloaded again, and data \
+            that has been updated is downloaded within 5 minutes of its \
+            metadata being updated.
+
+        With ``use_cached_table=True``, if all of the resource's data is \
+            cached, i.e. from an earlier call without arguments, then \
+            ``limit``, ``offset``, ``series_no_or_row_no``, ``search``, \
+            ``time_filter``, ``between`` and ``sort_by`` are applied to the \
+            cached data instead of requesting the endpoint. The request is \
+            sent as usual if the data is not cached, has expired, has nested \
+            columns, e.g. a cube table, or is sorted by ``key`` or ``value``. \
+            As with the endpoint, ``APIError`` is raised if no rows match.
+
         :param resource_id: ID of the resource.
         :type resource_id: str
 
+        :param check_metadata: If ``True``, then check whether the cached \
+            data is current with the resource's metadata, as above. Defaults \
+            to ``False``.
+        :type check_metadata: bool
+
+        :param use_cached_table: If ``True``, then answer the request from \
+            all of the resource's data if it is cached, as above. Defaults \
+            to ``False``.
+        :type use_cached_table: bool
+
         :param kwargs: Key-value arguments to be passed as parameters \
             to the endpoint URL.
         :type kwargs: TabledataArgsDict
 
+        :raises APIError: "No data records returned." when no rows match \
+            the arguments.
         :raises APIError: ``between`` tuple has at least one value that is \
             less than 0.
         :raises APIError: ``between`` tuple's first value is greater than its \
@@ -155,71 +196,688 @@ class Client(SingStat):
             ``Data.row`` list has 0 items.
 
         :return: Records of data that match the search criteria.
-        :rtype: TabledataDict
+        :rtype: TabledataDict or SanitisedMapping
         """
-        tabledata: TabledataDict
+        tabledata: TabledataDict | SanitisedMapping
 
-        # Validate inputs
-        if 'between' in kwargs and isinstance(kwargs['between'], tuple):
-            if any(val < 0 for val in kwargs['between']):
-                raise ValueError(
-                    'values in argument "between" must be 0 or greater.'
+        params = self.build_tabledata_params(**kwargs)
+
+        cache_duration = CACHE_TWELVE_HOURS
+        data_last_updated = None
+        if check_metadata:
+            records = self.__current_metadata(resource_id)['Data']['records']
+            cache_duration = self.tabledata_cache_duration(
+                records.get('frequency'),
+            )
+            data_last_updated = records.get('dataLastUpdated')
+
+        tabledata_endpoint = f'{TABLEDATA_ENDPOINT}/{resource_id}'
+
+        local_tabledata = None
+        if use_cached_table:
+            local_tabledata = self.__query_cached_table(
+                tabledata_endpoint,
+                params,
+                data_last_updated,
+            )
+
+        if local_tabledata is not None:
+            tabledata = local_tabledata
+        else:
+            tabledata = self.send_request(
+                tabledata_endpoint,
+                params=params,
+                cache_duration=cache_duration,
+                sanitise_ignore_keys=TABLEDATA_SANITISE_IGNORE_KEYS,
+                sanitise_schema=TabledataDict,
+            )
+
+            if self.is_tabledata_outdated(tabledata, data_last_updated):
+                tabledata = self.send_request(
+                    tabledata_endpoint,
+                    params=params,
+                    cache_duration=cache_duration,
+                    sanitise_ignore_keys=TABLEDATA_SANITISE_IGNORE_KEYS,
+                    sanitise_schema=TabledataDict,
+                    force_refresh=True,
+                )
+
+        rows = tabledata['Data']['row']
+        if len(rows) == 0:
+            warn('Empty data set returned', RuntimeWarning)
+
+        return tabledata
+
+    @typechecked
+    def iter_tabledata(
+        self,
+        resource_id: str,
+        by_page: bool=False,
+        **kwargs: Unpack[TabledataArgsDict]
+    ) -> Iterator[Any]:
+        """Iterate over all of the data in a resource, one page at a time.
+
+        Pages are requested with ``tabledata()`` as the iterator advances, \
+            starting from ``offset`` and with ``limit`` rows per page, until \
+            the total number of rows in the response's ``Data.total`` or \
+            ``DataCount`` has been reached. Only one page is held at a time.
+
+        :param resource_id: ID of the resource.
+        :type resource_id: str
+
+        :param by_page: If ``True``, then each page is yielded as it is \
+            returned by ``tabledata()``. If ``False``, then each row in the \
+            pages' ``Data.row`` is yielded. Defaults to ``False``.
+        :type by_page: bool
+
+        :param kwargs: Key-value arguments to be passed to ``tabledata()``. \
+            ``limit`` defaults to ``3000``, i.e. the most rows per page.
+        :type kwargs: TabledataArgsDict
+
+        :raises ValueError: ``limit`` is 0.
+
+        :return: Iterator of rows, or of pages if ``by_page`` is ``True``.
+        :rtype: Iterator[Any]
+        """
+        offset = kwargs.pop('offset', 0)
+        limit = kwargs.pop('limit', TABLEDATA_LIMIT_MAX)
+        if limit == 0:
+            raise ValueError('argument "limit" must be greater than 0.')
+
+        total = None
+        while total is None or offset < total:
+            page = self.tabledata(
+                resource_id,
+                offset=offset,
+                limit=limit,
+                **kwargs,
+            )
+            if total is None:
+                total = self.__tabledata_total(page)
+
+            rows = page['Data'].get('row', [])
+            num_rows = len(rows)
+            if by_page:
+                yield page
+            else:
+                yield from rows
+            del page, rows
+
+            # A short page is the last page, whatever the total says.
+            if num_rows < limit:
+                break
+            offset += num_rows
+
+    @typechecked
+    def tabledata_all(
+        self,
+        resource_id: str,
+        max_workers: int=MAX_WORKERS,
+        **kwargs: Unpack[TabledataArgsDict]
+    ) -> TabledataDict | dict[str, Any]:
+        """Retrieve all of the data in a resource, requesting its pages \
+            concurrently.
+
+        The first page is requested to find the total number of rows in the \
+            response's ``Data.total`` or ``DataCount``. Then the remaining \
+            pages are requested with ``tabledata()`` on the client's pool of \
+            threads, i.e. with ``map_concurrently()``. Each thread has its own \
+            session, with the same retries and cache.
+
+        :param resource_id: ID of the resource.
+        :type resource_id: str
+
+        :param max_workers: Maximum number of pages to request at the same \
+            time. Defaults to ``4``.
+        :type max_workers: int
+
+        :param kwargs: Key-value arguments to be passed to ``tabledata()``. \
+            ``limit`` is the number of rows per page and defaults to \
+            ``3000``, i.e. the most rows per page.
+        :type kwargs: TabledataArgsDict
+
+        :raises ValueError: ``max_workers`` is less than 1.
+        :raises ValueError: ``limit`` is 0.
+
+        :return: The first page, with the rows of all pages in ``Data.row``, \
+            in order. If the client had been instantiated with \
+            ``lazy_sanitise=True``, then the rows are read-only views.
+        :rtype: TabledataDict or dict[str, Any]
+        """
+        if max_workers < 1:
+            raise ValueError('argument "max_workers" must be 1 or greater.')
+
+        offset = kwargs.pop('offset', 0)
+        limit = kwargs.pop('limit', TABLEDATA_LIMIT_MAX)
+        if limit == 0:
+            raise ValueError('argument "limit" must be greater than 0.')
+
+        first_page = self.tabledata(
+            resource_id,
+            offset=offset,
+            limit=limit,
+            **kwargs,
+        )
+        # Copy the page, in case it is a read-only view.
+        tabledata = dict(first_page)
+        tabledata['Data'] = dict(first_page['Data'])
+        rows = list(tabledata['Data'].get('row', []))
+
+        if len(rows) == limit:
+            total = self.__tabledata_total(first_page)
+            offsets = range(offset + limit, total, limit)
+
+            def fetch_rows(page_offset: int) -> list:
+                page = self.tabledata(
+                    resource_id,
+                    offset=page_offset,
+                    limit=limit,
+                    **kwargs,
                 )
-            if kwargs['between'][0] > kwargs['between'][1]:
+                return list(page['Data'].get('row', []))
+
+            # ``map_concurrently()`` returns the pages in the order of their
+            # offsets.
+            for page_rows in self.map_concurrently(
+                fetch_rows,
+                offsets,
+                max_workers,
+            ):
+                rows.extend(page_rows)
+
+        tabledata['Data']['limit'] = len(rows)
+        tabledata['Data']['row'] = rows
+
+        return tabledata
+
+    @typechecked
+    def sync_tabledata(
+        self,
+        resource_id: str,
+        store: MutableMapping[str, Any],
+        max_workers: int=MAX_WORKERS,
+        **kwargs: Unpack[TabledataArgsDict]
+    ) -> TabledataDict | dict[str, Any]:
+        """Update a local copy of the data in a time series resource, \
+            requesting only the periods that are not in the copy.
+
+        The latest period in the copy is compared with the ``endPeriod`` of \
+            the resource's metadata, which is requested again if it was \
+            cached more than 5 minutes ago. The periods after the copy's \
+            latest period are requested with ``tabledata_all()`` and \
+            ``time_filter``, and their columns are merged into the copy's \
+            rows, which are matched by ``seriesNo``, or ``rowNo``.
+
+        All of the data is requested with ``tabledata_all()`` instead when \
+            there is no copy yet, or when the periods of the copy or of the \
+            metadata are not annual, half-yearly, quarterly or monthly \
+            periods.
+
+        :example:
+
+            with shelve.open('tables') as store:
+                tabledata = client.sync_tabledata('M212151', store)
+
+        :param resource_id: ID of the resource.
+        :type resource_id: str
+
+        :param store: Where the copies are kept, keyed by resource ID, e.g. a \
+            ``dict`` or a ``shelve.Shelf``. The updated copy is saved in it.
+        :type store: MutableMapping[str, Any]
+
+        :param max_workers: Maximum number of pages to request at the same \
+            time. Defaults to ``4``.
+        :type max_workers: int
+
+        :param kwargs: Key-value arguments to be passed to \
+            ``tabledata_all()``. Use the same arguments every time that a \
+            resource is synced.
+        :type kwargs: TabledataArgsDict
+
+        :raises ValueError: ``time_filter`` or ``offset`` is set.
+
+        :return: The updated copy of the data.
+        :rtype: TabledataDict or dict[str, Any]
+        """
+        for key in ('time_filter', 'offset'):
+            if key in kwargs:
                 raise ValueError(
-                    'first value in argument "between" must be smaller than second value.'
+                    f'argument "{key}" cannot be used when syncing data.'
                 )
 
-        if (
-            'limit' in kwargs
-            and (kwargs['limit'] < 0 or kwargs['limit'] > 3000)
-        ):
-            raise ValueError('argument "limit" must be between 0 and 3000.')
+        tabledata = store.get(resource_id)
+        rows = tabledata['Data'].get('row', []) if tabledata else []
 
-        if 'offset' in kwargs and kwargs['offset'] < 0:
-            raise ValueError('argument "offset" must be 0 or greater.')
+        start = latest_period(
+            column['key'] for row in rows for column in row['columns']
+        )
+        records = self.__current_metadata(resource_id)['Data']['records']
+        end = parse_period(records.get('endPeriod', ''))
 
-        if (
-            'sort_by' in kwargs and re.fullmatch(
-                TABLEDATA_SORT_BY_REGEXP,
-                kwargs['sort_by'],
-            ) is None
-        ):
-            raise ValueError('argument "sort_by" has invalid sort criteria.')
+        missing_periods = periods_after(start, end) \
+            if start is not None and end is not None else None
 
-        params = self.build_params(
-            params_expected_type=TabledataArgsDict,
-            original_params=kwargs,
-            key_map=TABLEDATA_ARGS_KEY_MAP,
+        if missing_periods is None:
+            tabledata = self.__copy_tabledata(
+                self.tabledata_all(resource_id, max_workers, **kwargs),
+            )
+        elif len(missing_periods) > 0:
+            new_tabledata = self.tabledata_all(
+                resource_id,
+                max_workers,
+                time_filter=','.join(missing_periods),
+                **kwargs,
+            )
+            tabledata = self.__merge_tabledata(
+                tabledata,
+                self.__copy_tabledata(new_tabledata),
+            )
+        else:
+            return tabledata
+
+        store[resource_id] = tabledata
+
+        return tabledata
+
+    @typechecked
+    def metadata_many(
+        self,
+        resource_ids: Iterable[str],
+        max_workers: int=MAX_WORKERS,
+    ) -> dict[str, Any]:
+        """Return the metadata of several resources, requesting them \
+            concurrently.
+
+        :param resource_ids: IDs of the resources. Repeated IDs are only \
+            requested once.
+        :type resource_ids: Iterable[str]
+
+        :param max_workers: Maximum number of resources to request at the \
+            same time. Defaults to ``4``.
+        :type max_workers: int
+
+        :raises TypeError: ``resource_ids`` is a string.
+        :raises ValueError: ``max_workers`` is less than 1.
+
+        :return: Metadata of each resource, keyed by the resource's ID, in \
+            the order of ``resource_ids``. If a resource's request failed, \
+            then its value is the ``APIError`` or \
+            ``requests.exceptions.RequestException`` that was raised, \
+            instead of its metadata.
+        :rtype: dict[str, Any]
+        """
+        return self.__call_many(self.metadata, resource_ids, max_workers)
+
+    @typechecked
+    def tabledata_many(
+        self,
+        resource_ids: Iterable[str],
+        max_workers: int=MAX_WORKERS,
+        **kwargs: Unpack[TabledataArgsDict]
+    ) -> dict[str, Any]:
+        """Retrieve data in several resources, requesting them \
+            concurrently.
+
+        :param resource_ids: IDs of the resources. Repeated IDs are only \
+            requested once.
+        :type resource_ids: Iterable[str]
+
+        :param max_workers: Maximum number of resources to request at the \
+            same time. Defaults to ``4``.
+        :type max_workers: int
+
+        :param kwargs: Key-value arguments to be passed to ``tabledata()`` \
+            for every resource.
+        :type kwargs: TabledataArgsDict
+
+        :raises TypeError: ``resource_ids`` is a string.
+        :raises ValueError: ``max_workers`` is less than 1.
+        :raises ValueError: Refer to ``build_tabledata_params()``.
+
+        :return: Records of data of each resource, keyed by the resource's \
+            ID, in the order of ``resource_ids``. If a resource's request \
+            failed, then its value is the ``APIError`` or \
+            ``requests.exceptions.RequestException`` that was raised, \
+            instead of its data.
+        :rtype: dict[str, Any]
+        """
+        # Validate the arguments once, before sending any request.
+        _ = self.build_tabledata_params(**kwargs)
+
+        return self.__call_many(
+            self.tabledata,
+            resource_ids,
+            max_workers,
+            **kwargs,
         )
 
-        # Convert parameters to have the values that the endpoint expects
-        if 'between' in params and isinstance(params['between'], tuple):
-            params['between'] = ','.join(str(b) for b in params['between'])
+    @typechecked
+    def build_catalogue(
+        self,
+        path: str | PathLike=':memory:',
+        with_variables: bool=False,
+        max_workers: int=MAX_WORKERS,
+    ) -> Catalogue:
+        """Build an offline full-text index of all of the resources, from a \
+            snapshot of ``resource_id()``.
+
+        Any index that is already at ``path`` is rebuilt.
+
+        :param path: Path of the SQLite database of the index. Defaults to \
+            ``":memory:"``, i.e. keep the index in memory.
+        :type path: str or PathLike
+
+        :param with_variables: If ``True``, then the metadata of every \
+            resource is requested with ``metadata_many()``, so that the \
+            variables of the resources can be searched too. This sends one \
+            request per resource. Defaults to ``False``.
+        :type with_variables: bool
+
+        :param max_workers: Maximum number of metadata to request at the \
+            same time. Defaults to ``4``.
+        :type max_workers: int
+
+        :return: The index.
+        :rtype: Catalogue
+        """
+        resources = self.resource_id()
+
+        catalogue = Catalogue(path)
+        catalogue.clear()
+        _ = catalogue.add_resources(resources)
+
+        if with_variables:
+            resource_ids = [
+                record['id'] for record in resources['Data']['records']
+            ]
+            results = self.metadata_many(resource_ids, max_workers)
+            for resource_id, metadata in results.items():
+                # Resources whose metadata could not be retrieved can still
+                # be found by their other fields.
+                if not isinstance(metadata, Exception):
+                    _ = catalogue.add_variables(resource_id, metadata)
 
+        return catalogue
+
+# private
+
+    @typechecked
+    def __copy_tabledata(self, tabledata: Mapping[str, Any]) -> dict[str, Any]:
+        """Return a copy of a resource's data, whose rows are ``dict``, so \
+            that it can be changed and saved.
+
+        :param tabledata: Data of the resource.
+        :type tabledata: Mapping[str, Any]
+
+        :return: The copy.
+        :rtype: dict[str, Any]
+        """
+        tabledata = dict(tabledata)
+        tabledata['Data'] = dict(tabledata['Data'])
+        tabledata['Data']['row'] = [
+            row.to_dict() if isinstance(row, SanitisedMapping) else dict(row)
+            for row in tabledata['Data'].get('row', [])
+        ]
+        return tabledata
+
+    @typechecked
+    def __merge_tabledata(
+        self,
+        tabledata: dict[str, Any],
+        new_tabledata: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Merge the columns of new data into the rows of a resource's data.
+
+        :param tabledata: Data of the resource.
+        :type tabledata: dict[str, Any]
+
+        :param new_tabledata: New data of the resource.
+        :type new_tabledata: dict[str, Any]
+
+        :return: The merged data, with the other values of ``new_tabledata``, \
+            e.g. ``dataLastUpdated``.
+        :rtype: dict[str, Any]
+        """
+        def row_key(row: Mapping[str, Any]) -> Any:
+            return row.get('seriesNo', row.get('rowNo'))
+
+        rows = {row_key(row): dict(row) for row in tabledata['Data']['row']}
+        for new_row in new_tabledata['Data']['row']:
+            key = row_key(new_row)
+            if key not in rows:
+                rows[key] = new_row
+                continue
+
+            row = rows[key]
+            columns = list(row['columns'])
+            keys = {column['key'] for column in columns}
+            columns.extend(
+                column for column in new_row['columns']
+                if column['key'] not in keys
+            )
+
+            # Keep the columns in the same order of periods as before.
+            periods = [parse_period(column['key']) for column in columns]
+            if None not in periods:
+                is_descending = len(keys) > 1 \
+                    and periods[0] > periods[len(keys) - 1]
+                columns = [
+                    column for _, column in sorted(
+                        zip(periods, columns),
+                        key=lambda item: item[0],
+                        reverse=is_descending,
+                    )
+                ]
+
+            row['columns'] = columns
+
+        merged = new_tabledata | {'Data': dict(new_tabledata['Data'])}
+        merged['Data']['row'] = list(rows.values())
+        merged['Data']['limit'] = len(rows)
+        # The time filter of the new data only applies to the new periods.
+        merged['Data']['timeFilter'] = tabledata['Data'].get('timeFilter')
+
+        return merged
+
+    @typechecked
+    def __current_metadata(
+        self,
+        resource_id: str,
+    ) -> MetadataDict | SanitisedMapping:
+        """Return the metadata of a resource, requesting it again if it was \
+            cached more than 5 minutes ago.
+
+        :param resource_id: ID of the resource.
+        :type resource_id: str
+
+        :return: Metadata of the resource.
+        :rtype: MetadataDict or SanitisedMapping
+        """
+        metadata_endpoint = f'{METADATA_ENDPOINT}/{resource_id}'
+
+        # ``metadata()`` caches the metadata for longer, so check its age.
+        # The metadata that is requested again is cached for as long as
+        # ``metadata()`` caches it, so that it does not expire any sooner.
+        params = {'isTestApi': 'true'} if self.is_test_api else {}
+        cached_response = self.session.cache.get_response(
+            self.create_cache_key(metadata_endpoint, params),
+        )
+        force_refresh = cached_response is not None \
+            and cached_response.is_older_than(TABLEDATA_METADATA_CHECK_INTERVAL)
+
+        return self.send_request(
+            metadata_endpoint,
+            cache_duration=CACHE_TWELVE_HOURS,
+            sanitise_ignore_keys=METADATA_SANITISE_IGNORE_KEYS,
+            sanitise_schema=MetadataDict,
+            force_refresh=force_refresh,
+        )
+
+    @typechecked
+    def __query_cached_table(
+        self,
+        tabledata_endpoint: str,
+        params: dict[str, Any],
+        data_last_updated: Any,
+    ) -> dict[str, Any] | None:
+        """Answer a request of a resource's data from all of its data, if \
+            that is cached and fresh. No requests are sent.
+
+        :param tabledata_endpoint: The endpoint URL of the resource's data.
+        :type tabledata_endpoint: str
+
+        :param params: Parameters of the request, as returned by \
+            ``build_tabledata_params()``.
+        :type params: dict[str, Any]
+
+        :param data_last_updated: ``dataLastUpdated`` of the resource's \
+            metadata, if it was checked.
+        :type data_last_updated: Any
+
+        :raises APIError: "No data records returned." when no rows match \
+            the parameters.
+
+        :return: The data that matches the parameters, or ``None`` if the \
+            request cannot be answered from the cache.
+        :rtype: dict[str, Any] or None
+        """
+        # Views of lazily sanitised responses are not filtered locally.
+        if not params or self.lazy_sanitise:
+            return None
+
+        full_params = {'isTestApi': 'true'} if self.is_test_api else {}
+        http_key = self.create_cache_key(tabledata_endpoint, full_params)
+        full_tabledata = self.__cached_table(http_key)
         if (
-            'seriesNoOrRowNo' in params
-            and isinstance(params['seriesNoOrRowNo'], list)
+            full_tabledata is None
+            or self.is_tabledata_outdated(full_tabledata, data_last_updated)
+            or len(full_tabledata['Data'].get('row', [])) \
+                < self.__tabledata_total(full_tabledata)
         ):
-            params['seriesNoOrRowNo'] = ','.join(params['seriesNoOrRowNo'])
+            return None
+
+        local_tabledata = query_tabledata(full_tabledata, params)
+        # The endpoint raises the same error for queries that match nothing.
+        if local_tabledata is not None and local_tabledata['DataCount'] == 0:
+            raise APIError(
+                message='No data records returned.',
+                data=local_tabledata,
+            )
 
-        if 'timeFilter' in params and isinstance(params['timeFilter'], tuple):
-            params['timeFilter'] = ','.join(params['timeFilter'])
+        return local_tabledata
 
-        tabledata_endpoint = f'{TABLEDATA_ENDPOINT}/{resource_id}'
-        tabledata = self.send_request(
-            tabledata_endpoint,
-            params=params,
-            cache_duration=CACHE_TWELVE_HOURS,
-            sanitise_ignore_keys=TABLEDATA_SANITISE_IGNORE_KEYS,
+    @typechecked
+    def __cached_table(self, http_key: str) -> Any:
+        """Return all of a resource's data from the cache, without sending \
+            a request, even if the response has expired in the meantime.
+
+        :param http_key: Key of the request of all of the data in the cache.
+        :type http_key: str
+
+        :return: The sanitised data, or ``None`` if it is not cached, has \
+            expired, or has no data records.
+        :rtype: Any
+        """
+        result_key = None
+        if self.result_cache is not None:
+            result_key = self.result_cache.create_key(
+                http_key,
+                True,
+                TABLEDATA_SANITISE_IGNORE_KEYS,
+                TabledataDict,
+            )
+            result = self.result_cache.get(result_key, http_key)
+            if result is not None:
+                self.cache_manager.record_use(http_key)
+                return result.value
+
+        cached_response = self.session.cache.get_response(http_key)
+        if cached_response is None or cached_response.is_expired:
+            return None
+
+        try:
+            response_val = self.parse_response(cached_response)
+        except APIError:
+            return None
+        self.cache_manager.record_use(http_key)
+
+        full_tabledata = self.sanitise_data(
+            response_val,
+            ignore_keys=TABLEDATA_SANITISE_IGNORE_KEYS,
+            schema=TabledataDict,
+            in_place=True,
         )
+        if result_key is not None:
+            _ = self.result_cache.save(result_key, http_key, full_tabledata)
 
-        rows = tabledata['Data']['row']
-        if len(rows) == 0:
-            warn('Empty data set returned', RuntimeWarning)
+        return full_tabledata
 
-        return tabledata
+    @typechecked
+    def __call_many(
+        self,
+        method: Callable[..., Any],
+        resource_ids: Iterable[str],
+        max_workers: int,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Call a method for each resource on the client's pool of threads.
+
+        :param method: Method to call with each resource's ID.
+        :type method: Callable[..., Any]
+
+        :param resource_ids: IDs of the resources.
+        :type resource_ids: Iterable[str]
+
+        :param max_workers: Maximum number of methods to call at the same \
+            time.
+        :type max_workers: int
+
+        :param kwargs: Key-value arguments to be passed to ``method``.
+        :type kwargs: Any
+
+        :raises TypeError: ``resource_ids`` is a string.
+        :raises ValueError: ``max_workers`` is less than 1.
+
+        :return: Result of each call, or the error that it raised, keyed by \
+            the resource's ID.
+        :rtype: dict[str, Any]
+        """
+        # A string is an iterable of its characters, which are not IDs.
+        if isinstance(resource_ids, str):
+            raise TypeError(
+                'argument "resource_ids" must be an iterable of IDs, not a '
+                'string.'
+            )
+
+        def call(resource_id: str) -> Any:
+            try:
+                return method(resource_id, **kwargs)
+            except (APIError, RequestException) as e:
+                return e
+
+        # Remove repeated IDs, but keep the order.
+        unique_resource_ids = list(dict.fromkeys(resource_ids))
+
+        results = self.map_concurrently(call, unique_resource_ids, max_workers)
+        return dict(zip(unique_resource_ids, results))
+
+    @typechecked
+    def __tabledata_total(self, tabledata: Any) -> int:
+        """Return the total number of rows of a resource.
+
+        :param tabledata: A page of the resource's data.
+        :type tabledata: Any
+
+        :return: The response's ``Data.total`` if it is set, else \
+            ``DataCount``.
+        :rtype: int
+        """
+        total = tabledata['Data'].get('total')
+        if not isinstance(total, int):
+            total = tabledata.get('DataCount', 0)
+        return total
 
 __all__ = [
     'Client',
+    'ClientBase',
 ]
@@ -0,0 +1,298 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Validation and parameters that are shared by the clients."""
+
+import re
+from collections.abc import Mapping
+from datetime import date
+from typing import Any, Unpack
+
+from ..constants import CACHE_TWELVE_HOURS
+from ..singstat import SingStat
+from ..typechecking import typechecked
+
+from .constants import (
+    RESOURCE_ID_ARGS_KEY_MAP,
+    RESOURCE_ID_DEFAULT_ARGS,
+    RESOURCE_ID_SEARCH_OPTIONS,
+
+    TABLEDATA_ARGS_KEY_MAP,
+    TABLEDATA_LIMIT_MAX,
+    TABLEDATA_FREQUENCY_CACHE_DURATIONS,
+    TABLEDATA_SORT_BY_REGEXP,
+)
+from .periods import parse_period
+from .types_args import ResourceIdArgsDict, TabledataArgsDict
+
+class ClientBase(SingStat):
+    """Validation and parameters that are shared by ``Client`` and \
+        ``AsyncClient``.
+
+    Normally, it does not need to be created by applications.
+    """
+
+    @typechecked
+    def build_resource_id_params(
+        self,
+        **kwargs: Unpack[ResourceIdArgsDict]
+    ) -> dict[str, Any]:
+        """Validate the arguments of ``resource_id()`` and build the \
+            parameters for its endpoint URL.
+
+        :param kwargs: Key-value arguments of ``resource_id()``.
+        :type kwargs: ResourceIdArgsDict
+
+        :raises ValueError: ``search_option`` is not ``"all"``, ``"title"`` \
+            or ``"variable"``.
+
+        :return: The parameters for the endpoint URL.
+        :rtype: dict[str, Any]
+        """
+        # Validate inputs
+        if (
+            'search_option' in kwargs
+            and kwargs['search_option'] not in RESOURCE_ID_SEARCH_OPTIONS
+        ):
+            search_options = f'"{('", "').join(RESOURCE_ID_SEARCH_OPTIONS)}"'
+            raise ValueError(
+                f'Argument "search_option" must be one of {search_options}.'
+            )
+
+        params = self.build_params(
+            params_expected_type=ResourceIdArgsDict,
+            original_params=kwargs,
+            default_params=RESOURCE_ID_DEFAULT_ARGS,
+            key_map=RESOURCE_ID_ARGS_KEY_MAP,
+        )
+
+        return params
+
+    @typechecked
+    def build_tabledata_params(
+        self,
+        **kwargs: Unpack[TabledataArgsDict]
+    ) -> dict[str, Any]:
+        """Validate the arguments of ``tabledata()`` and build the \
+            parameters for its endpoint URL.
+
+        :param kwargs: Key-value arguments of ``tabledata()``.
+        :type kwargs: TabledataArgsDict
+
+        :raises ValueError: ``between`` tuple has at least one value that is \
+            less than 0.
+        :raises ValueError: ``between`` tuple's first value is greater than \
+            its second value.
+        :raises ValueError: ``limit`` is not between 0 and 3000.
+        :raises ValueError: ``offset`` is less than 0.
+        :raises ValueError: ``sort_by`` does not match the regular \
+            expression ``r'^(key|value|seriesNo|rowNo|rowText) (asc|desc)$'``.
+
+        ``series_no_or_row_no``, ``time_filter`` and ``between`` are \
+            converted to comma-separated strings without spaces. Series and \
+            row numbers are deduplicated and sorted by their numbers, e.g. \
+            ``"1.10"`` after ``"1.9"``. Time periods are deduplicated, and \
+            sorted in time if they all have the same frequency. So \
+            equivalent arguments are sent, and cached, as the same request.
+
+        :return: The parameters for the endpoint URL.
+        :rtype: dict[str, Any]
+        """
+        # Validate inputs
+        if 'between' in kwargs and isinstance(kwargs['between'], tuple):
+            if any(val < 0 for val in kwargs['between']):
+                raise ValueError(
+                    'values in argument "between" must be 0 or greater.'
+                )
+            if kwargs['between'][0] > kwargs['between'][1]:
+                raise ValueError(
+                    'first value in argument "between" must be smaller than second value.'
+                )
+
+        if (
+            'limit' in kwargs
+            and (kwargs['limit'] < 0 or kwargs['limit'] > TABLEDATA_LIMIT_MAX)
+        ):
+            raise ValueError(
+                f'argument "limit" must be between 0 and {TABLEDATA_LIMIT_MAX}.'
+            )
+
+        if 'offset' in kwargs and kwargs['offset'] < 0:
+            raise ValueError('argument "offset" must be 0 or greater.')
+
+        if (
+            'sort_by' in kwargs and re.fullmatch(
+                TABLEDATA_SORT_BY_REGEXP,
+                kwargs['sort_by'],
+            ) is None
+        ):
+            raise ValueError('argument "sort_by" has invalid sort criteria.')
+
+        params = self.build_params(
+            params_expected_type=TabledataArgsDict,
+            original_params=kwargs,
+            key_map=TABLEDATA_ARGS_KEY_MAP,
+        )
+
+        # Convert parameters to have the values that the endpoint expects,
+        # in one canonical form, so that equivalent arguments are sent and
+        # cached as the same request.
+        if 'between' in params:
+            params['between'] = self.__canonical_between(params['between'])
+
+        if 'seriesNoOrRowNo' in params:
+            params['seriesNoOrRowNo'] = self.__canonical_series_no_or_row_no(
+                params['seriesNoOrRowNo'],
+            )
+
+        if 'timeFilter' in params:
+            params['timeFilter'] = self.__canonical_time_filter(
+                params['timeFilter'],
+            )
+
+        return params
+
+    @typechecked
+    def tabledata_cache_duration(self, frequency: str | None) -> int:
+        """Return the number of seconds to cache a resource's data for, \
+            according to how often the data is updated.
+
+        :param frequency: The ``frequency`` of the resource's metadata, e.g. \
+            ``"Monthly"``.
+        :type frequency: str or None
+
+        :return: Number of seconds to cache the data for, or 12 hours if \
+            ``frequency`` is not known.
+        :rtype: int
+        """
+        if frequency is None:
+            return CACHE_TWELVE_HOURS
+
+        return TABLEDATA_FREQUENCY_CACHE_DURATIONS.get(
+            frequency.strip().lower(),
+            CACHE_TWELVE_HOURS,
+        )
+
+    @typechecked
+    def is_tabledata_outdated(
+        self,
+        tabledata: Mapping[str, Any],
+        data_last_updated: Any,
+    ) -> bool:
+        """Return whether a resource's data was last updated before the date \
+            in its metadata.
+
+        :param tabledata: Data of the resource, as returned by \
+            ``tabledata()``.
+        :type tabledata: Mapping[str, Any]
+
+        :param data_last_updated: ``dataLastUpdated`` of the resource's \
+            metadata.
+        :type data_last_updated: Any
+
+        :return: ``True`` if both dates are known and the data's date is \
+            before the metadata's.
+        :rtype: bool
+        """
+        tabledata_last_updated = tabledata['Data'].get('dataLastUpdated')
+
+        return (
+            isinstance(data_last_updated, date)
+            and isinstance(tabledata_last_updated, date)
+            and tabledata_last_updated < data_last_updated
+        )
+
+# private
+
+    @typechecked
+    def __canonical_between(self, between: tuple | str) -> str:
+        """Return the canonical form of ``between``.
+
+        :param between: The start and end points of the range.
+        :type between: tuple or str
+
+        :return: The points, separated by a comma.
+        :rtype: str
+        """
+        values = between if isinstance(between, tuple) \
+            else between.split(',')
+
+        points = []
+        for value in values:
+            point = str(value).strip()
+            try:
+                point = str(int(point))
+            except ValueError:
+                pass
+            points.append(point)
+
+        return ','.join(points)
+
+    @typechecked
+    def __canonical_series_no_or_row_no(self, numbers: list | str) -> str:
+        """Return the canonical form of ``series_no_or_row_no``.
+
+        :param numbers: Series numbers or row numbers.
+        :type numbers: list or str
+
+        :return: The numbers, deduplicated, sorted and separated by commas.
+        :rtype: str
+        """
+        if isinstance(numbers, str):
+            numbers = numbers.split(',')
+
+        unique_numbers = {
+            number.strip() for number in numbers if number.strip()
+        }
+
+        def sort_key(number: str) -> tuple:
+            return tuple(
+                (0, int(part), '') if part.isdigit() else (1, 0, part)
+                for part in number.split('.')
+            )
+
+        return ','.join(sorted(unique_numbers, key=sort_key))
+
+    @typechecked
+    def __canonical_time_filter(self, time_filter: tuple | str) -> str:
+        """Return the canonical form of ``time_filter``.
+
+        :param time_filter: Time periods.
+        :type time_filter: tuple or str
+
+        :return: The periods, deduplicated, sorted in time if they can be, \
+            and separated by commas.
+        :rtype: str
+        """
+        if isinstance(time_filter, str):
+            time_filter = tuple(time_filter.split(','))
+
+        # Deduplicate the periods and keep their order.
+        periods = list(dict.fromkeys(
+            ' '.join(period.split()) for period in time_filter
+            if period.strip()
+        ))
+
+        parsed = [parse_period(period) for period in periods]
+        if (
+            None not in parsed
+            and len({period.per_year for period in parsed}) == 1
+        ):
+            periods = [str(period) for period in sorted(parsed)]
+
+        return ','.join(periods)
+
+__all__ = [
+    'ClientBase',
+]
@@ -14,12 +14,25 @@
 
 """Constants for all SingStat-related APIs."""
 
-from ..constants import BASE_API_ENDPOINT
+from ..constants import BASE_API_ENDPOINT, CACHE_TWELVE_HOURS
 
 METADATA_ENDPOINT = f'{BASE_API_ENDPOINT}/metadata'
 RESOURCE_ID_ENDPOINT = f'{BASE_API_ENDPOINT}/resourceid'
 TABLEDATA_ENDPOINT = f'{BASE_API_ENDPOINT}/tabledata'
 
+ASYNC_MAX_CONNECTIONS = 100
+ASYNC_SANITISE_THREAD_BYTES = 64 * 1024
+CATALOGUE_SEARCH_LIMIT = 20
+CATALOGUE_SEARCH_OPTIONS = (
+    'all',
+    'title',
+    'variable',
+    'theme',
+    'subject',
+    'topic',
+)
+MAX_WORKERS = 4
+
 RESOURCE_ID_ARGS_KEY_MAP = {
     'search_option': 'searchOption',
 }
@@ -58,6 +71,20 @@ TABLEDATA_SANITISE_IGNORE_KEYS = [
     'Data.row[].rowNo',
     'Data.row[].seriesNo',
 ]
+TABLEDATA_LIMIT_MAX = 3000
+TABLEDATA_FREQUENCY_CACHE_DURATIONS = {
+    'annual': 60 * 60 * 24 * 7,
+    'half-yearly': 60 * 60 * 24 * 7,
+    'quarterly': 60 * 60 * 24 * 3,
+    'monthly': 60 * 60 * 24,
+    'weekly': CACHE_TWELVE_HOURS,
+    'daily': 60 * 60,
+}
+TABLEDATA_METADATA_CHECK_INTERVAL = 60 * 5
+TABLEDATA_PERIOD_MONTHS = (
+    'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec',
+)
 TABLEDATA_SORT_BY_REGEXP = r'^(key|value|seriesNo|rowNo|rowText) (asc|desc)$'
 
 __all__ = [
@@ -65,6 +92,12 @@ __all__ = [
     'RESOURCE_ID_ENDPOINT',
     'TABLEDATA_ENDPOINT',
 
+    'ASYNC_MAX_CONNECTIONS',
+    'ASYNC_SANITISE_THREAD_BYTES',
+    'CATALOGUE_SEARCH_LIMIT',
+    'CATALOGUE_SEARCH_OPTIONS',
+    'MAX_WORKERS',
+
     'RESOURCE_ID_ARGS_KEY_MAP',
     'RESOURCE_ID_DEFAULT_ARGS',
     'RESOURCE_ID_SEARCH_OPTIONS',
@@ -73,5 +106,9 @@ __all__ = [
 
     'TABLEDATA_ARGS_KEY_MAP',
     'TABLEDATA_SANITISE_IGNORE_KEYS',
+    'TABLEDATA_LIMIT_MAX',
+    'TABLEDATA_FREQUENCY_CACHE_DURATIONS',
+    'TABLEDATA_METADATA_CHECK_INTERVAL',
+    'TABLEDATA_PERIOD_MONTHS',
     'TABLEDATA_SORT_BY_REGEXP',
 ]
@@ -0,0 +1,168 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Answer queries of a resource's data from all of its data, without \
+    requesting the endpoint."""
+
+from collections.abc import Mapping
+from typing import Any
+
+from ..typechecking import typechecked
+
+# Fields that rows can be sorted by locally. Sorting by ``key`` and
+# ``value`` orders the records within the rows, which is left to the API.
+_ROW_SORT_FIELDS = ('seriesNo', 'rowNo', 'rowText')
+
+def _number_sort_key(number: str) -> tuple:
+    """Sort key of a series or row number, e.g. ``"1.10"`` after ``"1.9"``."""
+    return tuple(
+        (0, int(part), '') if part.isdigit() else (1, 0, part)
+        for part in str(number).split('.')
+    )
+
+def _parse_between(between: str) -> tuple[float, float] | None:
+    """Parse the ``between`` parameter, or return ``None`` if it cannot be \
+        parsed."""
+    points = between.split(',')
+    if len(points) != 2:
+        return None
+    try:
+        return float(points[0]), float(points[1])
+    except ValueError:
+        return None
+
+@typechecked
+def query_tabledata(
+    tabledata: Mapping[str, Any],
+    params: Mapping[str, Any],
+) -> dict[str, Any] | None:
+    """Apply the parameters of a ``tabledata()`` request to all of the data \
+        of a time series resource, in the same way as the endpoint.
+
+    - ``seriesNoOrRowNo``: rows whose ``seriesNo`` or ``rowNo`` is one of \
+        the numbers.
+    - ``search``: rows whose ``rowText`` contains the string, ignoring case.
+    - ``timeFilter``: records whose ``key`` is one of the periods.
+    - ``between``: records whose ``value`` is within the range, including \
+        its start and end points.
+    - ``sortBy``: rows sorted by ``seriesNo``, ``rowNo`` or ``rowText``.
+    - ``offset`` and ``limit``: the rows from ``offset``, up to ``limit`` \
+        rows, after the rows are filtered and sorted.
+
+    Rows without records after ``timeFilter`` and ``between`` are left out.
+
+    :param tabledata: All of the data of the resource, which has been \
+        sanitised, as returned by ``tabledata()`` without parameters.
+    :type tabledata: Mapping[str, Any]
+
+    :param params: Parameters for the endpoint URL, as returned by \
+        ``build_tabledata_params()``.
+    :type params: Mapping[str, Any]
+
+    :return: The data, with ``DataCount`` set to the number of rows before \
+        ``offset`` and ``limit`` are applied. ``None`` if the query cannot \
+        be answered locally, e.g. the rows have nested columns, or the rows \
+        are sorted by ``key`` or ``value``.
+    :rtype: dict[str, Any] or None
+    """
+    sort_by = params.get('sortBy')
+    if sort_by is not None:
+        sort_field, _, sort_order = sort_by.partition(' ')
+        if sort_field not in _ROW_SORT_FIELDS:
+            return None
+
+    between = None
+    if params.get('between') is not None:
+        between = _parse_between(str(params['between']))
+        if between is None:
+            return None
+
+    data = tabledata['Data']
+    rows = data.get('row', [])
+    if any(
+        not isinstance(column.get('key'), str) or 'columns' in column
+        for row in rows for column in row.get('columns', [])
+    ):
+        return None
+
+    if params.get('seriesNoOrRowNo'):
+        numbers = set(str(params['seriesNoOrRowNo']).split(','))
+        rows = [
+            row for row in rows
+            if row.get('seriesNo', row.get('rowNo')) in numbers
+        ]
+
+    if params.get('search'):
+        search = str(params['search']).casefold()
+        rows = [
+            row for row in rows
+            if search in str(row.get('rowText', '')).casefold()
+        ]
+
+    if params.get('timeFilter') or between is not None:
+        periods = set(str(params['timeFilter']).split(',')) \
+            if params.get('timeFilter') else None
+
+        def is_selected(column: Mapping[str, Any]) -> bool:
+            if periods is not None and column['key'] not in periods:
+                return False
+            if between is not None:
+                value = column.get('value')
+                if isinstance(value, bool) \
+                    or not isinstance(value, (int, float)):
+                    return False
+                return between[0] <= value <= between[1]
+            return True
+
+        filtered_rows = []
+        for row in rows:
+            columns = [
+                column for column in row.get('columns', [])
+                if is_selected(column)
+            ]
+            if columns:
+                filtered_rows.append(dict(row) | {'columns': columns})
+        rows = filtered_rows
+
+    if sort_by is not None:
+        key = _number_sort_key if sort_field in ('seriesNo', 'rowNo') \
+            else lambda value: str(value).casefold()
+        rows = sorted(
+            rows,
+            key=lambda row: key(row.get(sort_field, '')),
+            reverse=sort_order == 'desc',
+        )
+
+    count = len(rows)
+    offset = params.get('offset', 0) or 0
+    limit = params.get('limit')
+    rows = rows[offset:] if limit is None else rows[offset:offset + limit]
+
+    result = dict(tabledata)
+    result['Data'] = dict(data)
+    result['Data']['row'] = rows
+    if 'total' in data:
+        result['Data']['total'] = count
+    result['DataCount'] = count
+    for key in ('offset', 'limit', 'sortBy', 'timeFilter', 'search'):
+        if key in params:
+            result['Data'][key] = params[key]
+    if between is not None and all(point.is_integer() for point in between):
+        result['Data']['between'] = tuple(int(point) for point in between)
+
+    return result
+
+__all__ = [
+    'query_tabledata',
+]
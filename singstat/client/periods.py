@@ -0,0 +1,120 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Time periods of time series tables, e.g. ``"2018"``, ``"2018 1H"``, \
+    ``"2018 1Q"`` and ``"2018 Jan"``."""
+
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from ..typechecking import typechecked
+
+from .constants import TABLEDATA_PERIOD_MONTHS
+
+class Period(NamedTuple):
+    """Time period, which is ordered by its year and its index in the year."""
+
+    year: int
+    index: int
+    per_year: int
+
+    def __str__(self) -> str:
+        """Period in the format of the API"""
+        if self.per_year == 1:
+            return str(self.year)
+        if self.per_year == 2:
+            return f'{self.year} {self.index}H'
+        if self.per_year == 4:
+            return f'{self.year} {self.index}Q'
+        return f'{self.year} {TABLEDATA_PERIOD_MONTHS[self.index - 1]}'
+
+@typechecked
+def parse_period(period: str) -> Period | None:
+    """Parse an annual, half-yearly, quarterly or monthly period.
+
+    :param period: The period, e.g. ``"2018"``, ``"2018 1H"``, ``"2018 1Q"`` \
+        or ``"2018 Jan"``.
+    :type period: str
+
+    :return: The period, or ``None`` if it is not in one of the formats.
+    :rtype: Period or None
+    """
+    year, _, part = period.strip().partition(' ')
+    if not (len(year) == 4 and year.isdigit()):
+        return None
+
+    if part == '':
+        return Period(int(year), 1, 1)
+    if part in ('1H', '2H'):
+        return Period(int(year), int(part[0]), 2)
+    if part in ('1Q', '2Q', '3Q', '4Q'):
+        return Period(int(year), int(part[0]), 4)
+    if part in TABLEDATA_PERIOD_MONTHS:
+        return Period(int(year), TABLEDATA_PERIOD_MONTHS.index(part) + 1, 12)
+
+    return None
+
+@typechecked
+def latest_period(periods: Iterable[str]) -> Period | None:
+    """Return the latest of some periods.
+
+    :param periods: The periods.
+    :type periods: Iterable[str]
+
+    :return: The latest period, or ``None`` if there are no periods, or if \
+        any of them cannot be parsed or they have different frequencies.
+    :rtype: Period or None
+    """
+    parsed = [parse_period(period) for period in periods]
+    if not parsed or None in parsed:
+        return None
+    if len({period.per_year for period in parsed}) > 1:
+        return None
+
+    return max(parsed)
+
+@typechecked
+def periods_after(start: Period, end: Period) -> list[str] | None:
+    """Return the periods after a period, up to and including another period.
+
+    :param start: The period to start after.
+    :type start: Period
+
+    :param end: The last period.
+    :type end: Period
+
+    :return: The periods, in the format of the API, which are empty if \
+        ``end`` is not after ``start``. ``None`` if the periods have \
+        different frequencies.
+    :rtype: list[str] or None
+    """
+    if start.per_year != end.per_year:
+        return None
+
+    periods = []
+    year, index = start.year, start.index
+    while (year, index) < (end.year, end.index):
+        year, index = (year + 1, 1) if index == start.per_year \
+            else (year, index + 1)
+        periods.append(str(Period(year, index, start.per_year)))
+
+    return periods
+
+__all__ = [
+    'Period',
+
+    'latest_period',
+    'parse_period',
+    'periods_after',
+]
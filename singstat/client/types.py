@@ -18,7 +18,7 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Any, NotRequired, TypedDict
+from typing import NotRequired, TypedDict
 
 # Common types
 
@@ -230,8 +230,9 @@ class _TabledataDataRowColumnDict(TypedDict):
 
     key: str
     """Key"""
-    value: NotRequired[Any]
-    """Value"""
+    value: NotRequired[int | float | str]
+    """Value, i.e. a number, or a string such as ``"na"`` if it has no \
+        number"""
 
 class _TabledataDataRowColumnColumnDict(TypedDict):
     """Type definition for \
@@ -0,0 +1,245 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compression of cached responses.
+
+``gzip`` is in the standard library. ``zstd`` is in the standard library \
+    from Python 3.14, else install it with ``pip install singstat[zstd]``.
+"""
+
+import gzip
+from threading import Lock
+from typing import Any, Callable, NamedTuple
+
+from requests_cache.serializers import SerializerPipeline, Stage
+from requests_cache.serializers.preconf import pickle_serializer
+
+from .typechecking import typechecked
+
+try:
+    from compression import zstd # type: ignore[import-not-found]
+except ImportError: # pragma: no cover
+    try:
+        import zstandard as zstd # type: ignore[no-redef]
+    except ImportError:
+        zstd = None # type: ignore[assignment]
+
+COMPRESSION_GZIP = 'gzip'
+COMPRESSION_ZSTD = 'zstd'
+
+COMPRESSIONS = (
+    COMPRESSION_GZIP,
+    COMPRESSION_ZSTD,
+)
+
+# Default and allowed levels of each compression.
+COMPRESSION_LEVELS = {
+    COMPRESSION_GZIP: (6, range(0, 10)),
+    COMPRESSION_ZSTD: (3, range(1, 23)),
+}
+
+# Compressed values start with these bytes, so that values that were cached
+# before compression was turned on, or with another compression, can still
+# be read.
+_MAGIC_NUMBERS = {
+    COMPRESSION_GZIP: b'\x1f\x8b',
+    COMPRESSION_ZSTD: b'\x28\xb5\x2f\xfd',
+}
+
+class CompressionInfo(NamedTuple):
+    """Statistics of the responses that were compressed."""
+
+    compression: str
+    level: int
+    count: int
+    uncompressed_bytes: int
+    compressed_bytes: int
+    ratio: float | None
+
+class CompressionStage(Stage):
+    """Stage of a serializer pipeline that compresses serialized responses \
+        and counts how much they were compressed by.
+
+    Values that are not compressed, or that were compressed with the other \
+        compression, are decompressed according to their first bytes.
+
+    :param compression: Compression to use, i.e. ``"gzip"`` or ``"zstd"``.
+    :type compression: str
+
+    :param level: Compression level. ``gzip`` levels are from ``0`` to \
+        ``9``, and ``zstd`` levels are from ``1`` to ``22``. Defaults to \
+        ``None``, i.e. ``6`` for ``gzip`` and ``3`` for ``zstd``.
+    :type level: int or None
+
+    :raises ValueError: ``compression`` is not one of the compressions.
+    :raises ValueError: ``level`` is not one of the levels of \
+        ``compression``.
+    :raises ImportError: ``zstd`` is not available.
+    """
+
+    compression: str
+    level: int
+
+    @typechecked
+    def __init__(self, compression: str, level: int | None=None) -> None:
+        """Constructor method"""
+        if compression not in COMPRESSIONS:
+            compressions = f'"{('", "').join(COMPRESSIONS)}"'
+            raise ValueError(
+                f'argument "cache_compression" must be one of {compressions}.'
+            )
+        if compression == COMPRESSION_ZSTD and zstd is None:
+            raise ImportError(
+                '"zstandard" must be installed to use "zstd" compression.'
+            )
+
+        default_level, levels = COMPRESSION_LEVELS[compression]
+        if level is None:
+            level = default_level
+        if level not in levels:
+            raise ValueError(
+                f'argument "cache_compression_level" must be from '
+                f'{levels.start} to {levels.stop - 1} for "{compression}".'
+            )
+
+        self.compression = compression
+        self.level = level
+
+        self.__compress = _compressor(compression, level)
+        self.__stats_lock = Lock()
+        self.__count = 0
+        self.__uncompressed_bytes = 0
+        self.__compressed_bytes = 0
+
+        super().__init__(dumps=self.__dumps, loads=self.__loads)
+
+    @typechecked
+    def copy(self) -> 'CompressionStage':
+        """Return a new stage with the same compression and level, whose \
+            statistics start from zero.
+
+        :return: The stage.
+        :rtype: CompressionStage
+        """
+        return CompressionStage(self.compression, self.level)
+
+    @typechecked
+    def info(self) -> CompressionInfo:
+        """Return the statistics of the responses that were compressed by \
+            this stage.
+
+        :return: Named tuple with the ``compression``, its ``level``, the \
+            ``count`` of responses, their total ``uncompressed_bytes`` and \
+            ``compressed_bytes``, and the ``ratio`` of uncompressed to \
+            compressed bytes. ``ratio`` is ``None`` if no responses were \
+            compressed.
+        :rtype: CompressionInfo
+        """
+        with self.__stats_lock:
+            count = self.__count
+            uncompressed_bytes = self.__uncompressed_bytes
+            compressed_bytes = self.__compressed_bytes
+
+        return CompressionInfo(
+            compression=self.compression,
+            level=self.level,
+            count=count,
+            uncompressed_bytes=uncompressed_bytes,
+            compressed_bytes=compressed_bytes,
+            ratio=uncompressed_bytes / compressed_bytes \
+                if compressed_bytes else None,
+        )
+
+# private
+
+    def __dumps(self, value: bytes) -> bytes:
+        """Compress a serialized value and count its sizes."""
+        compressed_value = self.__compress(value)
+
+        with self.__stats_lock:
+            self.__count += 1
+            self.__uncompressed_bytes += len(value)
+            self.__compressed_bytes += len(compressed_value)
+
+        return compressed_value
+
+    def __loads(self, value: Any) -> Any:
+        """Decompress a value according to its first bytes, or return it \
+            as-is if it is not compressed."""
+        if not isinstance(value, bytes):
+            return value
+        if value.startswith(_MAGIC_NUMBERS[COMPRESSION_GZIP]):
+            return gzip.decompress(value)
+        if value.startswith(_MAGIC_NUMBERS[COMPRESSION_ZSTD]):
+            if zstd is None:
+                raise ImportError(
+                    '"zstandard" must be installed to read responses that '
+                    'were cached with "zstd" compression.'
+                )
+            return zstd.decompress(value)
+        return value
+
+def _compressor(compression: str, level: int) -> Callable[[bytes], bytes]:
+    """Return the function that compresses values."""
+    if compression == COMPRESSION_ZSTD:
+        return lambda value: zstd.compress(value, level=level)
+
+    # The modification time is left out, so that the same response is
+    # always compressed to the same bytes.
+    return lambda value: gzip.compress(value, compresslevel=level, mtime=0)
+
+@typechecked
+def compressed_serializer(
+    compression: str,
+    level: int | None=None,
+) -> SerializerPipeline:
+    """Return a serializer of cached responses that pickles and compresses \
+        them.
+
+    Pass it to a cache backend that is created by the application, e.g. \
+        ``SQLiteCache(serializer=compressed_serializer("zstd"))``.
+
+    :param compression: Compression to use, i.e. ``"gzip"`` or ``"zstd"``.
+    :type compression: str
+
+    :param level: Compression level. Refer to ``CompressionStage`` for the \
+        levels. Defaults to ``None``, i.e. the default level of \
+        ``compression``.
+    :type level: int or None
+
+    :raises ValueError: ``compression`` is not one of the compressions.
+    :raises ValueError: ``level`` is not one of the levels of \
+        ``compression``.
+    :raises ImportError: ``zstd`` is not available.
+
+    :return: The serializer, whose last stage is a ``CompressionStage``.
+    :rtype: SerializerPipeline
+    """
+    return SerializerPipeline(
+        [*pickle_serializer.stages, CompressionStage(compression, level)],
+        name=f'pickle-{compression}',
+        is_binary=True,
+    )
+
+__all__ = [
+    'COMPRESSION_GZIP',
+    'COMPRESSION_ZSTD',
+    'COMPRESSIONS',
+    'COMPRESSION_LEVELS',
+
+    'CompressionInfo',
+    'CompressionStage',
+
+    'compressed_serializer',
+]
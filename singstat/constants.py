@@ -25,6 +25,25 @@ CACHE_NAME = f'{NAME}_cache'
 
 CACHE_TWELVE_HOURS = 60 * 60 * 12
 
+CACHE_USAGE_TABLE_NAME = 'response_usage'
+CACHE_USAGE_TOTALS_TABLE_NAME = 'response_usage_totals'
+CACHE_USAGE_FLUSH_INTERVAL = 5
+CACHE_USAGE_FLUSH_SIZE = 256
+
+MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+
+POOL_SIZE = 10
+
+RESULT_CACHE_TABLE_NAME = 'sanitised_results'
+
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.1
+RETRY_STATUS_FORCELIST = (500, 502, 503, 504)
+
+SANITISE_CACHE_SIZE = 4096
+
+SQLITE_BUSY_TIMEOUT = 30 * 1000
+
 USER_AGENT = f'SingStat Python package/{VERSION} https://pypi.org/project/{NAME}'
 
 __all__ = [
@@ -36,5 +55,24 @@ __all__ = [
 
     'CACHE_TWELVE_HOURS',
 
+    'CACHE_USAGE_TABLE_NAME',
+    'CACHE_USAGE_TOTALS_TABLE_NAME',
+    'CACHE_USAGE_FLUSH_INTERVAL',
+    'CACHE_USAGE_FLUSH_SIZE',
+
+    'MEMORY_CACHE_BYTES',
+
+    'POOL_SIZE',
+
+    'RESULT_CACHE_TABLE_NAME',
+
+    'RETRY_TOTAL',
+    'RETRY_BACKOFF_FACTOR',
+    'RETRY_STATUS_FORCELIST',
+
+    'SANITISE_CACHE_SIZE',
+
+    'SQLITE_BUSY_TIMEOUT',
+
     'USER_AGENT',
 ]
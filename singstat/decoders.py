@@ -0,0 +1,133 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Decoders of JSON responses.
+
+``orjson`` and ``msgspec`` are optional. Install them with \
+    ``pip install singstat[orjson]`` or ``pip install singstat[msgspec]``.
+"""
+
+from typing import Any, Callable
+
+from requests.exceptions import JSONDecodeError
+
+try:
+    import orjson
+except ImportError: # pragma: no cover
+    orjson = None # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError: # pragma: no cover
+    msgspec = None # type: ignore[assignment]
+
+JSON_DECODER_AUTO = 'auto'
+JSON_DECODER_JSON = 'json'
+JSON_DECODER_MSGSPEC = 'msgspec'
+JSON_DECODER_ORJSON = 'orjson'
+
+JSON_DECODERS = (
+    JSON_DECODER_AUTO,
+    JSON_DECODER_JSON,
+    JSON_DECODER_MSGSPEC,
+    JSON_DECODER_ORJSON,
+)
+
+JsonDecoder = Callable[[bytes], Any]
+
+def _orjson_decoder() -> JsonDecoder:
+    """Return a decoder that uses ``orjson``."""
+    decode = orjson.loads
+
+    def decode_json(content: bytes) -> Any:
+        try:
+            return decode(content)
+        except orjson.JSONDecodeError as e:
+            raise JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+    return decode_json
+
+def _msgspec_decoder() -> JsonDecoder:
+    """Return a decoder that uses ``msgspec``."""
+    decode = msgspec.json.Decoder().decode
+
+    def decode_json(content: bytes) -> Any:
+        try:
+            return decode(content)
+        except msgspec.DecodeError as e:
+            raise JSONDecodeError(
+                str(e),
+                content.decode('utf-8', errors='replace'),
+                0,
+            ) from e
+
+    return decode_json
+
+def get_json_decoder(name: str) -> tuple[str, JsonDecoder | None]:
+    """Return the JSON decoder with a name.
+
+    - ``"json"``: the standard library's ``json`` module, through \
+        ``requests.Response.json()``.
+    - ``"orjson"``: ``orjson``, which must be installed.
+    - ``"msgspec"``: ``msgspec``, which must be installed.
+    - ``"auto"``: ``orjson`` if it is installed, else ``msgspec`` if it is \
+        installed, else ``json``.
+
+    :param name: Name of the decoder.
+    :type name: str
+
+    :raises ValueError: ``name`` is not one of the decoders.
+    :raises ImportError: The package of the decoder is not installed.
+
+    :return: Name of the decoder that is used, i.e. ``name`` unless it is \
+        ``"auto"``, and the function that decodes a response's content. The \
+        function is ``None`` for ``"json"``, i.e. use \
+        ``requests.Response.json()``.
+    :rtype: tuple[str, Callable[[bytes], Any] or None]
+    """
+    if name not in JSON_DECODERS:
+        json_decoders = f'"{('", "').join(JSON_DECODERS)}"'
+        raise ValueError(f'argument "json_decoder" must be one of {json_decoders}.')
+
+    if name == JSON_DECODER_AUTO:
+        if orjson is not None:
+            name = JSON_DECODER_ORJSON
+        elif msgspec is not None:
+            name = JSON_DECODER_MSGSPEC
+        else:
+            name = JSON_DECODER_JSON
+
+    if name == JSON_DECODER_ORJSON:
+        if orjson is None:
+            raise ImportError('"orjson" must be installed to use it as the JSON decoder.')
+        return name, _orjson_decoder()
+
+    if name == JSON_DECODER_MSGSPEC:
+        if msgspec is None:
+            raise ImportError('"msgspec" must be installed to use it as the JSON decoder.')
+        return name, _msgspec_decoder()
+
+    return name, None
+
+__all__ = [
+    'JSON_DECODER_AUTO',
+    'JSON_DECODER_JSON',
+    'JSON_DECODER_MSGSPEC',
+    'JSON_DECODER_ORJSON',
+    'JSON_DECODERS',
+
+    'JsonDecoder',
+
+    'get_json_decoder',
+]
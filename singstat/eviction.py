@@ -0,0 +1,425 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Eviction of cached responses when the cache is bigger than its limits."""
+
+from threading import Lock
+from time import monotonic, time
+from typing import NamedTuple
+
+from requests_cache import BaseCache
+from requests_cache.backends.sqlite import SQLiteDict
+
+from .constants import (
+    CACHE_USAGE_FLUSH_INTERVAL,
+    CACHE_USAGE_FLUSH_SIZE,
+    CACHE_USAGE_TABLE_NAME,
+    CACHE_USAGE_TOTALS_TABLE_NAME,
+    RESULT_CACHE_TABLE_NAME,
+)
+from .result_cache import ResultCache
+from .typechecking import typechecked
+
+EVICTION_POLICY_LFU = 'lfu'
+EVICTION_POLICY_LRU = 'lru'
+
+EVICTION_POLICIES = (
+    EVICTION_POLICY_LFU,
+    EVICTION_POLICY_LRU,
+)
+
+# Order in which responses are evicted by each policy. Responses that were
+# cached before their uses were recorded are evicted first.
+_EVICTION_ORDERS = {
+    EVICTION_POLICY_LFU: 'COALESCE(u.use_count, 0), COALESCE(u.last_used, 0)',
+    EVICTION_POLICY_LRU: 'COALESCE(u.last_used, 0)',
+}
+
+class CacheUsage(NamedTuple):
+    """Number of responses in the cache, and total size of the responses \
+        and of their sanitised results."""
+
+    entries: int
+    bytes: int
+
+class CompactionInfo(NamedTuple):
+    """Result of compacting the cache."""
+
+    expired: int
+    evicted: int
+    bytes_before: int
+    bytes_after: int
+
+class CacheEvictor:
+    """Keep a SQLite cache of responses within a maximum number of \
+        responses and a maximum total size, by evicting the least recently \
+        or least frequently used responses.
+
+    The uses of the responses are recorded in a table of the same database, \
+        so that they are kept across processes. Record each use with \
+        ``record_use()``. The uses are written in batches, every 5 seconds \
+        or 256 responses, before evicting, and with ``flush()``. Responses \
+        are evicted when a new response is recorded, or with ``evict()``.
+
+    The number and total size of the responses are kept in another table, \
+        which is updated by triggers when responses are saved or deleted, \
+        so that the responses do not have to be counted again.
+
+    :param http_cache: Cache backend of the HTTP responses, which must be a \
+        SQLite cache.
+    :type http_cache: BaseCache
+
+    :param max_bytes: Maximum total size of the responses, and of their \
+        sanitised results in ``result_cache``, in bytes, as they are stored, \
+        i.e. after compression. Defaults to ``None``, i.e. no limit.
+    :type max_bytes: int or None
+
+    :param max_entries: Maximum number of responses. Defaults to ``None``, \
+        i.e. no limit.
+    :type max_entries: int or None
+
+    :param policy: Which responses to evict first, i.e. ``"lru"`` for the \
+        least recently used or ``"lfu"`` for the least frequently used. \
+        Defaults to ``"lru"``.
+    :type policy: str
+
+    :param result_cache: Cache of the sanitised results of the responses, \
+        whose results are deleted with their responses. Defaults to \
+        ``None``.
+    :type result_cache: ResultCache or None
+
+    :raises ValueError: ``http_cache`` is not a SQLite cache.
+    :raises ValueError: ``max_bytes`` or ``max_entries`` is less than 1.
+    :raises ValueError: ``policy`` is not one of the policies.
+    """
+
+    max_bytes: int | None
+    max_entries: int | None
+    policy: str
+
+    @typechecked
+    def __init__(
+        self,
+        http_cache: BaseCache,
+        max_bytes: int | None=None,
+        max_entries: int | None=None,
+        policy: str=EVICTION_POLICY_LRU,
+        result_cache: ResultCache | None=None,
+    ) -> None:
+        """Constructor method"""
+        if not isinstance(http_cache.responses, SQLiteDict):
+            raise ValueError(
+                'Cache limits can only be used with the "sqlite" cache backend.'
+            )
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError('argument "cache_max_bytes" must be 1 or greater.')
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(
+                'argument "cache_max_entries" must be 1 or greater.'
+            )
+        if policy not in EVICTION_POLICIES:
+            policies = f'"{('", "').join(EVICTION_POLICIES)}"'
+            raise ValueError(
+                f'argument "cache_eviction_policy" must be one of {policies}.'
+            )
+
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.policy = policy
+
+        self.__http_cache = http_cache
+        self.__responses: SQLiteDict = http_cache.responses
+        self.__result_cache = result_cache
+
+        # Tables whose rows are counted, and whether their rows are entries.
+        self.__counted_tables = [(self.__responses.table_name, True)]
+        if result_cache is not None:
+            self.__counted_tables.append((RESULT_CACHE_TABLE_NAME, False))
+
+        # Uses that are not written yet: the time of the last use, the
+        # number of uses, and whether the response was just cached.
+        self.__pending: dict[str, tuple[float, int, bool]] = {}
+        self.__pending_lock = Lock()
+        self.__flushed_at = monotonic()
+
+        with self.__responses.connection(commit=True) as con:
+            con.execute(
+                f'CREATE TABLE IF NOT EXISTS {CACHE_USAGE_TABLE_NAME} ('
+                '    key TEXT PRIMARY KEY,'
+                '    last_used REAL,'
+                '    use_count INTEGER'
+                ')'
+            )
+            con.execute(
+                f'CREATE TABLE IF NOT EXISTS {CACHE_USAGE_TOTALS_TABLE_NAME} ('
+                '    id INTEGER PRIMARY KEY CHECK (id = 0),'
+                '    entries INTEGER NOT NULL,'
+                '    bytes INTEGER NOT NULL'
+                ')'
+            )
+        self.__init_totals()
+
+    @typechecked
+    def record_use(self, key: str, is_new: bool=False) -> None:
+        """Record a use of a response, and evict responses if a new response \
+            was cached.
+
+        :param key: Key of the response in the cache.
+        :type key: str
+
+        :param is_new: Whether the response was just cached. Defaults to \
+            ``False``.
+        :type is_new: bool
+        """
+        now = time()
+        with self.__pending_lock:
+            if is_new:
+                self.__pending[key] = (now, 1, True)
+            else:
+                _, use_count, is_replaced = self.__pending.get(
+                    key,
+                    (now, 0, False),
+                )
+                self.__pending[key] = (now, use_count + 1, is_replaced)
+            is_due = len(self.__pending) >= CACHE_USAGE_FLUSH_SIZE \
+                or monotonic() - self.__flushed_at >= CACHE_USAGE_FLUSH_INTERVAL
+
+        if is_new:
+            _ = self.evict()
+        elif is_due:
+            self.flush()
+
+    @typechecked
+    def flush(self) -> None:
+        """Write the uses of responses that have been recorded but not \
+            written yet."""
+        with self.__pending_lock:
+            pending, self.__pending = self.__pending, {}
+            self.__flushed_at = monotonic()
+        if not pending:
+            return
+
+        with self.__responses.connection(commit=True) as con:
+            con.executemany(
+                f'INSERT OR REPLACE INTO {CACHE_USAGE_TABLE_NAME} '
+                '(key, last_used, use_count) VALUES (?, ?, ?)',
+                [
+                    (key, last_used, use_count)
+                    for key, (last_used, use_count, is_new) in pending.items()
+                    if is_new
+                ],
+            )
+            con.executemany(
+                f'INSERT INTO {CACHE_USAGE_TABLE_NAME} '
+                '(key, last_used, use_count) VALUES (?, ?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET '
+                'last_used = excluded.last_used, '
+                'use_count = use_count + excluded.use_count',
+                [
+                    (key, last_used, use_count)
+                    for key, (last_used, use_count, is_new) in pending.items()
+                    if not is_new
+                ],
+            )
+
+    @typechecked
+    def usage(self) -> CacheUsage:
+        """Return the number of responses in the cache, and the total size \
+            of the responses and of their sanitised results.
+
+        :return: Named tuple with the number of ``entries`` and their total \
+            size in ``bytes``.
+        :rtype: CacheUsage
+        """
+        # The totals are counted again if their triggers were dropped, e.g.
+        # when the responses were cleared.
+        self.__init_totals()
+
+        with self.__responses.connection() as con:
+            row = con.execute(
+                f'SELECT entries, bytes FROM {CACHE_USAGE_TOTALS_TABLE_NAME} '
+                'WHERE id = 0'
+            ).fetchone()
+        return CacheUsage(entries=row[0], bytes=row[1])
+
+    @typechecked
+    def evict(self) -> int:
+        """Evict responses, and their sanitised results, until the cache is \
+            within its limits.
+
+        :return: Number of responses that were evicted.
+        :rtype: int
+        """
+        self.flush()
+
+        if self.max_bytes is None and self.max_entries is None:
+            return 0
+
+        entries, total_bytes = self.usage()
+        if not self.__is_over_limits(entries, total_bytes):
+            return 0
+
+        size = 'LENGTH(r.value)'
+        if self.__result_cache is not None:
+            # The results of a response have keys that start with its key
+            # and ``":"``. Refer to ``ResultCache.create_key()``.
+            size += (
+                ' + (SELECT COALESCE(SUM(LENGTH(s.value)), 0) '
+                f'FROM {RESULT_CACHE_TABLE_NAME} AS s '
+                "WHERE s.key > r.key || ':' AND s.key < r.key || ';')"
+            )
+
+        keys = []
+        table_name = self.__responses.table_name
+        with self.__responses.connection() as con:
+            cur = con.execute(
+                f'SELECT r.key, {size} FROM {table_name} AS r '
+                f'LEFT JOIN {CACHE_USAGE_TABLE_NAME} AS u ON u.key = r.key '
+                f'ORDER BY {_EVICTION_ORDERS[self.policy]}'
+            )
+            for key, key_bytes in cur:
+                if not self.__is_over_limits(entries, total_bytes):
+                    break
+                keys.append(key)
+                entries -= 1
+                total_bytes -= key_bytes or 0
+            cur.close()
+
+        if keys:
+            self.__http_cache.delete(*keys, vacuum=False)
+            if self.__result_cache is not None:
+                _ = self.__result_cache.delete(*keys)
+            with self.__responses.connection(commit=True) as con:
+                con.executemany(
+                    f'DELETE FROM {CACHE_USAGE_TABLE_NAME} WHERE key = ?',
+                    [(key,) for key in keys],
+                )
+
+        return len(keys)
+
+    @typechecked
+    def prune(self) -> None:
+        """Delete the recorded uses of responses that are no longer in the \
+            cache, e.g. after expired responses are deleted."""
+        self.flush()
+
+        with self.__responses.connection(commit=True) as con:
+            con.execute(
+                f'DELETE FROM {CACHE_USAGE_TABLE_NAME} WHERE key NOT IN '
+                f'(SELECT key FROM {self.__responses.table_name})'
+            )
+
+    @typechecked
+    def clear(self) -> None:
+        """Delete all of the recorded uses of responses."""
+        with self.__pending_lock:
+            self.__pending.clear()
+
+        with self.__responses.connection(commit=True) as con:
+            con.execute(f'DELETE FROM {CACHE_USAGE_TABLE_NAME}')
+
+# private
+
+    @typechecked
+    def __init_totals(self) -> None:
+        """Create the triggers that keep the number and total size of the \
+            responses up to date, and count them, if the triggers do not \
+            exist."""
+        triggers = [
+            trigger
+            for table_name, is_entry in self.__counted_tables
+            for trigger in _totals_triggers(table_name, is_entry)
+        ]
+
+        with self.__responses.connection(commit=True) as con:
+            existing = {
+                row[0] for row in con.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+                )
+            }
+            if all(name in existing for name, _ in triggers):
+                return
+
+            for _, statement in triggers:
+                con.execute(statement)
+
+            table_name = self.__responses.table_name
+            total_bytes = ' + '.join(
+                f'(SELECT COALESCE(SUM(LENGTH(value)), 0) FROM {name})'
+                for name, _ in self.__counted_tables
+            )
+            con.execute(
+                f'INSERT OR REPLACE INTO {CACHE_USAGE_TOTALS_TABLE_NAME} '
+                '(id, entries, bytes) '
+                f'SELECT 0, (SELECT COUNT(*) FROM {table_name}), {total_bytes}'
+            )
+
+    @typechecked
+    def __is_over_limits(self, entries: int, total_bytes: int) -> bool:
+        """Return whether the cache is bigger than its limits."""
+        return (self.max_entries is not None and entries > self.max_entries) \
+            or (self.max_bytes is not None and total_bytes > self.max_bytes)
+
+def _totals_triggers(table_name: str, is_entry: bool) -> list[tuple[str, str]]:
+    """Return the names and statements of the triggers that keep the totals \
+        up to date when the rows of a table are saved or deleted.
+
+    ``INSERT OR REPLACE`` does not fire delete triggers for the row that it \
+        replaces, so that row is subtracted before the insert.
+    """
+    entry = 1 if is_entry else 0
+    totals = CACHE_USAGE_TOTALS_TABLE_NAME
+    statements = {
+        'replace': (
+            f'BEFORE INSERT ON {table_name} BEGIN UPDATE {totals} SET '
+            f'entries = entries - {entry} * ('
+            f'SELECT COUNT(*) FROM {table_name} WHERE key = NEW.key), '
+            'bytes = bytes - COALESCE(('
+            f'SELECT LENGTH(value) FROM {table_name} WHERE key = NEW.key'
+            '), 0); END'
+        ),
+        'insert': (
+            f'AFTER INSERT ON {table_name} BEGIN UPDATE {totals} SET '
+            f'entries = entries + {entry}, '
+            'bytes = bytes + COALESCE(LENGTH(NEW.value), 0); END'
+        ),
+        'delete': (
+            f'AFTER DELETE ON {table_name} BEGIN UPDATE {totals} SET '
+            f'entries = entries - {entry}, '
+            'bytes = bytes - COALESCE(LENGTH(OLD.value), 0); END'
+        ),
+        'update': (
+            f'AFTER UPDATE OF value ON {table_name} BEGIN UPDATE {totals} SET '
+            'bytes = bytes - COALESCE(LENGTH(OLD.value), 0) '
+            '+ COALESCE(LENGTH(NEW.value), 0); END'
+        ),
+    }
+    return [
+        (
+            f'{table_name}_totals_{event}',
+            f'CREATE TRIGGER IF NOT EXISTS {table_name}_totals_{event} '
+            f'{statement}',
+        )
+        for event, statement in statements.items()
+    ]
+
+__all__ = [
+    'EVICTION_POLICY_LFU',
+    'EVICTION_POLICY_LRU',
+    'EVICTION_POLICIES',
+
+    'CacheEvictor',
+    'CacheUsage',
+    'CompactionInfo',
+]
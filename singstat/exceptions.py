@@ -16,7 +16,7 @@
 
 from typing import Any
 
-from typeguard import typechecked
+from .typechecking import typechecked
 
 ERRORS_MESSAGE = 'Inspect the "errors" attribute for error details.'
 DATA_MESSAGE = 'Inspect the "data" attribute for the response data.'
@@ -0,0 +1,561 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache of sanitised results, which is kept next to the cache of HTTP \
+    responses."""
+
+import pickle
+from collections import OrderedDict
+from functools import partial
+from hashlib import sha256
+from threading import Lock
+from time import time
+from typing import Any, NamedTuple
+
+from requests_cache import BaseCache
+from requests_cache.backends.sqlite import SQLiteDict
+from requests_cache.serializers import Stage
+
+from .constants import MEMORY_CACHE_BYTES, RESULT_CACHE_TABLE_NAME
+from .typechecking import typechecked
+from .version import VERSION
+
+# Results are pickled with the highest protocol, which is fast and keeps
+# dates, datetimes and tuples as-is.
+RESULT_SERIALIZER = Stage(
+    pickle,
+    dumps=partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL),
+)
+
+class CachedResult(NamedTuple):
+    """Sanitised result of a request, and the expiry of the HTTP response \
+        that it was sanitised from."""
+
+    value: Any
+    expires_unix: int | None
+
+class CacheInfo(NamedTuple):
+    """Statistics of a tier of the cache of sanitised results."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    maxbytes: int | None
+    currbytes: int | None
+
+class MemoryCache:
+    """Bounded in-memory cache of results, which evicts the least recently \
+        used results first.
+
+    Results are kept pickled, so that each read returns a new copy, and so \
+        that their sizes in bytes are known.
+
+    :param maxsize: Maximum number of results.
+    :type maxsize: int
+
+    :param maxbytes: Maximum total size of the pickled results, in bytes. \
+        Results that are bigger than this are not kept.
+    :type maxbytes: int
+
+    :raises ValueError: ``maxsize`` or ``maxbytes`` is less than 1.
+    """
+
+    @typechecked
+    def __init__(self, maxsize: int, maxbytes: int) -> None:
+        """Constructor method"""
+        if maxsize < 1:
+            raise ValueError('argument "maxsize" must be 1 or greater.')
+        if maxbytes < 1:
+            raise ValueError('argument "maxbytes" must be 1 or greater.')
+
+        self.__maxsize = maxsize
+        self.__maxbytes = maxbytes
+
+        self.__results: OrderedDict[str, tuple[bytes, int | None]] = \
+            OrderedDict()
+        self.__currbytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = Lock()
+
+    @typechecked
+    def __len__(self) -> int:
+        """Number of results in the cache"""
+        return len(self.__results)
+
+    @typechecked
+    def get(self, key: str) -> CachedResult | None:
+        """Return a result from the cache, if it has not expired.
+
+        :param key: Key of the result.
+        :type key: str
+
+        :return: The result, or ``None`` if it is not in the cache or has \
+            expired.
+        :rtype: CachedResult or None
+        """
+        with self.__lock:
+            item = self.__results.get(key)
+            if item is not None and item[1] is not None and item[1] <= time():
+                self.__pop(key)
+                item = None
+
+            if item is None:
+                self.__misses += 1
+                return None
+
+            self.__results.move_to_end(key)
+            self.__hits += 1
+
+        return CachedResult(RESULT_SERIALIZER.loads(item[0]), item[1])
+
+    @typechecked
+    def save(self, key: str, result: CachedResult) -> bool:
+        """Save a result in the cache, evicting the least recently used \
+            results if the cache is full.
+
+        :param key: Key of the result.
+        :type key: str
+
+        :param result: The result.
+        :type result: CachedResult
+
+        :return: ``True`` if the result was saved, i.e. it is not bigger than \
+            ``maxbytes``.
+        :rtype: bool
+        """
+        value = RESULT_SERIALIZER.dumps(result.value)
+
+        with self.__lock:
+            self.__pop(key)
+            if len(value) > self.__maxbytes:
+                return False
+
+            self.__results[key] = (value, result.expires_unix)
+            self.__currbytes += len(value)
+
+            while len(self.__results) > self.__maxsize \
+                or self.__currbytes > self.__maxbytes:
+                self.__pop(next(iter(self.__results)))
+
+        return True
+
+    @typechecked
+    def delete_prefixes(self, *prefixes: str) -> int:
+        """Delete the results whose keys start with any of the prefixes.
+
+        :param prefixes: Prefixes of the keys.
+        :type prefixes: str
+
+        :return: Number of results that were deleted.
+        :rtype: int
+        """
+        with self.__lock:
+            keys = [
+                key for key in self.__results if key.startswith(prefixes)
+            ] if prefixes else []
+            for key in keys:
+                self.__pop(key)
+
+        return len(keys)
+
+    @typechecked
+    def clear(self) -> None:
+        """Delete all of the results and reset the statistics."""
+        with self.__lock:
+            self.__results.clear()
+            self.__currbytes = 0
+            self.__hits = 0
+            self.__misses = 0
+
+    @typechecked
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the cache.
+
+        :return: Statistics of the cache.
+        :rtype: CacheInfo
+        """
+        with self.__lock:
+            return CacheInfo(
+                hits=self.__hits,
+                misses=self.__misses,
+                maxsize=self.__maxsize,
+                currsize=len(self.__results),
+                maxbytes=self.__maxbytes,
+                currbytes=self.__currbytes,
+            )
+
+# private
+
+    @typechecked
+    def __pop(self, key: str) -> None:
+        """Delete a result, if it is in the cache. The lock must be held."""
+        item = self.__results.pop(key, None)
+        if item is not None:
+            self.__currbytes -= len(item[0])
+
+class ResultCache:
+    """Cache of sanitised results, so that cached responses do not have to be \
+        decoded and sanitised again.
+
+    A result is only kept for as long as the HTTP response that it was \
+        sanitised from: it is a miss when that response is expired, deleted \
+        or replaced in the HTTP cache.
+
+    If the HTTP cache is a SQLite cache, then the results are kept in a \
+        table of the same database. Otherwise, they are kept in memory.
+
+    **Memory tier**
+
+    With ``memory_size`` greater than 0, the most recently used results are \
+        also kept in a ``MemoryCache`` in front of the cache above, so that \
+        they are read without a database query. A result in the memory tier \
+        is used until its response expires, without checking whether the \
+        response is still in the HTTP cache, so call ``delete()`` or \
+        ``clear()`` after deleting responses from the HTTP cache.
+
+    :param http_cache: Cache backend of the HTTP responses.
+    :type http_cache: BaseCache
+
+    :param memory_size: Maximum number of results in the memory tier. Set \
+        to ``0`` to disable the memory tier. Defaults to ``0``.
+    :type memory_size: int
+
+    :param memory_bytes: Maximum total size of the results in the memory \
+        tier, in bytes. Defaults to 64 MiB.
+    :type memory_bytes: int
+
+    :raises ValueError: ``memory_size`` is less than 0.
+    :raises ValueError: ``memory_bytes`` is less than 1.
+    """
+
+    @typechecked
+    def __init__(
+        self,
+        http_cache: BaseCache,
+        memory_size: int=0,
+        memory_bytes: int=MEMORY_CACHE_BYTES,
+    ) -> None:
+        """Constructor method"""
+        if memory_size < 0:
+            raise ValueError('argument "memory_size" must be 0 or greater.')
+        if memory_bytes < 1:
+            raise ValueError('argument "memory_bytes" must be 1 or greater.')
+
+        self.__http_cache = http_cache
+
+        self.__memory = MemoryCache(memory_size, memory_bytes) \
+            if memory_size > 0 else None
+        self.__hits = 0
+        self.__misses = 0
+        self.__stats_lock = Lock()
+
+        responses = http_cache.responses
+        if isinstance(responses, SQLiteDict):
+            self.__results = SQLiteDict(
+                responses.db_path,
+                table_name=RESULT_CACHE_TABLE_NAME,
+                # Share the lock of the HTTP responses, in the same way as
+                # requests-cache does for its redirects.
+                lock=responses._lock, # pylint: disable=protected-access
+                serializer=RESULT_SERIALIZER,
+                busy_timeout=responses.busy_timeout,
+                wal=responses.wal,
+                **responses.connection_kwargs,
+            )
+        else:
+            self.__results = SQLiteDict(
+                ':memory:',
+                table_name=RESULT_CACHE_TABLE_NAME,
+                serializer=RESULT_SERIALIZER,
+            )
+
+    @typechecked
+    def __len__(self) -> int:
+        """Number of results in the cache, including those that are stale"""
+        return len(self.__results)
+
+    @typechecked
+    def create_key(
+        self,
+        http_key: str,
+        sanitise: bool,
+        sanitise_ignore_keys: list[str] | None,
+        sanitise_schema: Any,
+    ) -> str:
+        """Return the key of a result in the cache.
+
+        The key depends on the request, the sanitise options and the version \
+            of this package, so that results from older versions are not used. \
+            It starts with ``http_key`` and ``":"``, so that the results of a \
+            response can be found from its key in the HTTP cache.
+
+        :param http_key: Key of the request in the HTTP cache, which depends \
+            on its URL and parameters.
+        :type http_key: str
+
+        :param sanitise: Whether the result is sanitised.
+        :type sanitise: bool
+
+        :param sanitise_ignore_keys: Keys that were ignored when sanitising.
+        :type sanitise_ignore_keys: list[str] or None
+
+        :param sanitise_schema: Type definition that was used when sanitising.
+        :type sanitise_schema: Any
+
+        :return: The cache key.
+        :rtype: str
+        """
+        key = repr((
+            VERSION,
+            http_key,
+            sanitise,
+            tuple(sanitise_ignore_keys or ()),
+            sanitise_schema,
+        ))
+        return f'{http_key}:{sha256(key.encode('utf-8')).hexdigest()}'
+
+    @typechecked
+    def get(self, key: str, http_key: str) -> CachedResult | None:
+        """Return a result from the cache, if it is still fresh.
+
+        :param key: Key of the result, from ``create_key()``.
+        :type key: str
+
+        :param http_key: Key of the request in the HTTP cache.
+        :type http_key: str
+
+        :return: The result, or ``None`` if it is not in the cache or is stale.
+        :rtype: CachedResult or None
+        """
+        if self.__memory is not None:
+            result = self.__memory.get(key)
+            if result is not None:
+                return result
+
+        result = self.__get(key, http_key)
+        with self.__stats_lock:
+            if result is None:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+        if result is None:
+            return None
+
+        if self.__memory is not None:
+            _ = self.__memory.save(key, result)
+
+        return result
+
+    @typechecked
+    def save(self, key: str, http_key: str, value: Any) -> bool:
+        """Save a result in the cache, if its HTTP response is in the HTTP \
+            cache.
+
+        :param key: Key of the result, from ``create_key()``.
+        :type key: str
+
+        :param http_key: Key of the request in the HTTP cache.
+        :type http_key: str
+
+        :param value: The sanitised result.
+        :type value: Any
+
+        :return: ``True`` if the result was saved.
+        :rtype: bool
+        """
+        is_cached, expires_unix = self.__get_http_expiry(http_key)
+        if not is_cached:
+            return False
+
+        result = CachedResult(value, expires_unix)
+        self.__results[key] = result
+        if self.__memory is not None:
+            _ = self.__memory.save(key, result)
+
+        return True
+
+    @typechecked
+    def clear(self) -> None:
+        """Delete all of the results, from all of the tiers, and reset the \
+            statistics."""
+        self.__results.clear()
+        with self.__stats_lock:
+            self.__hits = 0
+            self.__misses = 0
+        if self.__memory is not None:
+            self.__memory.clear()
+
+    @typechecked
+    def close(self) -> None:
+        """Close the database of the results, unless it is in memory, i.e. \
+            the HTTP cache is not a SQLite cache. Closing it would delete \
+            the results, whereas the responses of such caches are kept."""
+        if self.__results.db_path != ':memory:':
+            self.__results.close()
+
+    @typechecked
+    def delete(self, *http_keys: str) -> int:
+        """Delete the results of responses from all of the tiers, e.g. after \
+            the responses are deleted from the HTTP cache.
+
+        :param http_keys: Keys of the responses in the HTTP cache.
+        :type http_keys: str
+
+        :return: Number of results that were deleted from the persistent tier.
+        :rtype: int
+        """
+        count = 0
+        with self.__results.connection(commit=True) as con:
+            for http_key in http_keys:
+                # ``";"`` follows ``":"``, so this is every key that starts
+                # with the response's key and ``":"``, as an index range.
+                cur = con.execute(
+                    f'DELETE FROM {self.__results.table_name} '
+                    'WHERE key > ? AND key < ?',
+                    (f'{http_key}:', f'{http_key};'),
+                )
+                count += cur.rowcount
+                cur.close()
+
+        if self.__memory is not None:
+            _ = self.__memory.delete_prefixes(
+                *(f'{http_key}:' for http_key in http_keys),
+            )
+
+        return count
+
+    @typechecked
+    def delete_expired(self) -> int:
+        """Delete the results whose responses have expired from the \
+            persistent tier.
+
+        :return: Number of results that were deleted.
+        :rtype: int
+        """
+        with self.__results.connection(commit=True) as con:
+            cur = con.execute(
+                f'DELETE FROM {self.__results.table_name} WHERE expires <= ?',
+                (round(time()),),
+            )
+            count = cur.rowcount
+            cur.close()
+
+        return count
+
+    @typechecked
+    def cache_info(self) -> dict[str, CacheInfo]:
+        """Return the statistics of each tier of the cache, to help with \
+            sizing the memory tier.
+
+        A read that misses the ``"memory"`` tier is counted in the \
+            ``"persistent"`` tier too.
+
+        :return: Statistics of the ``"memory"`` tier, if it is enabled, and \
+            of the ``"persistent"`` tier.
+        :rtype: dict[str, CacheInfo]
+        """
+        info = {}
+        if self.__memory is not None:
+            info['memory'] = self.__memory.cache_info()
+        info['persistent'] = CacheInfo(
+            hits=self.__hits,
+            misses=self.__misses,
+            maxsize=None,
+            currsize=len(self.__results),
+            maxbytes=None,
+            currbytes=None,
+        )
+        return info
+
+# private
+
+    @typechecked
+    def __get(self, key: str, http_key: str) -> CachedResult | None:
+        """Return a result from the persistent tier, if it is still fresh.
+
+        :param key: Key of the result.
+        :type key: str
+
+        :param http_key: Key of the request in the HTTP cache.
+        :type http_key: str
+
+        :return: The result, or ``None`` if it is not in the tier or is stale.
+        :rtype: CachedResult or None
+        """
+        try:
+            result = self.__results[key]
+        except KeyError:
+            return None
+
+        # The result cannot be loaded, e.g. it was saved by a different
+        # version of Python.
+        if result is None:
+            return None
+
+        if result.expires_unix is not None and result.expires_unix <= time():
+            return None
+
+        is_cached, expires_unix = self.__get_http_expiry(http_key)
+        if not is_cached or expires_unix != result.expires_unix:
+            return None
+
+        return result
+
+    @typechecked
+    def __get_http_expiry(self, http_key: str) -> tuple[bool, int | None]:
+        """Return whether a response is in the HTTP cache, and when it \
+            expires.
+
+        For a SQLite cache, only the expiry column of the response is read, \
+            so that the response does not have to be loaded.
+
+        :param http_key: Key of the request in the HTTP cache.
+        :type http_key: str
+
+        :return: Whether the response is cached, and its expiry as a Unix \
+            timestamp. The expiry is ``None`` if the response never expires, \
+            or if the HTTP cache is not a SQLite cache.
+        :rtype: tuple[bool, int or None]
+        """
+        responses = self.__http_cache.responses
+        if not isinstance(responses, SQLiteDict):
+            response = self.__http_cache.get_response(http_key)
+            if response is None:
+                return False, None
+            return True, response.expires_unix
+
+        with responses.connection() as con:
+            # Keys are hex digests, so they are safe to format into the
+            # statement in the same way as requests-cache does.
+            cur = con.execute(
+                f'SELECT expires FROM {responses.table_name} '
+                f"WHERE key='{http_key}'"
+            )
+            row = cur.fetchone()
+            cur.close()
+
+        if row is None:
+            return False, None
+        return True, row[0]
+
+__all__ = [
+    'RESULT_SERIALIZER',
+
+    'CacheInfo',
+    'CachedResult',
+    'MemoryCache',
+    'ResultCache',
+]
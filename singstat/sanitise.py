@@ -0,0 +1,637 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sanitise the values in API responses.
+
+The functions here run once for every node of a response, so they are not \
+    wrapped in ``@typechecked``. Type checks happen once, at the public \
+    methods that call into them.
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import date
+from functools import lru_cache
+from re import findall
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    Callable,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
+
+from .timezone import datetime_from_string
+
+KEY_PATH_LIST_SEGMENT = '[]'
+
+class SanitisePlan:
+    """Compiled plan of how to sanitise a response.
+
+    Each node corresponds to one segment of a key path, e.g. ``"Data"``, \
+        ``"row"`` and ``"[]"`` in ``"Data.row[]"``. Walking the plan \
+        alongside the response avoids building key path strings for every \
+        node in the response.
+
+    A node may have a ``convert`` function for the strings at its key path, \
+        e.g. when the response's type definition declares the type of the \
+        value there. If it does not, the strings are sanitised by guessing \
+        their types.
+    """
+
+    __slots__ = ('children', 'items', 'ignore', 'convert')
+
+    children: dict[str, 'SanitisePlan']
+    items: 'SanitisePlan | None'
+    ignore: bool
+    convert: Callable[[str], Any] | None
+
+    def __init__(self) -> None:
+        """Constructor method"""
+        self.children = {}
+        self.items = None
+        self.ignore = False
+        self.convert = None
+
+    def copy(self) -> 'SanitisePlan':
+        """Return a shallow copy of this node.
+
+        :return: The copy, which shares its child nodes with this node.
+        :rtype: SanitisePlan
+        """
+        node = SanitisePlan()
+        node.children = dict(self.children)
+        node.items = self.items
+        node.ignore = self.ignore
+        node.convert = self.convert
+        return node
+
+    def descend(self, key_path: str) -> 'SanitisePlan | None':
+        """Return the plan node at a key path, relative to this node.
+
+        :param key_path: Key path to descend to, e.g. ``"Data.row[]"``.
+        :type key_path: str
+
+        :return: The plan node, or ``None`` if no key path in the plan \
+            starts with ``key_path``.
+        :rtype: SanitisePlan or None
+        """
+        node: SanitisePlan | None = self
+        for segment in split_key_path(key_path):
+            if node is None:
+                break
+            if segment == KEY_PATH_LIST_SEGMENT:
+                node = node.items
+            else:
+                node = node.children.get(segment)
+        return node
+
+def split_key_path(key_path: str) -> list[str]:
+    """Split a key path into its segments.
+
+    :example: ``"Data.row[].columns[].key"`` is split into \
+        ``["Data", "row", "[]", "columns", "[]", "key"]``.
+
+    :param key_path: Key path to split.
+    :type key_path: str
+
+    :return: Segments of the key path.
+    :rtype: list[str]
+    """
+    return findall(r'\[\]|[^.\[\]]+', key_path)
+
+@lru_cache(maxsize=64)
+def compile_plan(
+    ignore_keys: tuple[str, ...]=(),
+    schema: Any=None,
+) -> SanitisePlan:
+    """Compile a type definition and a list of key paths to ignore into a \
+        plan.
+
+    Plans are cached, so the same type definition and list of key paths are \
+        only compiled once.
+
+    :param ignore_keys: Key paths to ignore when sanitising.
+    :type ignore_keys: tuple[str, ...]
+
+    :param schema: Type definition of the value to sanitise, e.g. \
+        ``TabledataDict``. Defaults to ``None``, i.e. guess the types of \
+        all strings.
+    :type schema: Any
+
+    :return: The compiled plan.
+    :rtype: SanitisePlan
+    """
+    plan = _plan_for_types((schema,), {}) if schema is not None \
+        else SanitisePlan()
+    # Copy the nodes along each key path before changing them, because nodes
+    # of the type definitions may be shared by several key paths.
+    plan = plan.copy()
+    for key_path in ignore_keys:
+        node = plan
+        segments = split_key_path(key_path)
+        for segment in segments:
+            if segment == KEY_PATH_LIST_SEGMENT:
+                node.items = node.items.copy() if node.items is not None \
+                    else SanitisePlan()
+                node = node.items
+            else:
+                child = node.children.get(segment)
+                node.children[segment] = child.copy() if child is not None \
+                    else SanitisePlan()
+                node = node.children[segment]
+        # Only dict keys can be ignored, not list items.
+        if segments and segments[-1] != KEY_PATH_LIST_SEGMENT:
+            node.ignore = True
+    return plan
+
+def _keep_str(value: str) -> str:
+    """Leave a string that is declared as ``str`` as-is."""
+    return value
+
+def _to_int(value: str) -> Any:
+    """Convert a string that is declared as ``int``."""
+    try:
+        return int(value)
+    except ValueError:
+        return sanitise_value(value)
+
+def _to_number(value: str) -> Any:
+    """Convert a string that is declared as a number or a string, e.g. a \
+        data value, to a number, or leave it as-is, e.g. ``"na"``."""
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+def _to_date(value: str) -> Any:
+    """Convert a string that is declared as ``date``."""
+    try:
+        dt = datetime_from_string(value)
+    except ValueError:
+        return value
+    return dt if isinstance(dt, date) else value
+
+_SCHEMA_CONVERTERS: dict[Any, Callable[[str], Any]] = {
+    str: _keep_str,
+    int: _to_int,
+    date: _to_date,
+    frozenset({int, float, str}): _to_number,
+}
+
+def _flatten_types(types: tuple[Any, ...]) -> list[Any]:
+    """Return the members of unions in a list of types, without ``None``."""
+    flattened = []
+    for t in types:
+        if get_origin(t) in (Union, UnionType):
+            flattened.extend(_flatten_types(get_args(t)))
+        elif t is not None and t is not NoneType:
+            flattened.append(t)
+    return flattened
+
+def _plan_for_types(
+    types: tuple[Any, ...],
+    typeddict_plans: dict[frozenset, SanitisePlan],
+) -> SanitisePlan:
+    """Compile the plan node for a value that may be any of ``types``.
+
+    ``typeddict_plans`` holds the nodes that have been compiled for sets of \
+        ``TypedDict``, so that self-referencing type definitions end.
+    """
+    flattened = _flatten_types(types)
+    typeddicts = frozenset(t for t in flattened if is_typeddict(t))
+    list_item_types = tuple(
+        get_args(t)[0] if get_args(t) else Any
+        for t in flattened if get_origin(t) is list
+    )
+    scalar_types = {
+        t for t in flattened
+        if not is_typeddict(t) and get_origin(t) is not list
+    }
+
+    if typeddicts:
+        if typeddicts in typeddict_plans:
+            node = typeddict_plans[typeddicts]
+        else:
+            node = SanitisePlan()
+            typeddict_plans[typeddicts] = node
+            key_types: dict[str, list[Any]] = {}
+            for typeddict in typeddicts:
+                for k, t in get_type_hints(typeddict).items():
+                    key_types.setdefault(k, []).append(t)
+            for k, k_types in key_types.items():
+                node.children[k] = _plan_for_types(
+                    tuple(k_types),
+                    typeddict_plans,
+                )
+        if list_item_types or scalar_types:
+            node = node.copy()
+    else:
+        node = SanitisePlan()
+
+    if list_item_types:
+        node.items = _plan_for_types(list_item_types, typeddict_plans)
+
+    if len(scalar_types) == 1:
+        node.convert = _SCHEMA_CONVERTERS.get(scalar_types.pop())
+    elif scalar_types:
+        node.convert = _SCHEMA_CONVERTERS.get(frozenset(scalar_types))
+
+    return node
+
+def sanitise_value(value: str) -> Any:
+    """Convert a string to the value that it represents.
+
+    - String with commas: convert to a tuple of numbers if all values are \
+        number-like.
+    - String that is like date or datetime: convert to ``datetime.date`` \
+        or ``datetime.datetime`` respectively.
+    - String that is number-like: convert to ``int`` or ``float`` \
+        appropriately.
+    - Finally: leave the value as-is.
+
+    :param value: String to convert.
+    :type value: str
+
+    :return: The converted value.
+    :rtype: Any
+    """
+    if ',' in value:
+        # Convert to tuple with numbers.
+        tuple_value = tuple(sanitise_value(v.strip()) for v in value.split(','))
+        values_are_int = all(isinstance(v, int) for v in tuple_value)
+        values_are_float = all(isinstance(v, float) for v in tuple_value)
+        if (values_are_int or values_are_float):
+            return tuple_value
+
+    try:
+        # pylint: disable=broad-exception-caught
+
+        # Convert to a date/datetime.
+        return datetime_from_string(value)
+    except Exception:
+        try:
+            # Convert to an integer
+            return int(value)
+        except Exception:
+            try:
+                # Convert to a float
+                return float(value)
+            except Exception:
+                pass
+
+    return value
+
+def sanitise_tree(
+    value: Any,
+    plan: SanitisePlan | None=None,
+    convert: Callable[[str], Any]=sanitise_value,
+    in_place: bool=False,
+) -> Any:
+    """Sanitise a value and, if it is a ``dict`` or ``list``, its contents.
+
+    The value is walked with an explicit stack instead of recursion. Unless \
+        ``in_place`` is ``True``, a new ``dict`` or ``list`` is built for \
+        every one in ``value``. Values at ignored key paths are kept as-is.
+
+    :param value: Value to sanitise.
+    :type value: Any
+
+    :param plan: Plan for sanitising ``value``. Defaults to ``None``, i.e. do \
+        not ignore any key and guess the types of all strings.
+    :type plan: SanitisePlan or None
+
+    :param convert: Function to convert each string in ``value`` whose type \
+        is not in ``plan``. Defaults to ``sanitise_value()``.
+    :type convert: Callable[[str], Any]
+
+    :param in_place: If ``True``, then the strings in ``value`` are replaced \
+        with their sanitised values, instead of copying ``value``. Use this \
+        only when nothing else holds ``value``, e.g. when it has just been \
+        decoded from a response. Defaults to ``False``.
+    :type in_place: bool
+
+    :return: The sanitised value.
+    :rtype: Any
+    """
+    if isinstance(value, str):
+        return plan.convert(value) \
+            if plan is not None and plan.convert is not None \
+            else convert(value)
+    if not isinstance(value, (dict, list)):
+        return value
+
+    if in_place:
+        _sanitise_tree_in_place(value, plan, convert)
+        return value
+
+    sanitised = {} if isinstance(value, dict) else []
+    stack: list[tuple[Any, Any, SanitisePlan | None]] = [
+        (value, sanitised, plan),
+    ]
+    while stack:
+        source, target, node = stack.pop()
+
+        if isinstance(source, dict):
+            children = node.children if node is not None else None
+            for k, v in source.items():
+                child = children.get(k) if children else None
+                if child is not None and child.ignore:
+                    target[k] = v
+                elif isinstance(v, str):
+                    target[k] = child.convert(v) \
+                        if child is not None and child.convert is not None \
+                        else convert(v)
+                elif isinstance(v, dict):
+                    target[k] = {}
+                    stack.append((v, target[k], child))
+                elif isinstance(v, list):
+                    target[k] = []
+                    stack.append((v, target[k], child))
+                else:
+                    target[k] = v
+        else:
+            child = node.items if node is not None else None
+            convert_item = child.convert \
+                if child is not None and child.convert is not None \
+                else convert
+            append = target.append
+            for v in source:
+                if isinstance(v, str):
+                    append(convert_item(v))
+                elif isinstance(v, dict):
+                    append({})
+                    stack.append((v, target[-1], child))
+                elif isinstance(v, list):
+                    append([])
+                    stack.append((v, target[-1], child))
+                else:
+                    append(v)
+
+    return sanitised
+
+def _sanitise_tree_in_place(
+    value: dict | list,
+    plan: SanitisePlan | None,
+    convert: Callable[[str], Any],
+) -> None:
+    """Replace the strings in a ``dict`` or ``list`` with their sanitised \
+        values, like ``sanitise_tree()`` but without copying."""
+    stack: list[tuple[Any, SanitisePlan | None]] = [(value, plan)]
+    while stack:
+        source, node = stack.pop()
+
+        if isinstance(source, dict):
+            children = node.children if node is not None else None
+            for k, v in source.items():
+                child = children.get(k) if children else None
+                if child is not None and child.ignore:
+                    continue
+                if isinstance(v, str):
+                    # Replacing the value of an existing key does not change
+                    # the size of the dict, so it is safe while iterating.
+                    source[k] = child.convert(v) \
+                        if child is not None and child.convert is not None \
+                        else convert(v)
+                elif isinstance(v, (dict, list)):
+                    stack.append((v, child))
+        else:
+            child = node.items if node is not None else None
+            convert_item = child.convert \
+                if child is not None and child.convert is not None \
+                else convert
+            for i, v in enumerate(source):
+                if isinstance(v, str):
+                    source[i] = convert_item(v)
+                elif isinstance(v, (dict, list)):
+                    stack.append((v, child))
+
+class SanitisedMapping(Mapping):
+    """Read-only view of a ``dict`` whose values are sanitised only when \
+        they are read.
+
+    Each sanitised value is kept, so it is only sanitised once. Values that \
+        are ``dict`` or ``list`` are returned as ``SanitisedMapping`` or \
+        ``SanitisedSequence`` respectively.
+
+    :param source: The ``dict`` to sanitise. It must not be changed while \
+        the view is in use.
+    :type source: dict
+
+    :param plan: Plan for sanitising ``source``.
+    :type plan: SanitisePlan or None
+
+    :param convert: Function to convert each string whose type is not in \
+        ``plan``.
+    :type convert: Callable[[str], Any]
+    """
+
+    __slots__ = ('_source', '_plan', '_convert', '_sanitised')
+
+    def __init__(
+        self,
+        source: dict,
+        plan: SanitisePlan | None,
+        convert: Callable[[str], Any],
+    ) -> None:
+        """Constructor method"""
+        self._source = source
+        self._plan = plan
+        self._convert = convert
+        self._sanitised: dict = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        """Return the sanitised value of a key."""
+        try:
+            return self._sanitised[key]
+        except KeyError:
+            pass
+
+        value = self._source[key]
+        child = self._plan.children.get(key) if self._plan is not None \
+            else None
+        if child is None or not child.ignore:
+            value = _sanitise_lazily(value, child, self._convert)
+        self._sanitised[key] = value
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        """Return whether the ``dict`` has a key."""
+        return key in self._source
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the keys of the ``dict``."""
+        return iter(self._source)
+
+    def __len__(self) -> int:
+        """Return the number of keys in the ``dict``."""
+        return len(self._source)
+
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}({self._source!r})'
+
+    def to_dict(self) -> dict:
+        """Return the whole ``dict`` sanitised, i.e. as ``sanitise_tree()`` \
+            would have returned it.
+
+        :return: The sanitised ``dict``.
+        :rtype: dict
+        """
+        return sanitise_tree(self._source, self._plan, self._convert)
+
+class SanitisedSequence(Sequence):
+    """Read-only view of a ``list`` whose items are sanitised only when \
+        they are read.
+
+    Each sanitised item is kept, so it is only sanitised once. Items that \
+        are ``dict`` or ``list`` are returned as ``SanitisedMapping`` or \
+        ``SanitisedSequence`` respectively.
+
+    :param source: The ``list`` to sanitise. It must not be changed while \
+        the view is in use.
+    :type source: list
+
+    :param plan: Plan for sanitising ``source``.
+    :type plan: SanitisePlan or None
+
+    :param convert: Function to convert each string whose type is not in \
+        ``plan``.
+    :type convert: Callable[[str], Any]
+    """
+
+    __slots__ = ('_source', '_plan', '_convert', '_sanitised')
+
+    def __init__(
+        self,
+        source: list,
+        plan: SanitisePlan | None,
+        convert: Callable[[str], Any],
+    ) -> None:
+        """Constructor method"""
+        self._source = source
+        self._plan = plan
+        self._convert = convert
+        self._sanitised: list | None = None
+
+    def __getitem__(self, index: Any) -> Any:
+        """Return the sanitised item at an index, or a list of the \
+            sanitised items in a slice."""
+        if isinstance(index, slice):
+            return [
+                self[i] for i in range(*index.indices(len(self._source)))
+            ]
+
+        if self._sanitised is None:
+            self._sanitised = [_NOT_SANITISED] * len(self._source)
+        value = self._sanitised[index]
+        if value is _NOT_SANITISED:
+            item_plan = self._plan.items if self._plan is not None else None
+            value = _sanitise_lazily(
+                self._source[index],
+                item_plan,
+                self._convert,
+            )
+            self._sanitised[index] = value
+        return value
+
+    def __len__(self) -> int:
+        """Return the number of items in the ``list``."""
+        return len(self._source)
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare the sanitised items with those of another sequence."""
+        if not isinstance(other, (list, SanitisedSequence)):
+            return NotImplemented
+        return len(self) == len(other) \
+            and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """String representation"""
+        return f'{self.__class__.__name__}({self._source!r})'
+
+    def to_list(self) -> list:
+        """Return the whole ``list`` sanitised, i.e. as ``sanitise_tree()`` \
+            would have returned it.
+
+        :return: The sanitised ``list``.
+        :rtype: list
+        """
+        return sanitise_tree(self._source, self._plan, self._convert)
+
+_NOT_SANITISED = object()
+
+def _sanitise_lazily(
+    value: Any,
+    plan: SanitisePlan | None,
+    convert: Callable[[str], Any],
+) -> Any:
+    """Sanitise a string, or wrap a ``dict`` or ``list`` in a view."""
+    if isinstance(value, str):
+        return plan.convert(value) \
+            if plan is not None and plan.convert is not None \
+            else convert(value)
+    if isinstance(value, dict):
+        return SanitisedMapping(value, plan, convert)
+    if isinstance(value, list):
+        return SanitisedSequence(value, plan, convert)
+    return value
+
+def sanitise_view(
+    value: Any,
+    plan: SanitisePlan | None=None,
+    convert: Callable[[str], Any]=sanitise_value,
+) -> Any:
+    """Return a read-only view of a value that is sanitised only when it is \
+        read.
+
+    Unlike ``sanitise_tree()``, nothing is copied upfront, so reading a few \
+        values of a large response only sanitises those values.
+
+    :param value: Value to sanitise.
+    :type value: Any
+
+    :param plan: Plan for sanitising ``value``. Defaults to ``None``, i.e. do \
+        not ignore any key and guess the types of all strings.
+    :type plan: SanitisePlan or None
+
+    :param convert: Function to convert each string in ``value`` whose type \
+        is not in ``plan``. Defaults to ``sanitise_value()``.
+    :type convert: Callable[[str], Any]
+
+    :return: ``SanitisedMapping`` if ``value`` is a ``dict``, \
+        ``SanitisedSequence`` if it is a ``list``, or else the sanitised \
+        value.
+    :rtype: Any
+    """
+    return _sanitise_lazily(value, plan, convert)
+
+__all__ = [
+    'SanitisePlan',
+    'SanitisedMapping',
+    'SanitisedSequence',
+    'compile_plan',
+    'sanitise_tree',
+    'sanitise_value',
+    'sanitise_view',
+    'split_key_path',
+]
@@ -0,0 +1,223 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Management of a client's sessions and pools of threads."""
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, local
+from typing import Any
+from weakref import WeakSet
+
+from requests.adapters import HTTPAdapter, Retry
+from requests_cache import BaseCache, CachedSession
+
+from .constants import (
+    POOL_SIZE,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_FORCELIST,
+    RETRY_TOTAL,
+    USER_AGENT,
+)
+from .typechecking import typechecked
+
+class SessionManager:
+    """Sessions that send a client's requests, and the pools of threads of \
+        ``map_concurrently()``, whose threads have their own sessions.
+
+    Normally, it does not need to be created by applications. It is created \
+        by ``SingStat`` from the arguments of the same names, which are \
+        documented there.
+
+    :raises ValueError: ``pool_size`` is less than 1.
+    """
+
+    backend: BaseCache
+    thread_safe: bool
+
+    @typechecked
+    def __init__(
+        self,
+        backend: BaseCache,
+        *,
+        pool_size: int=POOL_SIZE,
+        thread_safe: bool=False,
+        stale_while_revalidate: int | None=None,
+        thread_name_prefix: str='SingStat',
+    ) -> None:
+        """Constructor method"""
+        if pool_size < 1:
+            raise ValueError('argument "pool_size" must be 1 or greater.')
+
+        self.backend = backend
+        self.thread_safe = thread_safe
+
+        self.__pool_size = pool_size
+        self.__stale_while_revalidate = stale_while_revalidate
+        self.__thread_name_prefix = thread_name_prefix
+
+        # The sessions that were created, so that ``close()`` can close them.
+        self.__sessions: WeakSet[CachedSession] = WeakSet()
+        self.__sessions_lock = Lock()
+
+        self.__session = self.create_session()
+        self.__thread_sessions = local()
+        self.__thread_sessions.session = self.__session
+
+        self.__executors: dict[int, ThreadPoolExecutor] = {}
+        self.__executors_lock = Lock()
+
+    @property
+    def session(self) -> CachedSession:
+        """Session of the client, or in thread-safe mode, and in the threads \
+            of the pools, the session of the current thread, which is \
+            created when the thread first uses it.
+
+        :return: The session.
+        :rtype: CachedSession
+        """
+        if not self.thread_safe and not self.is_worker():
+            return self.__session
+
+        session = getattr(self.__thread_sessions, 'session', None)
+        if session is None:
+            session = self.create_session()
+            self.__thread_sessions.session = session
+        return session
+
+    @session.setter
+    def session(self, session: CachedSession) -> None:
+        """Replace the session, or in thread-safe mode, the session of the \
+            current thread."""
+        if self.thread_safe:
+            self.__thread_sessions.session = session
+        else:
+            self.__session = session
+
+    @typechecked
+    def is_worker(self) -> bool:
+        """Return whether the current thread is a thread of the pools.
+
+        :return: ``True`` if it is a thread of the pools.
+        :rtype: bool
+        """
+        return getattr(self.__thread_sessions, 'is_worker', False)
+
+    @typechecked
+    def create_session(self) -> CachedSession:
+        """Create a session with connection retries, the shared cache \
+            backend and the headers.
+
+        :return: The session.
+        :rtype: CachedSession
+        """
+        headers = {
+            'Accept': 'application/json',
+            'User-Agent': USER_AGENT,
+        }
+
+        retries = Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=list(RETRY_STATUS_FORCELIST),
+        )
+
+        session = CachedSession(
+            backend=self.backend,
+            stale_if_error=False,
+            stale_while_revalidate=self.__stale_while_revalidate or False,
+        )
+        session.mount('https://', HTTPAdapter(
+            pool_connections=self.__pool_size,
+            pool_maxsize=self.__pool_size,
+            max_retries=retries,
+        ))
+        session.headers.update(headers)
+
+        with self.__sessions_lock:
+            self.__sessions.add(session)
+
+        return session
+
+    @typechecked
+    def map(
+        self,
+        function: Callable[[Any], Any],
+        iterable: Iterable[Any],
+        max_workers: int,
+    ) -> Iterator[Any]:
+        """Call a function with each item on the pool of ``max_workers`` \
+            threads, which is created if needed, or on the current thread if \
+            it is a thread of the pools. Refer to \
+            ``SingStat.map_concurrently()``.
+
+        :param function: Function to call with each item.
+        :type function: Callable[[Any], Any]
+
+        :param iterable: The items.
+        :type iterable: Iterable[Any]
+
+        :param max_workers: Maximum number of functions to call at the same \
+            time.
+        :type max_workers: int
+
+        :raises ValueError: ``max_workers`` is less than 1.
+
+        :return: Iterator of the results, in the order of the items.
+        :rtype: Iterator[Any]
+        """
+        if max_workers < 1:
+            raise ValueError('argument "max_workers" must be 1 or greater.')
+
+        # The pool would wait for its own threads.
+        if self.is_worker():
+            return map(function, iterable)
+
+        with self.__executors_lock:
+            executor = self.__executors.get(max_workers)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix=f'{self.__thread_name_prefix}-worker',
+                )
+                self.__executors[max_workers] = executor
+
+        def call(item: Any) -> Any:
+            # Sessions are not thread-safe, so each thread uses its own.
+            self.__thread_sessions.is_worker = True
+            return function(item)
+
+        return executor.map(call, iterable)
+
+    @typechecked
+    def close(self) -> None:
+        """Shut down the pools of threads, and close the sessions that were \
+            created and their connections."""
+        with self.__executors_lock:
+            executors = list(self.__executors.values())
+            self.__executors.clear()
+        # A thread of a pool cannot wait for its own pool to shut down.
+        wait = not self.is_worker()
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+        with self.__sessions_lock:
+            sessions = list(self.__sessions)
+            self.__sessions.clear()
+        for session in sessions:
+            session.close()
+
+__all__ = [
+    'SessionManager',
+]
@@ -14,20 +14,37 @@
 
 """Client mixin for interacting with all of the API endpoints."""
 
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
 from datetime import date, datetime
-from typing import Any
+from functools import lru_cache
+from threading import Lock
+from typing import Any, NamedTuple
 
+from requests import Request
 from requests import codes as requests_codes
-from requests.adapters import HTTPAdapter, Retry
 from requests_cache import BaseCache, CachedSession
-from typeguard import check_type, typechecked
 
+from .cache_manager import CacheManager
+from .compression import CompressionInfo
 from .constants import (
-    CACHE_NAME,
+    MEMORY_CACHE_BYTES,
+    POOL_SIZE,
+    SANITISE_CACHE_SIZE,
     USER_AGENT,
 )
+from .decoders import JSON_DECODER_JSON, get_json_decoder
+from .eviction import EVICTION_POLICY_LRU, CacheEvictor, CompactionInfo
 from .exceptions import APIError
-from .timezone import datetime_from_string
+from .result_cache import ResultCache
+from .sanitise import (
+    compile_plan,
+    sanitise_tree,
+    sanitise_value,
+    sanitise_view,
+)
+from .session_manager import SessionManager
+from .typechecking import check_type, set_fast_mode, typechecked
 from .types import Url
 
 class SingStat:
@@ -42,6 +59,32 @@ class SingStat:
         (Reference: https://stackoverflow.com/a/35504626.)
     - Cache (cache duration/expiry is set in ``send_request()``).
     - User-agent header.
+    - Bounded cache of strings that have been sanitised, because responses \
+        repeat the same strings, e.g. periods and units of measurement, \
+        many times.
+
+    **Thread-safe mode**
+
+    ``requests.Session`` is not guaranteed to be thread-safe, so by default \
+        a client should only be used by one thread at a time. With \
+        ``thread_safe=True``:
+
+    - Each thread that uses the client gets its own session, and so its own \
+        pool of connections, which is kept for the lifetime of the thread.
+    - All of the sessions share one cache backend. The ``"sqlite"`` backend \
+        is opened with write-ahead logging (WAL), so that reads do not wait \
+        for writes, and with a busy timeout. Writes are serialised by the \
+        backend.
+
+    Methods that send requests from many threads, e.g. \
+        ``Client.tabledata_all()``, do so with ``map_concurrently()``, whose \
+        threads always have their own sessions, whatever ``thread_safe`` is.
+
+    A client can be used as a context manager, which calls ``close()`` when \
+        it exits, to shut down its threads and close its connections and \
+        its cache.
+
+    The arguments after ``is_test_api`` are keyword-only.
 
     :param cache_backend: Cache backend name or instance to use. Refer to \
         https://requests-cache.readthedocs.io/en/stable/user_guide/backends.html \
@@ -52,42 +95,272 @@ class SingStat:
         ``True``, then ``isTestApi=true`` is added to the parameters when \
         calling ``send_request()``. Defaults to ``False``.
     :type is_test_api: bool
+
+    :param sanitise_cache_size: Maximum number of strings whose sanitised \
+        values are kept in the cache. Set to ``0`` to disable the cache. \
+        Defaults to ``4096``.
+    :type sanitise_cache_size: int
+
+    :param fast_mode: If ``True``, then runtime type checks of arguments and \
+        return values are skipped. If ``False``, then they are run. This \
+        applies to the **whole process**, not just this client. Fast mode \
+        may also be turned on with the ``SINGSTAT_FAST_MODE=1`` environment \
+        variable. Defaults to ``None``, i.e. leave the current mode as-is.
+    :type fast_mode: bool or None
+
+    :param lazy_sanitise: If ``True``, then ``send_request()`` returns \
+        read-only views of responses, whose values are sanitised only when \
+        they are read. Refer to ``sanitise_data()`` for more information. \
+        Defaults to ``False``.
+    :type lazy_sanitise: bool
+
+    :param json_decoder: Decoder of JSON responses, i.e. ``"json"``, \
+        ``"orjson"``, ``"msgspec"`` or ``"auto"``. ``"auto"`` uses ``orjson`` \
+        or ``msgspec`` if either is installed, else ``json``. The decoder is \
+        also used for responses that are read from the cache. Defaults to \
+        ``"json"``.
+    :type json_decoder: str
+
+    :param pool_size: Maximum number of connections to keep open to the \
+        API. Set it to at least the number of threads that use the client at \
+        the same time. Defaults to ``10``.
+    :type pool_size: int
+
+    :param thread_safe: If ``True``, then the client may be shared by many \
+        threads. Refer to "Thread-safe mode" above. Defaults to ``False``.
+    :type thread_safe: bool
+
+    :param single_flight: If ``True``, then identical requests that are \
+        sent by ``send_request()`` at the same time, e.g. from several \
+        threads, are sent only once. The other calls wait for that request \
+        and return **the same** sanitised result, so it must not be \
+        changed by the callers. Defaults to ``False``.
+    :type single_flight: bool
+
+    :param cache_results: If ``True``, then the sanitised results of cached \
+        responses are cached too, in ``result_cache``, so that they do not \
+        have to be decoded and sanitised again. A result is kept for as long \
+        as its response is in the cache. Results are not cached when \
+        ``lazy_sanitise`` is ``True``. Defaults to ``False``.
+    :type cache_results: bool
+
+    :param memory_cache_size: Maximum number of sanitised results that are \
+        also kept in memory, in front of ``result_cache``, so that the most \
+        recently used results are read without a database query. Can only \
+        be set if ``cache_results`` is ``True``. Set to ``0`` to disable. \
+        Refer to ``ResultCache`` for more information. Defaults to ``0``.
+    :type memory_cache_size: int
+
+    :param memory_cache_bytes: Maximum total size of the sanitised results \
+        that are kept in memory, in bytes. Can only be set if \
+        ``memory_cache_size`` is set. Defaults to 64 MiB.
+    :type memory_cache_bytes: int
+
+    :param cache_compression: Compression of cached responses, i.e. \
+        ``"gzip"`` or ``"zstd"``, which makes the cache several times \
+        smaller, because responses are large and repetitive. Responses that \
+        were cached without compression can still be read. Not used by the \
+        ``"memory"`` backend. To compress the responses of a backend \
+        instance, create it with ``compressed_serializer()`` instead. \
+        Defaults to ``None``, i.e. do not compress.
+    :type cache_compression: str or None
+
+    :param cache_compression_level: Level of ``cache_compression``. Defaults \
+        to ``None``, i.e. ``6`` for ``"gzip"`` and ``3`` for ``"zstd"``.
+    :type cache_compression_level: int or None
+
+    :param cache_max_bytes: Maximum total size of the cached responses, \
+        and of their sanitised results with ``cache_results``, in bytes. \
+        When a new response makes the cache bigger than this, responses and \
+        their results are evicted according to ``cache_eviction_policy``. Only \
+        used by the ``"sqlite"`` backend. Defaults to ``None``, i.e. no \
+        limit.
+    :type cache_max_bytes: int or None
+
+    :param cache_max_entries: Maximum number of cached responses. Only used \
+        by the ``"sqlite"`` backend. Defaults to ``None``, i.e. no limit.
+    :type cache_max_entries: int or None
+
+    :param cache_eviction_policy: Which responses to evict first when the \
+        cache is bigger than its limits, i.e. ``"lru"`` for the least \
+        recently used or ``"lfu"`` for the least frequently used. Defaults \
+        to ``"lru"``.
+    :type cache_eviction_policy: str
+
+    :param cache_compaction_interval: Number of seconds between compactions \
+        of the cache by ``compact_cache()``, which are run on a background \
+        thread until ``stop_compaction()`` or ``close()`` is called or the \
+        client is deleted. Defaults to ``None``, i.e. only compact the cache when \
+        ``compact_cache()`` is called.
+    :type cache_compaction_interval: int or None
+
+    :param stale_while_revalidate: Maximum number of seconds that a cached \
+        response may be used for after it has expired. Within that time, \
+        ``send_request()`` returns the expired response at once, and the \
+        request is sent again on a background thread to refresh the cache. \
+        Defaults to ``None``, i.e. wait for expired responses to be \
+        refreshed.
+    :type stale_while_revalidate: int or None
+
+    :param negative_cache_duration: Number of seconds to cache the \
+        responses that raise ``APIError``, i.e. those without data records \
+        and those with HTTP 400 status, so that requesting them again raises \
+        the same error without sending the request. Responses without data \
+        records are otherwise cached for as long as other responses, and \
+        responses with HTTP 400 status are not cached. Defaults to ``None``, \
+        i.e. do not cache them specially.
+    :type negative_cache_duration: int or None
+
+    :raises ValueError: ``sanitise_cache_size`` is less than 0.
+    :raises ValueError: ``pool_size`` is less than 1.
+    :raises ValueError: ``memory_cache_size`` is less than 0.
+    :raises ValueError: ``memory_cache_bytes`` is less than 1.
+    :raises ValueError: ``memory_cache_size`` is set and ``cache_results`` \
+        is ``False``, or ``memory_cache_bytes`` is set and \
+        ``memory_cache_size`` is ``0``.
+    :raises ValueError: ``json_decoder`` is not one of the decoders.
+    :raises ValueError: ``cache_compression`` is not one of the \
+        compressions, or ``cache_compression_level`` is not one of its levels.
+    :raises ValueError: ``cache_compression`` is set and ``cache_backend`` \
+        is a backend instance.
+    :raises ValueError: ``cache_max_bytes`` or ``cache_max_entries`` is set \
+        and the cache backend is not a SQLite cache.
+    :raises ValueError: ``cache_max_bytes``, ``cache_max_entries`` or \
+        ``cache_compaction_interval`` is less than 1.
+    :raises ValueError: ``stale_while_revalidate`` or \
+        ``negative_cache_duration`` is less than 1.
+    :raises ValueError: ``cache_eviction_policy`` is not one of the policies.
+    :raises ImportError: The package of ``json_decoder`` is not installed.
+    :raises ImportError: ``cache_compression`` is ``"zstd"`` and \
+        ``zstandard`` is not installed.
     """
 
     is_test_api: bool
+    lazy_sanitise: bool
+    json_decoder: str
+    thread_safe: bool
+    single_flight: bool
+    cache_manager: CacheManager
+    session_manager: SessionManager
+    result_cache: ResultCache | None
+    cache_evictor: CacheEvictor | None
+    stale_while_revalidate: int | None
+    negative_cache_duration: int | None
 
     @typechecked
     def __init__(
         self,
         cache_backend: str | BaseCache='sqlite',
         is_test_api: bool=False,
+        *,
+        sanitise_cache_size: int=SANITISE_CACHE_SIZE,
+        fast_mode: bool | None=None,
+        lazy_sanitise: bool=False,
+        json_decoder: str=JSON_DECODER_JSON,
+        pool_size: int=POOL_SIZE,
+        thread_safe: bool=False,
+        single_flight: bool=False,
+        cache_results: bool=False,
+        memory_cache_size: int=0,
+        memory_cache_bytes: int=MEMORY_CACHE_BYTES,
+        cache_compression: str | None=None,
+        cache_compression_level: int | None=None,
+        cache_max_bytes: int | None=None,
+        cache_max_entries: int | None=None,
+        cache_eviction_policy: str=EVICTION_POLICY_LRU,
+        cache_compaction_interval: int | None=None,
+        stale_while_revalidate: int | None=None,
+        negative_cache_duration: int | None=None,
     ) -> None:
         """Constructor method"""
-        headers = {
-            'Accept': 'application/json',
-            'User-Agent': USER_AGENT,
-        }
-        self.is_test_api = is_test_api
+        if fast_mode is not None:
+            set_fast_mode(fast_mode)
 
-        retries = Retry(
-            total=5,
-            backoff_factor=0.1,
-            status_forcelist=[500, 502, 503, 504]
+        if sanitise_cache_size < 0:
+            raise ValueError('argument "sanitise_cache_size" must be 0 or greater.')
+
+        if stale_while_revalidate is not None and stale_while_revalidate < 1:
+            raise ValueError(
+                'argument "stale_while_revalidate" must be 1 or greater.'
+            )
+
+        self.is_test_api = is_test_api
+        self.lazy_sanitise = lazy_sanitise
+        self.thread_safe = thread_safe
+        self.single_flight = single_flight
+        self.stale_while_revalidate = stale_while_revalidate
+
+        self.cache_manager = CacheManager(
+            cache_backend,
+            thread_safe=thread_safe,
+            cache_results=cache_results,
+            memory_cache_size=memory_cache_size,
+            memory_cache_bytes=memory_cache_bytes,
+            cache_compression=cache_compression,
+            cache_compression_level=cache_compression_level,
+            cache_max_bytes=cache_max_bytes,
+            cache_max_entries=cache_max_entries,
+            cache_eviction_policy=cache_eviction_policy,
+            negative_cache_duration=negative_cache_duration,
+        )
+        self.result_cache = self.cache_manager.result_cache
+        self.cache_evictor = self.cache_manager.evictor
+        self.negative_cache_duration = negative_cache_duration
+
+        self.session_manager = SessionManager(
+            self.cache_manager.backend,
+            pool_size=pool_size,
+            thread_safe=thread_safe,
+            stale_while_revalidate=stale_while_revalidate,
+            thread_name_prefix=self.__class__.__name__,
         )
 
-        self.session = CachedSession(
-            CACHE_NAME,
-            backend=cache_backend,
-            stale_if_error=False,
+        self.__in_flight: dict[tuple, Future] = {}
+        self.__in_flight_lock = Lock()
+
+        self.__sanitise_value = lru_cache(maxsize=sanitise_cache_size)(
+            sanitise_value,
         )
-        self.session.mount('https://', HTTPAdapter(max_retries=retries))
-        self.session.headers.update(headers)
+
+        self.json_decoder, self.__decode_json = get_json_decoder(json_decoder)
+
+        if cache_compaction_interval is not None:
+            self.cache_manager.start_compaction(self, cache_compaction_interval)
 
     @typechecked
     def __repr__(self) -> str:
         """String representation"""
         return f'{self.__class__} ({USER_AGENT})'
 
+    @typechecked
+    def __enter__(self) -> 'SingStat':
+        """Enter the context manager"""
+        return self
+
+    @typechecked
+    def __exit__(self, *args: Any) -> None:
+        """Exit the context manager"""
+        self.close()
+
+    @property
+    def session(self) -> CachedSession:
+        """Session that sends the requests.
+
+        In thread-safe mode, and in the threads of ``map_concurrently()``, \
+            this is the session of the current thread, which is created when \
+            the thread first uses the client.
+
+        :return: The session.
+        :rtype: CachedSession
+        """
+        return self.session_manager.session
+
+    @session.setter
+    def session(self, session: CachedSession) -> None:
+        """Replace the session, or in thread-safe mode, the session of the \
+            current thread."""
+        self.session_manager.session = session
+
     @typechecked
     def build_params(
         self,
@@ -166,11 +439,16 @@ class SingStat:
         iterate: bool=True,
         ignore_keys: list[str] | None=None,
         key_path: str='',
+        schema: Any=None,
+        lazy: bool=False,
+        in_place: bool=False,
     ) -> Any:
         """Convert the following:
 
         - If ``iterate`` is ``True`` and ``value`` is a ``dict`` or ``list``: \
             sanitise the value's contents.
+        - If ``schema`` declares the type of a value: convert the string to \
+            that type, e.g. leave it as-is when the type is ``str``.
         - String with commas: convert to a tuple of numbers if all values are \
             number-like.
         - String that is like date or datetime: convert to ``datetime.date`` \
@@ -194,73 +472,163 @@ class SingStat:
             blank string.
         :type key_path: str
 
+        :param schema: Type definition of ``value`` at the root key path, \
+            e.g. ``TabledataDict``. Strings whose types are not declared by \
+            ``schema`` are converted by guessing their types. Defaults to \
+            ``None``, i.e. guess the types of all strings.
+        :type schema: Any
+
+        :param lazy: If ``True`` and ``iterate`` is ``True``, then a \
+            read-only view of ``value`` is returned instead of a sanitised \
+            copy. A ``dict`` is returned as a ``SanitisedMapping`` and a \
+            ``list`` as a ``SanitisedSequence``, whose values are sanitised \
+            only when they are read. Call their ``to_dict()`` or \
+            ``to_list()`` method to get a sanitised copy. Defaults to \
+            ``False``.
+        :type lazy: bool
+
+        :param in_place: If ``True`` and ``iterate`` is ``True``, then the \
+            strings in ``value`` are replaced with their sanitised values \
+            instead of copying ``value``, which halves the memory needed for \
+            large values. Only use this when ``value`` is not needed \
+            afterwards. Ignored if ``lazy`` is ``True``. Defaults to \
+            ``False``.
+        :type in_place: bool
+
         :return: The sanitised value.
         :rtype: Any
         """
-        if ignore_keys is None:
-            ignore_keys = []
-
-        if iterate:
-            if isinstance(value, list):
-                return [
-                    self.sanitise_data(
-                        v,
-                        iterate=iterate,
-                        ignore_keys=ignore_keys,
-                        key_path=f'{key_path}[]'
-                    ) for v in value
-                ]
-
-            if isinstance(value, dict):
-                sanitised_dict = {}
-                for k, v in value.items():
-                    current_key_path = '.'.join([key_path, k]) \
-                        if key_path else k
-                    if current_key_path in ignore_keys:
-                        sanitised_dict[k] = v
-                    else:
-                        sanitised_dict[k] = self.sanitise_data(
-                            v,
-                            iterate=iterate,
-                            ignore_keys=ignore_keys,
-                            key_path=current_key_path,
-                        )
-                return sanitised_dict
-
-        if not isinstance(value, str):
-            return value
-
-        if ',' in value:
-            # Convert to tuple with numbers.
-            split_value = value.split(',')
-            tuple_value = tuple(
-                self.sanitise_data(
-                    v.strip(),
-                    iterate=False,
-                ) for v in split_value
+        if not iterate:
+            return self.__sanitise_value(value) \
+                if isinstance(value, str) else value
+
+        plan = compile_plan(tuple(ignore_keys or ()), schema)
+        if key_path:
+            plan = plan.descend(key_path)
+
+        if lazy:
+            return sanitise_view(
+                value,
+                plan=plan,
+                convert=self.__sanitise_value,
             )
-            values_are_int = all(isinstance(v, int) for v in tuple_value)
-            values_are_float = all(isinstance(v, float) for v in tuple_value)
-            if (values_are_int or values_are_float):
-                return tuple_value
+        return sanitise_tree(
+            value,
+            plan=plan,
+            convert=self.__sanitise_value,
+            in_place=in_place,
+        )
 
-        try:
-            # pylint: disable=broad-exception-caught
-
-            # Convert to a date/datetime.
-            return datetime_from_string(value)
-        except Exception:
-            try:
-                # Convert to an integer
-                return int(value)
-            except Exception:
-                try:
-                    # Convert to a float
-                    return float(value)
-                except Exception:
-                    pass
-
-        return value
+    @typechecked
+    def sanitise_cache_info(self) -> NamedTuple:
+        """Return the statistics of the cache of sanitised strings, to help \
+            with sizing the cache with ``sanitise_cache_size``.
+
+        :return: Named tuple with ``hits``, ``misses``, ``maxsize`` and \
+            ``currsize``, as returned by ``functools.lru_cache``.
+        :rtype: NamedTuple
+        """
+        return self.__sanitise_value.cache_info()
+
+    @typechecked
+    def sanitise_cache_clear(self) -> None:
+        """Clear the cache of sanitised strings and reset its statistics."""
+        self.__sanitise_value.cache_clear()
+
+    @typechecked
+    def cache_compression_info(self) -> CompressionInfo | None:
+        """Return the statistics of the responses that were compressed \
+            before they were saved in the cache, since the client was \
+            created.
+
+        :return: Named tuple with the ``compression``, its ``level``, the \
+            ``count`` of responses, their total ``uncompressed_bytes`` and \
+            ``compressed_bytes``, and the ``ratio`` of uncompressed to \
+            compressed bytes. ``None`` if the cached responses are not \
+            compressed.
+        :rtype: CompressionInfo or None
+        """
+        return self.cache_manager.compression_info()
+
+    @typechecked
+    def map_concurrently(
+        self,
+        function: Callable[[Any], Any],
+        iterable: Iterable[Any],
+        max_workers: int,
+    ) -> Iterator[Any]:
+        """Call a function with each item on a pool of threads, like \
+            ``ThreadPoolExecutor.map()``.
+
+        The pool is kept until the client is closed, one for each \
+            ``max_workers``, and each of its threads has its own session. So \
+            the sessions, and their connections, are reused by later calls.
+
+        When it is called on one of the threads of a pool, e.g. by a \
+            function that it calls, the function is called with each item \
+            on that thread, one after the other, so that the pool does not \
+            wait for its own threads.
+
+        :param function: Function to call with each item.
+        :type function: Callable[[Any], Any]
+
+        :param iterable: The items.
+        :type iterable: Iterable[Any]
+
+        :param max_workers: Maximum number of functions to call at the same \
+            time.
+        :type max_workers: int
+
+        :raises ValueError: ``max_workers`` is less than 1.
+
+        :return: Iterator of the results, in the order of the items. It \
+            raises the error of a call when the call's result is reached.
+        :rtype: Iterator[Any]
+        """
+        return self.session_manager.map(function, iterable, max_workers)
+
+    @typechecked
+    def close(self) -> None:
+        """Shut down the pools of ``map_concurrently()``, stop the \
+            compaction, save the recorded uses of the responses, and close \
+            the cache and the sessions that the client created.
+
+        It is called when a client that is used as a context manager exits. \
+            The client should not be used after it is closed.
+        """
+        self.session_manager.close()
+        self.cache_manager.close()
+
+    @typechecked
+    def compact_cache(self, vacuum: bool=True) -> CompactionInfo:
+        """Delete the expired responses from the cache, evict responses if \
+            the cache is bigger than its limits, and delete the sanitised \
+            results of expired responses from ``result_cache``.
+
+        Expired responses are otherwise kept in the cache until they are \
+            requested again, so the cache of a long-running client grows \
+            without bound.
+
+        :param vacuum: If ``True`` and the cache is a SQLite cache, then the \
+            database is vacuumed afterwards, to return the free space to the \
+            file system. Vacuuming rewrites the whole database and blocks \
+            the other users of the cache while it runs. Defaults to ``True``.
+        :type vacuum: bool
+
+        :return: Named tuple with the number of ``expired`` responses that \
+            were deleted, the number of responses that were ``evicted``, \
+            and the sizes of the SQLite database in bytes, \
+            ``bytes_before`` and ``bytes_after``. The sizes are ``0`` if the \
+            cache is not a SQLite cache.
+        :rtype: CompactionInfo
+        """
+        return self.cache_manager.compact(vacuum)
+
+    @typechecked
+    def stop_compaction(self) -> None:
+        """Stop compacting the cache on the background thread, if it was \
+            started with ``cache_compaction_interval``."""
+        self.cache_manager.stop_compaction()
 
     @typechecked
     def send_request(
@@ -270,6 +638,8 @@ class SingStat:
         cache_duration: int=0,
         sanitise: bool=True,
         sanitise_ignore_keys: list[str] | None=None,
+        sanitise_schema: Any=None,
+        force_refresh: bool=False,
     ) -> Any:
         """Send a request to an endpoint and return its response.
 
@@ -305,6 +675,17 @@ class SingStat:
             Defaults to ``[]``, i.e. empty ``list``.
         :type sanitise_ignore_keys: list[str] or None
 
+        :param sanitise_schema: Type definition of the response value, which \
+            is used to convert its strings to their declared types during \
+            sanitising. Defaults to ``None``, i.e. guess the types of all \
+            strings.
+        :type sanitise_schema: Any
+
+        :param force_refresh: If ``True``, then the request is sent to the \
+            endpoint even if its response is in the cache, and the cached \
+            response is replaced. Defaults to ``False``.
+        :type force_refresh: bool
+
         :raises APIError: "No data records returned." when count of data is 0.
         :raises APIError: "One or more validation errors occurred." when HTTP \
             400 status is returned.
@@ -313,7 +694,9 @@ class SingStat:
         :raises requests.exceptions.JSONDecodeError: Error occurred when \
             JSON-parsing the response.
 
-        :return: Response JSON content of the request.
+        :return: Response JSON content of the request. If the client had \
+            been instantiated with ``lazy_sanitise=True``, then this is a \
+            read-only view of the content.
         :rtype: Any
         """
         data: Any
@@ -325,38 +708,90 @@ class SingStat:
         if self.is_test_api:
             params['isTestApi'] = 'true'
 
-        response_val = self.__collect_response_value(
-            url,
-            params=params,
-            cache_duration=cache_duration,
+        if not self.single_flight:
+            return self.__send_request(
+                url,
+                params,
+                cache_duration,
+                sanitise,
+                sanitise_ignore_keys,
+                sanitise_schema,
+                force_refresh,
+            )
+
+        flight_key = (
+            self.create_cache_key(url, params),
+            sanitise,
+            tuple(sanitise_ignore_keys or ()),
+            sanitise_schema,
+            force_refresh,
         )
+        with self.__in_flight_lock:
+            future = self.__in_flight.get(flight_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self.__in_flight[flight_key] = future
+
+        if not is_leader:
+            # Wait for the identical request that is in flight, and return
+            # its result or raise its error.
+            return future.result()
 
-        data = self.sanitise_data(
-            response_val,
-            ignore_keys=sanitise_ignore_keys,
-        ) if sanitise else response_val
+        try:
+            data = self.__send_request(
+                url,
+                params,
+                cache_duration,
+                sanitise,
+                sanitise_ignore_keys,
+                sanitise_schema,
+                force_refresh,
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.__in_flight_lock:
+                del self.__in_flight[flight_key]
 
-        return data
+        future.set_result(data)
 
-# private
+        return data
 
     @typechecked
-    def __collect_response_value(
+    def create_cache_key(
         self,
         url: Url,
-        params: dict,
-        cache_duration: int,
-    ) -> Any:
-        """Collect response value from an endpoint.
+        params: dict[str, Any] | None=None,
+    ) -> str:
+        """Return the key of a request in the cache.
 
-        :param url: The endpoint URL to send the request to.
+        :param url: The endpoint URL of the request.
         :type url: Url
 
-        :param params: List of parameters to be passed to the endpoint URL.
-        :type params: dict
+        :param params: List of parameters of the request, including \
+            ``isTestApi``, if any. Defaults to ``{}``, i.e. empty ``dict``.
+        :type params: dict[str, Any] or None
 
-        :param cache_duration: Number of seconds before the cache expires.
-        :type cache_duration: int
+        :return: The cache key.
+        :rtype: str
+        """
+        request = self.session.prepare_request(
+            Request('GET', url, params=params),
+        )
+        return self.session.cache.create_key(request)
+
+    @typechecked
+    def parse_response(self, response: Any) -> Any:
+        """Return the JSON content of a response, after checking that it has \
+            data.
+
+        Normally, this method does not need to be called directly. It is \
+            used by ``send_request()``.
+
+        :param response: The response from an endpoint.
+        :type response: requests.Response
 
         :raises APIError: "No data records returned." when count of data is 0.
         :raises APIError: "One or more validation errors occurred." when HTTP \
@@ -371,14 +806,9 @@ class SingStat:
         """
         response_value: Any
 
-        response = self.session.get(
-            url,
-            params=params,
-            expire_after=cache_duration,
-        )
-
         # This may raise JSONDecodeError if the response is not JSON-parsable.
-        response_json = response.json()
+        response_json = response.json() if self.__decode_json is None \
+            else self.__decode_json(response.content)
 
         if response.status_code == requests_codes['bad_request']:
             data = response_json.get('Data', {})
@@ -405,6 +835,130 @@ class SingStat:
 
         return response_value
 
+# private
+
+    @typechecked
+    def __send_request(
+        self,
+        url: Url,
+        params: dict[str, Any],
+        cache_duration: int,
+        sanitise: bool,
+        sanitise_ignore_keys: list[str] | None,
+        sanitise_schema: Any,
+        force_refresh: bool,
+    ) -> Any:
+        """Send a request to an endpoint and return its sanitised response.
+
+        Refer to ``send_request()`` for the parameters.
+
+        :return: Response JSON content of the request.
+        :rtype: Any
+        """
+        result_key = http_key = None
+        if self.result_cache is not None and not self.lazy_sanitise:
+            http_key = self.create_cache_key(url, params)
+            result_key = self.result_cache.create_key(
+                http_key,
+                sanitise,
+                sanitise_ignore_keys,
+                sanitise_schema,
+            )
+            result = None if force_refresh \
+                else self.result_cache.get(result_key, http_key)
+            if result is not None:
+                # The cached response is used, even though it is not read.
+                if cache_duration != 0:
+                    self.cache_manager.record_use(http_key)
+                return result.value
+
+        response_val, is_stale = self.__collect_response_value(
+            url,
+            params=params,
+            cache_duration=cache_duration,
+            force_refresh=force_refresh,
+        )
+
+        data = self.sanitise_data(
+            response_val,
+            ignore_keys=sanitise_ignore_keys,
+            schema=sanitise_schema,
+            lazy=self.lazy_sanitise,
+            # The response value was just decoded and is not used elsewhere.
+            in_place=True,
+        ) if sanitise else response_val
+
+        # A stale response may be replaced by the background refresh before
+        # the result is saved, which would keep the stale result as if it
+        # were fresh.
+        if result_key is not None and not is_stale:
+            _ = self.result_cache.save(result_key, http_key, data)
+
+        return data
+
+    @typechecked
+    def __collect_response_value(
+        self,
+        url: Url,
+        params: dict,
+        cache_duration: int,
+        force_refresh: bool=False,
+    ) -> tuple[Any, bool]:
+        """Collect response value from an endpoint.
+
+        :param url: The endpoint URL to send the request to.
+        :type url: Url
+
+        :param params: List of parameters to be passed to the endpoint URL.
+        :type params: dict
+
+        :param cache_duration: Number of seconds before the cache expires.
+        :type cache_duration: int
+
+        :param force_refresh: If ``True``, then the cached response, if any, \
+            is not used. Defaults to ``False``.
+        :type force_refresh: bool
+
+        :raises APIError: "No data records returned." when count of data is 0.
+        :raises APIError: "One or more validation errors occurred." when HTTP \
+            400 status is returned.
+        :raises requests.exceptions.HTTPError: Error occurred during the \
+            request process.
+        :raises requests.exceptions.JSONDecodeError: Error occurred when \
+            JSON-parsing the response.
+
+        :return: Results from the response, and whether the response is an \
+            expired response from the cache, which is being refreshed in the \
+            background because of ``stale_while_revalidate``.
+        :rtype: tuple[Any, bool]
+        """
+        response = self.session.get(
+            url,
+            params=params,
+            expire_after=cache_duration,
+            force_refresh=force_refresh,
+        )
+
+        if self.cache_evictor is not None and cache_duration != 0 \
+            and response.status_code == requests_codes['ok']:
+            self.cache_evictor.record_use(
+                response.cache_key,
+                is_new=not response.from_cache,
+            )
+
+        is_from_cache = getattr(response, 'from_cache', False) is True
+        is_stale = is_from_cache and response.is_expired
+
+        try:
+            response_value = self.parse_response(response)
+        except APIError:
+            if self.negative_cache_duration is not None \
+                and cache_duration != 0 and not is_from_cache:
+                self.cache_manager.save_negative_response(response)
+            raise
+
+        return response_value, is_stale
+
 __all__ = [
     'SingStat',
 ]
@@ -18,7 +18,9 @@ from datetime import date, datetime, time
 from re import fullmatch, match
 from zoneinfo import ZoneInfo
 
-from typeguard import typechecked
+from .typechecking import typechecked
+
+SGT_TIMEZONE = ZoneInfo('Asia/Singapore')
 
 ALLOWED_DATE_FORMATS = (
     '%Y-%m-%dT%H:%M:%S.%f%z',
@@ -44,6 +46,88 @@ ALLOWED_DATE_FORMATS = (
     '%H%M',
 )
 
+# Group the formats by the shape of the strings that they can match, so that
+# a string is only parsed with the formats of its group.
+_DATE_T_TIME_FORMATS = ALLOWED_DATE_FORMATS[0:4]
+_COMPACT_DATE_T_TIME_FORMATS = ALLOWED_DATE_FORMATS[4:8]
+_DATE_SPACE_TIME_FORMATS = ALLOWED_DATE_FORMATS[8:12]
+_TIME_FORMATS = ALLOWED_DATE_FORMATS[15:20]
+
+_CANDIDATE_DATE_FORMATS = {
+    (formats, has_fraction, has_timezone): tuple(
+        date_format for date_format in formats
+        if (has_fraction or '%f' not in date_format)
+        and (has_timezone or '%z' not in date_format)
+    )
+    for formats in (
+        _DATE_T_TIME_FORMATS,
+        _COMPACT_DATE_T_TIME_FORMATS,
+        _DATE_SPACE_TIME_FORMATS,
+        _TIME_FORMATS,
+    )
+    for has_fraction in (False, True)
+    for has_timezone in (False, True)
+}
+
+_DATE_FORMAT_RESULT_TYPES = {
+    date_format: time if match('%H:?%M', date_format) is not None \
+        else date if fullmatch('%Y-?%m-?%d', date_format) is not None \
+        or fullmatch('%d/%m/%Y', date_format) is not None \
+        else datetime
+    for date_format in ALLOWED_DATE_FORMATS
+}
+
+def candidate_date_formats(val: str) -> tuple[str, ...]:
+    """Return the allowed date formats that a string could match.
+
+    The formats are picked from the string's shape, e.g. whether it has a \
+        "/", a ":", or a "T" separator, without parsing it. Every format \
+        that could match the string is returned, in the same order as in \
+        ``ALLOWED_DATE_FORMATS``.
+
+    :param val: String to pick the date formats for.
+    :type val: str
+
+    :return: The candidate date formats. Empty if the string cannot be a \
+        datetime string.
+    :rtype: tuple[str, ...]
+    """
+    if len(val) < 4:
+        return ()
+    if '/' in val:
+        return ('%d/%m/%Y',)
+    if not val[0].isdigit():
+        return ()
+
+    has_date = val[:4].isdigit()
+    if ':' not in val:
+        if len(val) == 4:
+            return ('%H%M',)
+        if has_date:
+            return ('%Y-%m-%d',) if val[4] == '-' else ('%Y%m%d',)
+        return ()
+
+    if has_date:
+        has_t = 'T' in val or 't' in val
+        if val[4] == '-':
+            formats = _DATE_T_TIME_FORMATS if has_t \
+                else _DATE_SPACE_TIME_FORMATS
+            # Skip the hyphens of the date when looking for a timezone.
+            timezone_part = val[8:]
+        elif has_t:
+            formats = _COMPACT_DATE_T_TIME_FORMATS
+            timezone_part = val
+        else:
+            return ()
+    else:
+        formats = _TIME_FORMATS
+        timezone_part = val
+
+    has_fraction = '.' in val
+    has_timezone = '+' in timezone_part or '-' in timezone_part \
+        or 'Z' in timezone_part
+    return _CANDIDATE_DATE_FORMATS[(formats, has_fraction, has_timezone)]
+
 @typechecked
 def datetime_as_sgt(dt: datetime) -> datetime:
     """Update a datetime to use the SGT timezone and return the datetime.
@@ -54,7 +138,7 @@ def datetime_as_sgt(dt: datetime) -> datetime:
     :return: The datetime in SGT timezone.
     :rtype: datetime
     """
-    dt_sg: datetime = dt.replace(tzinfo=ZoneInfo('Asia/Singapore'))
+    dt_sg: datetime = dt.replace(tzinfo=SGT_TIMEZONE)
     return dt_sg
 
 @typechecked
@@ -96,37 +180,27 @@ def datetime_from_string(val: str) -> datetime | date | time:
     """
     dt: datetime | date | time
 
-    dt_datetime = None
-    dt_format = ''
-    for date_format in ALLOWED_DATE_FORMATS:
+    # When more than one format matches, the last one takes precedence.
+    for date_format in reversed(candidate_date_formats(val)):
+        if date_format == '%H:%M' and len(val) != 5:
+            continue
         try:
-            if date_format == '%H%M' and len(val) != 4:
-                raise ValueError('val is not a 4-digit time')
-            if date_format == '%H:%M' and len(val) != 5:
-                raise ValueError('val is not a 5-digit time')
-
             dt_datetime = datetime.strptime(val, date_format)
-            dt_format = date_format
         except ValueError:
             continue
 
-    if dt_datetime is None:
-        raise ValueError('val is not a recognised datetime string')
+        dt_datetime_sgt = dt_datetime.replace(tzinfo=SGT_TIMEZONE)
+        result_type = _DATE_FORMAT_RESULT_TYPES[date_format]
+        if result_type is time:
+            dt = dt_datetime_sgt.time()
+        elif result_type is date:
+            dt = dt_datetime_sgt.date()
+        else:
+            dt = dt_datetime_sgt
 
-    dt_datetime_sgt = datetime_as_sgt(dt_datetime)
-    dt_date_sgt = dt_datetime_sgt.date()
-    dt_time_sgt = dt_datetime_sgt.time()
-
-    if match('%H:?%M', dt_format) is not None:
-        dt = dt_time_sgt
-    elif fullmatch('%Y-?%m-?%d', dt_format) is not None:
-        dt = dt_date_sgt
-    elif fullmatch('%d/%m/%Y', dt_format) is not None:
-        dt = dt_date_sgt
-    else:
-        dt = dt_datetime_sgt
+        return dt
 
-    return dt
+    raise ValueError('val is not a recognised datetime string')
 
 __all__ = [
     'datetime_from_string',
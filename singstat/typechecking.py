@@ -0,0 +1,130 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Runtime type checks, which can be skipped in production with fast mode.
+
+Fast mode is process-wide. It is turned on when the ``SINGSTAT_FAST_MODE`` \
+    environment variable is set to ``"1"``, ``"true"``, ``"yes"`` or \
+    ``"on"`` before the package is imported, or by calling \
+    ``set_fast_mode(True)``, e.g. through ``SingStat(fast_mode=True)``.
+"""
+
+from functools import wraps
+from inspect import iscoroutinefunction, isclass, isfunction
+from os import environ
+from typing import Any, Callable, TypeVar
+
+from typeguard import check_type as typeguard_check_type
+from typeguard import typechecked as typeguard_typechecked
+
+FAST_MODE_ENV_VAR = 'SINGSTAT_FAST_MODE'
+FAST_MODE_ENV_VALUES = ('1', 'true', 'yes', 'on')
+
+T = TypeVar('T')
+
+def fast_mode_from_env() -> bool:
+    """Return whether fast mode is turned on by the environment variable.
+
+    :return: ``True`` if ``SINGSTAT_FAST_MODE`` is set to a truthy value.
+    :rtype: bool
+    """
+    return environ.get(FAST_MODE_ENV_VAR, '').lower() in FAST_MODE_ENV_VALUES
+
+_fast_mode = fast_mode_from_env()
+
+def is_fast_mode() -> bool:
+    """Return whether fast mode is turned on.
+
+    :return: ``True`` if runtime type checks are skipped.
+    :rtype: bool
+    """
+    return _fast_mode
+
+def set_fast_mode(enabled: bool) -> None:
+    """Turn fast mode on or off for the whole process.
+
+    :param enabled: If ``True``, then runtime type checks are skipped.
+    :type enabled: bool
+    """
+    global _fast_mode # pylint: disable=global-statement
+    _fast_mode = enabled
+
+def check_type(value: Any, expected_type: Any) -> Any:
+    """Ensure that a value matches the expected type, unless in fast mode.
+
+    :param value: Value to check.
+    :type value: Any
+
+    :param expected_type: Type that ``value`` is expected to be.
+    :type expected_type: Any
+
+    :raises typeguard.TypeCheckError: ``value`` does not match \
+        ``expected_type``.
+
+    :return: ``value``, unchanged.
+    :rtype: Any
+    """
+    if _fast_mode:
+        return value
+    return typeguard_check_type(value, expected_type)
+
+def typechecked(target: T) -> T:
+    """Decorate a function, or the methods of a class, with \
+        ``typeguard.typechecked``, except that the checks are skipped when \
+        in fast mode.
+
+    :param target: Function or class to decorate.
+    :type target: T
+
+    :return: The decorated function or class.
+    :rtype: T
+    """
+    if isclass(target):
+        for name, attr in list(vars(target).items()):
+            if isfunction(attr):
+                setattr(target, name, typechecked(attr))
+        return target
+
+    func: Callable = target # type: ignore[assignment]
+    checked_func = typeguard_typechecked(func)
+    if checked_func is func:
+        # typeguard does nothing, e.g. when Python runs with -O.
+        return target
+
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if _fast_mode:
+                return await func(*args, **kwargs)
+            return await checked_func(*args, **kwargs)
+
+        return async_wrapper # type: ignore[return-value]
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _fast_mode:
+            return func(*args, **kwargs)
+        return checked_func(*args, **kwargs)
+
+    return wrapper # type: ignore[return-value]
+
+__all__ = [
+    'FAST_MODE_ENV_VAR',
+
+    'check_type',
+    'fast_mode_from_env',
+    'is_fast_mode',
+    'set_fast_mode',
+    'typechecked',
+]
@@ -0,0 +1,63 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SingStat custom types for clients' constructor arguments."""
+
+from typing import NotRequired, TypedDict
+
+class SingStatArgsDict(TypedDict):
+    """Type definition for the keyword-only arguments of ``SingStat``, \
+        which are passed on by the clients that wrap it, e.g. \
+        ``AsyncClient``. Refer to ``SingStat`` for their descriptions."""
+    sanitise_cache_size: NotRequired[int]
+    """Maximum number of sanitised strings that are cached."""
+    fast_mode: NotRequired[bool | None]
+    """Whether to skip runtime type checks."""
+    lazy_sanitise: NotRequired[bool]
+    """Whether to return read-only views that are sanitised when read."""
+    json_decoder: NotRequired[str]
+    """Decoder of JSON responses."""
+    pool_size: NotRequired[int]
+    """Maximum number of connections to keep open to the API."""
+    thread_safe: NotRequired[bool]
+    """Whether the client may be shared by many threads."""
+    single_flight: NotRequired[bool]
+    """Whether identical requests that are sent at the same time are sent \
+        only once."""
+    cache_results: NotRequired[bool]
+    """Whether the sanitised results of cached responses are cached too."""
+    memory_cache_size: NotRequired[int]
+    """Maximum number of sanitised results that are kept in memory."""
+    memory_cache_bytes: NotRequired[int]
+    """Maximum total size of the sanitised results that are kept in memory."""
+    cache_compression: NotRequired[str | None]
+    """Compression of cached responses, i.e. "gzip" or "zstd"."""
+    cache_compression_level: NotRequired[int | None]
+    """Level of ``cache_compression``."""
+    cache_max_bytes: NotRequired[int | None]
+    """Maximum total size of the cached responses, in bytes."""
+    cache_max_entries: NotRequired[int | None]
+    """Maximum number of cached responses."""
+    cache_eviction_policy: NotRequired[str]
+    """Which responses to evict first, i.e. "lru" or "lfu"."""
+    cache_compaction_interval: NotRequired[int | None]
+    """Number of seconds between compactions of the cache."""
+    stale_while_revalidate: NotRequired[int | None]
+    """Maximum number of seconds that an expired response may be used for."""
+    negative_cache_duration: NotRequired[int | None]
+    """Number of seconds to cache the responses that raise ``APIError``."""
+
+__all__ = [
+    'SingStatArgsDict',
+]
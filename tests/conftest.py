@@ -0,0 +1,29 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fixtures that are shared by all of the tests."""
+
+import pytest
+
+from singstat import typechecking
+
+@pytest.fixture(autouse=True)
+def type_checks(monkeypatch):
+    """Run each test with the runtime type checks, even if fast mode is \
+        turned on by ``SINGSTAT_FAST_MODE``, which is read when the package \
+        is imported, or by an earlier test."""
+    monkeypatch.delenv(typechecking.FAST_MODE_ENV_VAR, raising=False)
+    typechecking.set_fast_mode(False)
+    yield
+    typechecking.set_fast_mode(False)
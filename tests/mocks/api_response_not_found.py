@@ -0,0 +1,37 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+"""Mock response to return response with not found."""
+
+from requests import HTTPError
+
+class APIResponseNotFound:
+    status_code = 404
+
+    @staticmethod
+    def json():
+        return {
+            'Data': None,
+            'DataCount': 0,
+            'StatusCode': 404,
+            'Message': 'Not Found',
+        }
+
+    def raise_for_status(self):
+        raise HTTPError('404 Client Error: Not Found', response=self)
+
+__all__ = [
+    'APIResponseNotFound',
+]
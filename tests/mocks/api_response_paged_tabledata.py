@@ -0,0 +1,57 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+"""Mock response to return a page of a table's data."""
+
+PAGED_TABLEDATA_TOTAL = 7
+
+class APIResponsePagedTabledata:
+    status_code = 200
+
+    def __init__(self, params=None):
+        params = params or {}
+        self.offset = int(params.get('offset', 0))
+        self.limit = int(params.get('limit', 3000))
+
+    def json(self):
+        end = min(self.offset + self.limit, PAGED_TABLEDATA_TOTAL)
+        return {
+            'Data': {
+                'id': 'M212151',
+                'generatedBy': 'SingStat Table Builder',
+                'dateGenerated': '17/10/2026',
+                'offset': self.offset,
+                'limit': self.limit,
+                'row': [
+                    {
+                        'seriesNo': f'1.{i}',
+                        'rowText': f'Row {i}',
+                        'uoM': 'Number',
+                        'footnote': '',
+                        'columns': [{'key': '2018', 'value': str(i)}],
+                    }
+                    for i in range(self.offset, end)
+                ],
+            },
+            'DataCount': PAGED_TABLEDATA_TOTAL,
+            'StatusCode': 200,
+            'Message': '',
+        }
+
+__all__ = [
+    'PAGED_TABLEDATA_TOTAL',
+
+    'APIResponsePagedTabledata',
+]
@@ -0,0 +1,105 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+"""Mock responses to return the metadata and data of a monthly time series \
+    table, which has periods from 2018 Jan to an end period."""
+
+TIME_SERIES_MONTHS = (
+    'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec',
+)
+TIME_SERIES_SERIES_NOS = ('1', '2')
+
+def time_series_periods(end_period):
+    periods = []
+    for year in range(2018, int(end_period[:4]) + 1):
+        for month in TIME_SERIES_MONTHS:
+            periods.append(f'{year} {month}')
+            if periods[-1] == end_period:
+                return periods
+    return periods
+
+class APIResponseTimeSeriesMetadata:
+    status_code = 200
+
+    def __init__(self, end_period):
+        self.end_period = end_period
+
+    def json(self):
+        return {
+            'Data': {
+                'generatedBy': 'SingStat Table Builder',
+                'dateGenerated': '17/10/2026',
+                'records': {
+                    'id': 'M212151',
+                    'title': 'Time series table',
+                    'frequency': 'Monthly',
+                    'startPeriod': '2018 Jan',
+                    'endPeriod': self.end_period,
+                    'total': len(TIME_SERIES_SERIES_NOS),
+                    'row': [],
+                },
+            },
+            'DataCount': 1,
+            'StatusCode': 200,
+            'Message': '',
+        }
+
+class APIResponseTimeSeries:
+    status_code = 200
+
+    def __init__(self, end_period, params=None):
+        params = params or {}
+        periods = time_series_periods(end_period)
+        if 'timeFilter' in params:
+            time_filter = params['timeFilter'].split(',')
+            periods = [period for period in periods if period in time_filter]
+        self.periods = periods
+
+    def json(self):
+        return {
+            'Data': {
+                'id': 'M212151',
+                'title': 'Time series table',
+                'generatedBy': 'SingStat Table Builder',
+                'dateGenerated': '17/10/2026',
+                'row': [
+                    {
+                        'seriesNo': series_no,
+                        'rowText': f'Series {series_no}',
+                        'uoM': 'Number',
+                        'footnote': '',
+                        'columns': [
+                            {'key': period, 'value': f'{series_no}{i}'}
+                            for i, period in enumerate(self.periods)
+                        ],
+                    }
+                    for series_no in TIME_SERIES_SERIES_NOS
+                ],
+            },
+            'DataCount': len(TIME_SERIES_SERIES_NOS),
+            'StatusCode': 200,
+            'Message': '',
+        }
+
+__all__ = [
+    'TIME_SERIES_SERIES_NOS',
+
+    'time_series_periods',
+
+    'APIResponseTimeSeries',
+    'APIResponseTimeSeriesMetadata',
+]
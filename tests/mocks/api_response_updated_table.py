@@ -0,0 +1,83 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-class-docstring,missing-function-docstring
+
+"""Mock responses to return the metadata and data of a table that is \
+    updated."""
+
+class APIResponseUpdatedMetadata:
+    status_code = 200
+
+    def __init__(self, data_last_updated, frequency='Monthly'):
+        self.data_last_updated = data_last_updated
+        self.frequency = frequency
+
+    def json(self):
+        return {
+            'Data': {
+                'generatedBy': 'SingStat Table Builder',
+                'dateGenerated': '17/10/2026',
+                'records': {
+                    'id': 'M212151',
+                    'title': 'Updated table',
+                    'frequency': self.frequency,
+                    'dataLastUpdated': self.data_last_updated,
+                    'startPeriod': '2018',
+                    'endPeriod': '2019',
+                    'total': 1,
+                    'row': [],
+                },
+            },
+            'DataCount': 1,
+            'StatusCode': 200,
+            'Message': '',
+        }
+
+class APIResponseUpdatedTabledata:
+    status_code = 200
+
+    def __init__(self, data_last_updated):
+        self.data_last_updated = data_last_updated
+
+    def json(self):
+        return {
+            'Data': {
+                'id': 'M212151',
+                'title': 'Updated table',
+                'frequency': 'Monthly',
+                'dataLastUpdated': self.data_last_updated,
+                'generatedBy': 'SingStat Table Builder',
+                'dateGenerated': '17/10/2026',
+                'row': [
+                    {
+                        'seriesNo': '1',
+                        'rowText': 'Row',
+                        'uoM': 'Number',
+                        'footnote': '',
+                        'columns': [
+                            {'key': '2018', 'value': self.data_last_updated},
+                        ],
+                    },
+                ],
+            },
+            'DataCount': 1,
+            'StatusCode': 200,
+            'Message': '',
+        }
+
+__all__ = [
+    'APIResponseUpdatedMetadata',
+    'APIResponseUpdatedTabledata',
+]
@@ -0,0 +1,589 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the AsyncClient class is working properly."""
+
+import asyncio
+import gc
+import gzip
+import json
+import threading
+from datetime import date, timedelta
+from unittest.mock import Mock
+
+import pytest
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError
+from requests_cache import SQLiteCache
+from typeguard import check_type
+
+httpx = pytest.importorskip('httpx')
+
+# pylint: disable=wrong-import-position
+from singstat.client import AsyncClient
+from singstat.client import async_client as async_client_module
+from singstat.client.constants import METADATA_ENDPOINT, TABLEDATA_ENDPOINT
+from singstat.client.types import TabledataDict
+from singstat.exceptions import APIError
+
+from .mocks.api_response_bad_request import APIResponseBadRequest
+from .mocks.api_response_paged_tabledata import (
+    PAGED_TABLEDATA_TOTAL,
+    APIResponsePagedTabledata,
+)
+from .mocks.api_response_updated_table import (
+    APIResponseUpdatedMetadata,
+    APIResponseUpdatedTabledata,
+)
+
+GOOD_RESOURCE_ID = 'M212151'
+
+def make_client(handler, **kwargs):
+    client = AsyncClient(**({'cache_backend': 'memory'} | kwargs))
+    client.async_session = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        headers=dict(client.session.headers),
+    )
+    return client
+
+def paged_tabledata_handler(requests_sent):
+    def handler(request):
+        requests_sent.append(request)
+        params = dict(request.url.params)
+        return httpx.Response(200, json=APIResponsePagedTabledata(params).json())
+    return handler
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch):
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(async_client_module, 'sleep', no_sleep)
+
+def test_tabledata():
+    requests_sent = []
+
+    async def main():
+        async with make_client(
+            paged_tabledata_handler(requests_sent),
+            is_test_api=True,
+        ) as client:
+            return await client.tabledata(
+                GOOD_RESOURCE_ID,
+                limit=3,
+                time_filter=('2018', '2019'),
+            )
+
+    tabledata = asyncio.run(main())
+
+    assert check_type(tabledata, TabledataDict) == tabledata
+    assert len(tabledata['Data']['row']) == 3
+    assert tabledata['Data']['dateGenerated'] == date(2026, 10, 17)
+    # Keys that are ignored by Client are ignored by AsyncClient too.
+    assert tabledata['Data']['row'][0]['columns'][0]['key'] == '2018'
+
+    url = requests_sent[0].url
+    assert str(url).startswith(f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}')
+    assert url.params['limit'] == '3'
+    assert url.params['timeFilter'] == '2018,2019'
+    assert url.params['isTestApi'] == 'true'
+
+def test_tabledata_concurrently():
+    requests_sent = []
+
+    async def main():
+        async with make_client(paged_tabledata_handler(requests_sent)) as client:
+            return await asyncio.gather(*(
+                client.tabledata(GOOD_RESOURCE_ID, offset=offset, limit=1)
+                for offset in range(PAGED_TABLEDATA_TOTAL)
+            ))
+
+    pages = asyncio.run(main())
+
+    assert [page['Data']['row'][0]['rowText'] for page in pages] == [
+        f'Row {i}' for i in range(PAGED_TABLEDATA_TOTAL)
+    ]
+    assert len(requests_sent) == PAGED_TABLEDATA_TOTAL
+
+@pytest.mark.parametrize(
+    ('sanitise_thread_bytes', 'is_in_thread'),
+    [
+        (1024 * 1024, False),
+        (0, True),
+    ],
+)
+def test_tabledata_sanitised_in_thread(
+    sanitise_thread_bytes,
+    is_in_thread,
+    monkeypatch,
+):
+    requests_sent = []
+    threads = []
+
+    monkeypatch.setattr(
+        async_client_module,
+        'ASYNC_SANITISE_THREAD_BYTES',
+        sanitise_thread_bytes,
+    )
+
+    async def main(client):
+        async with client:
+            return await client.tabledata(GOOD_RESOURCE_ID, limit=3)
+
+    client = make_client(paged_tabledata_handler(requests_sent))
+    original_sanitise_data = client.sanitise_data
+
+    def sanitise_data(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return original_sanitise_data(*args, **kwargs)
+
+    client.sanitise_data = sanitise_data
+
+    tabledata = asyncio.run(main(client))
+
+    assert check_type(tabledata, TabledataDict) == tabledata
+    assert (threads[0] is not threading.main_thread()) is is_in_thread
+
+def test_tabledata_with_compressed_response():
+    def handler(request):
+        content = json.dumps(
+            APIResponsePagedTabledata(dict(request.url.params)).json(),
+        ).encode()
+        return httpx.Response(
+            200,
+            content=gzip.compress(content),
+            headers={
+                'Content-Encoding': 'gzip',
+                'Content-Type': 'application/json',
+            },
+        )
+
+    async def main(client):
+        async with client:
+            return await client.tabledata(GOOD_RESOURCE_ID, limit=3)
+
+    client = make_client(handler)
+    tabledata = asyncio.run(main(client))
+
+    assert len(tabledata['Data']['row']) == 3
+
+    # The decompressed content is cached.
+    response = client.session.get(
+        f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}',
+        params={'limit': 3},
+        only_if_cached=True,
+    )
+    assert response.from_cache is True
+    assert response.json()['Data']['row'] == \
+        APIResponsePagedTabledata({'limit': 3}).json()['Data']['row']
+
+def test_tabledata_from_cache():
+    requests_sent = []
+
+    async def main(client):
+        async with client:
+            first = await client.tabledata(GOOD_RESOURCE_ID, limit=3)
+            second = await client.tabledata(GOOD_RESOURCE_ID, limit=3)
+            return first, second
+
+    client = make_client(paged_tabledata_handler(requests_sent))
+    first, second = asyncio.run(main(client))
+
+    assert first == second
+    assert len(requests_sent) == 1
+
+    # The response is in the same cache as, and with the same key as,
+    # ``Client``'s requests.
+    response = client.session.get(
+        f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}',
+        params={'limit': 3},
+        only_if_cached=True,
+    )
+    assert response.from_cache is True
+    assert response.status_code == 200
+
+def test_tabledata_with_check_metadata():
+    requests_sent = []
+    data_last_updated = ['01/10/2026']
+
+    def handler(request):
+        requests_sent.append(request)
+        if str(request.url).startswith(METADATA_ENDPOINT):
+            response = APIResponseUpdatedMetadata(data_last_updated[0])
+        else:
+            response = APIResponseUpdatedTabledata(data_last_updated[0])
+        return httpx.Response(200, json=response.json())
+
+    async def main(client):
+        async with client:
+            first = await client.tabledata(
+                GOOD_RESOURCE_ID,
+                check_metadata=True,
+            )
+            _ = await client.tabledata(
+                GOOD_RESOURCE_ID,
+                check_metadata=True,
+            )
+            assert len(requests_sent) == 2
+
+            # The table is updated, and the cached metadata gets older than 5
+            # minutes.
+            data_last_updated[0] = '15/10/2026'
+            metadata_response = client.session.cache.get_response(
+                client.create_cache_key(metadata_url, {}),
+            )
+            metadata_response.created_at -= timedelta(minutes=6)
+
+            second = await client.tabledata(
+                GOOD_RESOURCE_ID,
+                check_metadata=True,
+            )
+            _ = await client.metadata(GOOD_RESOURCE_ID)
+            return first, second
+
+    metadata_url = f'{METADATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+    tabledata_url = f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+
+    client = make_client(handler)
+    first, second = asyncio.run(main(client))
+
+    assert first['Data']['dataLastUpdated'] == date(2026, 10, 1)
+    assert second['Data']['dataLastUpdated'] == date(2026, 10, 15)
+    assert len(requests_sent) == 4
+
+    # Monthly data is cached for a day.
+    tabledata_response = client.session.cache.get_response(
+        client.create_cache_key(tabledata_url, {}),
+    )
+    cached_duration = tabledata_response.expires - tabledata_response.created_at
+    assert abs(cached_duration - timedelta(days=1)) < timedelta(seconds=1)
+
+    # The metadata that is requested again is still cached for 12 hours.
+    metadata_response = client.session.cache.get_response(
+        client.create_cache_key(metadata_url, {}),
+    )
+    cached_duration = metadata_response.expires - metadata_response.created_at
+    assert abs(cached_duration - timedelta(hours=12)) < timedelta(seconds=1)
+
+def test_tabledata_with_single_flight():
+    requests_sent = []
+
+    async def main():
+        async with make_client(
+            paged_tabledata_handler(requests_sent),
+            single_flight=True,
+        ) as client:
+            return await asyncio.gather(*(
+                client.tabledata(GOOD_RESOURCE_ID, limit=3) for _ in range(8)
+            ))
+
+    results = asyncio.run(main())
+
+    assert len(requests_sent) == 1
+    assert all(tabledata is results[0] for tabledata in results)
+
+def test_send_request_with_single_flight_and_bad_request():
+    requests_sent = []
+
+    def handler(request):
+        requests_sent.append(request)
+        return httpx.Response(400, json=APIResponseBadRequest().json())
+
+    async def main():
+        async with make_client(handler, single_flight=True) as client:
+            return await asyncio.gather(
+                *(client.resource_id(keyword='house') for _ in range(4)),
+                return_exceptions=True,
+            )
+
+    errors = asyncio.run(main())
+
+    assert len(requests_sent) == 1
+    assert all(isinstance(e, APIError) for e in errors)
+
+def blocked_tabledata_handler(requests_sent, unblocked):
+    async def handler(request):
+        requests_sent.append(request)
+        await unblocked.wait()
+        params = dict(request.url.params)
+        return httpx.Response(200, json=APIResponsePagedTabledata(params).json())
+    return handler
+
+@pytest.mark.parametrize('cancelled_call', [0, 1])
+def test_tabledata_with_single_flight_and_cancelled_call(cancelled_call):
+    requests_sent = []
+
+    async def main():
+        unblocked = asyncio.Event()
+        async with make_client(
+            blocked_tabledata_handler(requests_sent, unblocked),
+            single_flight=True,
+        ) as client:
+            tasks = [
+                asyncio.create_task(client.tabledata(GOOD_RESOURCE_ID, limit=3))
+                for _ in range(3)
+            ]
+            while not requests_sent:
+                await asyncio.sleep(0)
+
+            # Cancel the first call, which sent the request, or a call that
+            # waits for it.
+            tasks[cancelled_call].cancel()
+            unblocked.set()
+
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(main())
+
+    assert len(requests_sent) == 1
+    assert isinstance(results[cancelled_call], asyncio.CancelledError)
+    tabledatas = [
+        result for i, result in enumerate(results) if i != cancelled_call
+    ]
+    assert all(
+        len(tabledata['Data']['row']) == 3 for tabledata in tabledatas
+    )
+
+def test_tabledata_with_cache_results():
+    requests_sent = []
+
+    async def main(client):
+        async with client:
+            first = await client.tabledata(GOOD_RESOURCE_ID, limit=3)
+            second = await client.tabledata(GOOD_RESOURCE_ID, limit=3)
+            return first, second
+
+    client = make_client(
+        paged_tabledata_handler(requests_sent),
+        cache_results=True,
+    )
+    original_sanitise_data = client.sanitise_data
+    client.sanitise_data = Mock(side_effect=original_sanitise_data)
+
+    first, second = asyncio.run(main(client))
+
+    assert first == second
+    assert len(requests_sent) == 1
+    client.sanitise_data.assert_called_once()
+    assert len(client.result_cache) == 1
+
+@pytest.mark.parametrize('cache_results', [False, True])
+def test_tabledata_with_cache_max_entries(cache_results, tmp_path):
+    requests_sent = []
+
+    async def main(client):
+        async with client:
+            for limit in [1, 2, 1, 3, 1, 2]:
+                _ = await client.tabledata(GOOD_RESOURCE_ID, limit=limit)
+
+    client = make_client(
+        paged_tabledata_handler(requests_sent),
+        cache_backend=SQLiteCache(tmp_path / 'cache'),
+        cache_results=cache_results,
+        cache_max_entries=2,
+    )
+    asyncio.run(main(client))
+
+    # The response with limit=2 was evicted when the one with limit=3 was
+    # cached.
+    assert [request.url.params['limit'] for request in requests_sent] == \
+        ['1', '2', '3', '2']
+    assert client.cache_evictor.usage().entries == 2
+
+def test_send_request_with_stale_while_revalidate():
+    url = f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+    requests_sent = []
+
+    def handler(request):
+        requests_sent.append(request)
+        return httpx.Response(
+            200,
+            json={'Data': {}, 'DataCount': len(requests_sent)},
+        )
+
+    async def main(client):
+        async with client:
+            counts = [
+                (await client.send_request(url, cache_duration=1))['DataCount']
+            ]
+            await asyncio.sleep(1.1)
+            # The stale response is returned, and refreshed in a background
+            # task, once.
+            for _ in range(2):
+                data = await client.send_request(url, cache_duration=1)
+                counts.append(data['DataCount'])
+            await asyncio.sleep(0.1)
+            data = await client.send_request(url, cache_duration=1)
+            counts.append(data['DataCount'])
+            return counts
+
+    client = make_client(handler, stale_while_revalidate=60)
+    counts = asyncio.run(main(client))
+
+    assert counts == [1, 1, 1, 2]
+    assert len(requests_sent) == 2
+
+def test_aclose_with_stale_while_revalidate(caplog):
+    url = f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+    requests_sent = []
+
+    def handler(request):
+        requests_sent.append(request)
+        return httpx.Response(200, json={'Data': {}, 'DataCount': 1})
+
+    async def main(client):
+        async with client:
+            _ = await client.send_request(url, cache_duration=1)
+            await asyncio.sleep(1.1)
+            # The stale response is refreshed in a background task, which is
+            # cancelled when the client is closed.
+            _ = await client.send_request(url, cache_duration=1)
+
+    client = make_client(handler, stale_while_revalidate=60)
+    asyncio.run(main(client))
+    gc.collect()
+
+    assert len(requests_sent) == 1
+    assert not caplog.records
+
+def test_aclose():
+    async def main(client):
+        async with client:
+            pass
+
+    client = make_client(paged_tabledata_handler([]))
+    client.close = Mock()
+    asyncio.run(main(client))
+
+    client.close.assert_called_once()
+    assert client.async_session.is_closed
+
+def test_send_request_with_stale_while_revalidate_and_cache_error(caplog):
+    url = f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+
+    def handler(request):
+        return httpx.Response(200, json={'Data': {}, 'DataCount': 1})
+
+    async def main(client):
+        async with client:
+            _ = await client.send_request(url, cache_duration=1)
+            await asyncio.sleep(1.1)
+            client.session.cache.save_response = Mock(
+                side_effect=OSError('disk I/O error'),
+            )
+            data = await client.send_request(url, cache_duration=1)
+            await asyncio.sleep(0.1)
+            return data
+
+    client = make_client(handler, stale_while_revalidate=60)
+    data = asyncio.run(main(client))
+
+    # The stale response is returned, and the error of its refresh is
+    # logged.
+    assert data['DataCount'] == 1
+    assert [
+        (record.name, record.exc_info[0]) for record in caplog.records
+    ] == [('singstat.client.async_client', OSError)]
+
+def test_send_request_with_negative_cache_duration():
+    url = f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+    requests_sent = []
+
+    def handler(request):
+        requests_sent.append(request)
+        return httpx.Response(400, json=APIResponseBadRequest.json())
+
+    async def main(client):
+        async with client:
+            errors = []
+            for _ in range(2):
+                try:
+                    _ = await client.send_request(url, cache_duration=60)
+                except APIError as e:
+                    errors.append(e)
+            return errors
+
+    client = make_client(handler, negative_cache_duration=60)
+    errors = asyncio.run(main(client))
+
+    assert len(errors) == 2
+    assert errors[1].data == errors[0].data
+    assert len(requests_sent) == 1
+
+def test_tabledata_with_bad_inputs():
+    client = make_client(paged_tabledata_handler([]))
+
+    with pytest.raises(ValueError):
+        asyncio.run(client.tabledata(GOOD_RESOURCE_ID, limit=3001))
+    with pytest.raises(ValueError):
+        asyncio.run(client.resource_id(search_option='foo'))
+
+def test_send_request_with_bad_request():
+    def handler(request):
+        return httpx.Response(400, json=APIResponseBadRequest().json())
+
+    client = make_client(handler)
+
+    with pytest.raises(APIError) as excinfo:
+        asyncio.run(client.resource_id(keyword='house'))
+
+    assert excinfo.value.data == APIResponseBadRequest().json()
+
+def test_send_request_with_retries():
+    status_codes = [503, 502, 200]
+
+    def handler(request):
+        status_code = status_codes.pop(0)
+        if status_code != 200:
+            return httpx.Response(status_code)
+        return httpx.Response(200, json=APIResponsePagedTabledata().json())
+
+    client = make_client(handler)
+    tabledata = asyncio.run(client.tabledata(GOOD_RESOURCE_ID))
+
+    assert len(tabledata['Data']['row']) == PAGED_TABLEDATA_TOTAL
+    assert not status_codes
+
+def test_send_request_with_server_error():
+    def handler(request):
+        return httpx.Response(500, json={'Message': 'Internal Server Error'})
+
+    client = make_client(handler)
+    with pytest.raises(HTTPError):
+        asyncio.run(client.tabledata(GOOD_RESOURCE_ID))
+
+def test_send_request_with_connection_error():
+    def handler(request):
+        raise httpx.ConnectError('Connection refused', request=request)
+
+    client = make_client(handler)
+    with pytest.raises(RequestsConnectionError):
+        asyncio.run(client.tabledata(GOOD_RESOURCE_ID))
+
+@pytest.mark.parametrize(
+    ('args', 'kwargs'),
+    [
+        (('memory', False, 10), {}),
+        (('memory',), {'foo': 'bar'}),
+    ],
+)
+def test_constructor_with_bad_arguments(args, kwargs):
+    with pytest.raises(TypeError):
+        _ = AsyncClient(*args, **kwargs)
+
+def test_max_connections_with_bad_value():
+    with pytest.raises(ValueError):
+        _ = AsyncClient(cache_backend='memory', max_connections=0)
@@ -0,0 +1,170 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+"""Test that the Catalogue class is working properly."""
+
+from datetime import date
+from unittest.mock import Mock
+
+import pytest
+
+from singstat.client import Catalogue, Client
+from singstat.exceptions import APIError
+
+RESOURCES = {
+    'Data': {
+        'generatedBy': 'SingStat Table Builder',
+        'dateGenerated': date(2026, 10, 17),
+        'total': 3,
+        'records': [
+            {
+                'id': 'M212151',
+                'title': 'Average Monthly Household Income',
+                'theme': 'Households',
+                'subject': 'Household Income',
+                'topic': 'Income',
+                'frequency': 'Annual',
+                'dataLastUpdated': date(2026, 2, 1),
+                'tableType': 'Time Series',
+            },
+            {
+                'id': 'M810001',
+                'title': 'Indicators On Population',
+                'theme': 'Population',
+                'subject': 'Population',
+                'topic': 'Population And Population Structure',
+                'frequency': 'Annual',
+                'dataLastUpdated': date(2026, 9, 25),
+                'tableType': 'Time Series',
+            },
+            {
+                'id': '8865',
+                'title': 'Resident Dwellings By Type Of Dwelling',
+                'theme': 'Households',
+                'subject': 'Households',
+                'topic': 'Dwellings',
+                'tableType': 'Cross-Sectional',
+            },
+        ],
+    },
+    'DataCount': 3,
+    'StatusCode': 200,
+    'Message': '',
+}
+
+METADATA = {
+    'Data': {
+        'records': {
+            'row': [
+                {'seriesNo': '1', 'rowText': 'Resident Population'},
+                {'seriesNo': '2', 'rowText': 'Total Fertility Rate'},
+            ],
+        },
+    },
+}
+
+@pytest.fixture
+def catalogue():
+    catalogue = Catalogue()
+    assert catalogue.add_resources(RESOURCES) == 3
+    yield catalogue
+    catalogue.close()
+
+def ids(records):
+    return [record['id'] for record in records]
+
+def test_search(catalogue):
+    assert len(catalogue) == 3
+
+    records = catalogue.search('household income')
+    assert ids(records) == ['M212151']
+    assert records[0] == RESOURCES['Data']['records'][0]
+
+    # Words match the words that start with them, and matches in titles
+    # rank first.
+    assert ids(catalogue.search('house')) == ['M212151', '8865']
+    assert ids(catalogue.search('house', limit=1)) == ['M212151']
+
+    assert ids(catalogue.search('structure', search_option='topic')) == \
+        ['M810001']
+    assert catalogue.search('structure', search_option='title') == []
+
+def test_search_without_words(catalogue):
+    assert ids(catalogue.search('%')) == ['M212151', 'M810001', '8865']
+    assert ids(catalogue.search('', limit=2)) == ['M212151', 'M810001']
+
+def test_search_with_quotes(catalogue):
+    # Keywords are searched as words, not as FTS5 queries.
+    assert ids(catalogue.search('"population*" -')) == ['M810001']
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'search_option': 'foo'},
+        {'limit': 0},
+    ],
+)
+def test_search_with_bad_inputs(catalogue, kwargs):
+    with pytest.raises(ValueError):
+        _ = catalogue.search('house', **kwargs)
+
+def test_add_variables(catalogue):
+    assert catalogue.search('fertility', search_option='variable') == []
+
+    assert catalogue.add_variables('M810001', METADATA) is True
+    assert catalogue.add_variables('foo', METADATA) is False
+
+    assert ids(catalogue.search('fertility', search_option='variable')) == \
+        ['M810001']
+    assert ids(catalogue.search('fertility')) == ['M810001']
+
+def test_add_resources_replaces_resources(catalogue):
+    assert catalogue.add_resources(RESOURCES) == 3
+    assert len(catalogue) == 3
+
+    catalogue.clear()
+    assert len(catalogue) == 0
+
+def test_persistence(tmp_path):
+    path = tmp_path / 'catalogue.sqlite'
+
+    catalogue = Catalogue(path)
+    _ = catalogue.add_resources(RESOURCES)
+    catalogue.close()
+
+    catalogue = Catalogue(path)
+    assert ids(catalogue.search('population')) == ['M810001']
+    catalogue.close()
+
+def test_build_catalogue():
+    client = Client(cache_backend='memory')
+    client.resource_id = Mock(return_value=RESOURCES)
+    client.metadata_many = Mock(return_value={
+        'M212151': APIError('No data records returned.'),
+        'M810001': METADATA,
+        '8865': {'Data': {'records': {}}},
+    })
+
+    catalogue = client.build_catalogue()
+    assert len(catalogue) == 3
+    client.metadata_many.assert_not_called()
+    assert catalogue.search('fertility') == []
+    catalogue.close()
+
+    catalogue = client.build_catalogue(with_variables=True)
+    client.metadata_many.assert_called_once()
+    assert ids(catalogue.search('fertility')) == ['M810001']
+    catalogue.close()
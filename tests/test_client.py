@@ -16,6 +16,8 @@
 
 """Test that the Client class is working properly."""
 
+from datetime import date, datetime, timedelta, timezone
+from threading import Barrier
 from unittest.mock import Mock
 from warnings import catch_warnings, simplefilter
 
@@ -25,11 +27,13 @@ from requests_cache import CachedSession
 from typeguard import check_type
 
 from singstat.client import Client
+from singstat.exceptions import APIError
 from singstat.client.constants import (
     METADATA_ENDPOINT,
     RESOURCE_ID_ENDPOINT,
     TABLEDATA_ENDPOINT,
 )
+from singstat.sanitise import SanitisedMapping, SanitisedSequence
 from singstat.client.types import (
     MetadataDict,
     ResourceIdDict,
@@ -40,6 +44,22 @@ from .mocks.api_response_empty_data import (
     APIResponseEmptyMetadata,
     APIResponseEmptyTabledata,
 )
+from .mocks.api_response_not_found import APIResponseNotFound
+from .mocks.api_response_time_series import (
+    TIME_SERIES_SERIES_NOS,
+    APIResponseTimeSeries,
+    APIResponseTimeSeriesMetadata,
+    time_series_periods,
+)
+from .mocks.api_response_updated_table import (
+    APIResponseUpdatedMetadata,
+    APIResponseUpdatedTabledata,
+)
+from .mocks.api_response_paged_tabledata import (
+    PAGED_TABLEDATA_TOTAL,
+    APIResponsePagedTabledata,
+)
+from .mocks.api_response_zero_data import APIResponseZeroData
 
 # constants for testing resource_id()
 BAD_KEYWORD = 'sdfger934rzh'
@@ -49,6 +69,7 @@ GOOD_SEARCH_OPTION = 'title'
 
 # constants for testing metadata() and tabledata()
 BAD_RESOURCE_ID = '12345'
+NOT_FOUND_RESOURCE_ID = '67890'
 GOOD_RESOURCE_ID = 'M212151'
 GOOD_CUBE_RESOURCE_ID = '8865'
 
@@ -269,6 +290,50 @@ def test_tabledata(client, resource_id, kwargs, params):
 
     assert check_type(tabledata, TabledataDict) == tabledata
 
+@pytest.mark.parametrize(
+    ('kwargs', 'params'),
+    [
+        (
+            {'series_no_or_row_no': ['1.10', '1.9', '1.10', ' 2']},
+            {'seriesNoOrRowNo': '1.9,1.10,2'},
+        ),
+        (
+            {'series_no_or_row_no': '2, 1.10,1.9,'},
+            {'seriesNoOrRowNo': '1.9,1.10,2'},
+        ),
+        (
+            {'time_filter': ('2018 Mar', '2017  Dec')},
+            {'timeFilter': '2017 Dec,2018 Mar'},
+        ),
+        (
+            {'time_filter': '2018 1Q, 2017 4Q'},
+            {'timeFilter': '2017 4Q,2018 1Q'},
+        ),
+        # Periods that cannot be parsed keep their order.
+        (
+            {'time_filter': 'foo,2017,foo'},
+            {'timeFilter': 'foo,2017'},
+        ),
+        (
+            {'between': ' 0, 100'},
+            {'between': '0,100'},
+        ),
+    ],
+)
+def test_build_tabledata_params_is_canonical(client, kwargs, params):
+    assert client.build_tabledata_params(**kwargs) == params
+
+def test_equivalent_tabledata_params_have_same_cache_key(client):
+    url = f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+    keys = {
+        client.create_cache_key(url, client.build_tabledata_params(**kwargs))
+        for kwargs in [
+            {'series_no_or_row_no': ['1.2', '1.1'], 'between': (0, 100)},
+            {'series_no_or_row_no': '1.1,1.2,1.1', 'between': '0, 100'},
+        ]
+    }
+    assert len(keys) == 1
+
 def test_tabledata_with_bad_resource_id(client):
     with pytest.raises(HTTPError):
         _ = client.tabledata(resource_id=BAD_RESOURCE_ID)
@@ -320,3 +385,558 @@ def test_tabledata_with_empty_data(client, monkeypatch):
         assert len(w) == 1
         assert issubclass(w[-1].category, RuntimeWarning)
         assert 'Empty data set returned' in str(w[-1].message)
+
+def test_tabledata_with_lazy_sanitise(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseEmptyTabledata()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    lazy_client = Client(lazy_sanitise=True)
+
+    with catch_warnings(record=True):
+        simplefilter('always')
+
+        tabledata = lazy_client.tabledata(BAD_RESOURCE_ID)
+
+    assert isinstance(tabledata, SanitisedMapping)
+    assert isinstance(tabledata['Data']['row'], SanitisedSequence)
+    assert check_type(tabledata.to_dict(), TabledataDict) == tabledata
+
+def test_tabledata_with_check_metadata(requests_mock):
+    metadata_url = f'{METADATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+    tabledata_url = f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+
+    fresh_client = Client(cache_backend='memory')
+    requests_mock.get(
+        metadata_url,
+        json=APIResponseUpdatedMetadata('01/10/2026').json(),
+    )
+    requests_mock.get(
+        tabledata_url,
+        json=APIResponseUpdatedTabledata('01/10/2026').json(),
+    )
+
+    tabledata = fresh_client.tabledata(GOOD_RESOURCE_ID, check_metadata=True)
+    assert tabledata['Data']['dataLastUpdated'] == date(2026, 10, 1)
+    assert requests_mock.call_count == 2
+
+    # Monthly data is cached for a day.
+    tabledata_response = fresh_client.session.cache.get_response(
+        fresh_client.create_cache_key(tabledata_url, {}),
+    )
+    cached_duration = tabledata_response.expires - tabledata_response.created_at
+    assert abs(cached_duration - timedelta(days=1)) < timedelta(seconds=1)
+
+    # Nothing is requested while the metadata and the data are cached.
+    _ = fresh_client.tabledata(GOOD_RESOURCE_ID, check_metadata=True)
+    assert requests_mock.call_count == 2
+
+    # The table is updated, and the cached metadata gets older than 5
+    # minutes.
+    requests_mock.get(
+        metadata_url,
+        json=APIResponseUpdatedMetadata('15/10/2026').json(),
+    )
+    requests_mock.get(
+        tabledata_url,
+        json=APIResponseUpdatedTabledata('15/10/2026').json(),
+    )
+    metadata_response = fresh_client.session.cache.get_response(
+        fresh_client.create_cache_key(metadata_url, {}),
+    )
+    metadata_response.created_at -= timedelta(minutes=6)
+
+    tabledata = fresh_client.tabledata(GOOD_RESOURCE_ID, check_metadata=True)
+    assert tabledata['Data']['dataLastUpdated'] == date(2026, 10, 15)
+    assert requests_mock.call_count == 4
+
+    _ = fresh_client.tabledata(GOOD_RESOURCE_ID, check_metadata=True)
+    assert requests_mock.call_count == 4
+
+    # The metadata that is requested again is still cached for 12 hours.
+    metadata_response = fresh_client.session.cache.get_response(
+        fresh_client.create_cache_key(metadata_url, {}),
+    )
+    cached_duration = metadata_response.expires - metadata_response.created_at
+    assert abs(cached_duration - timedelta(hours=12)) < timedelta(seconds=1)
+
+    _ = fresh_client.metadata(GOOD_RESOURCE_ID)
+    assert requests_mock.call_count == 4
+
+@pytest.mark.parametrize(
+    ('frequency', 'expected_duration'),
+    [
+        ('Annual', 60 * 60 * 24 * 7),
+        ('Monthly', 60 * 60 * 24),
+        (' quarterly ', 60 * 60 * 24 * 3),
+        ('Irregular', 60 * 60 * 12),
+        (None, 60 * 60 * 12),
+    ],
+)
+def test_tabledata_cache_duration(client, frequency, expected_duration):
+    assert client.tabledata_cache_duration(frequency) == expected_duration
+
+@pytest.mark.parametrize(
+    ('tabledata_last_updated', 'data_last_updated', 'expected'),
+    [
+        (date(2026, 10, 1), date(2026, 10, 15), True),
+        (date(2026, 10, 15), date(2026, 10, 15), False),
+        (None, date(2026, 10, 15), False),
+        (date(2026, 10, 1), None, False),
+    ],
+)
+def test_is_tabledata_outdated(
+    client,
+    tabledata_last_updated,
+    data_last_updated,
+    expected,
+):
+    tabledata = {'Data': {'dataLastUpdated': tabledata_last_updated}}
+    assert client.is_tabledata_outdated(tabledata, data_last_updated) is \
+        expected
+
+class TimeSeriesAPI:
+    """Mock API whose time series table ends at ``end_period``."""
+
+    def __init__(self, requests_mock, end_period):
+        self.end_period = end_period
+        self.tabledata_params = []
+
+        requests_mock.get(
+            f'{METADATA_ENDPOINT}/{GOOD_RESOURCE_ID}',
+            json=lambda request, context: APIResponseTimeSeriesMetadata(
+                self.end_period,
+            ).json(),
+        )
+        requests_mock.get(
+            f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}',
+            json=self.tabledata,
+        )
+
+    def tabledata(self, request, context):
+        params = {k: v[0] for k, v in request.qs.items()}
+        # requests-mock lower-cases the query string.
+        params = {'timeFilter': params['timefilter'].title()} \
+            if 'timefilter' in params else {}
+        self.tabledata_params.append(params)
+        return APIResponseTimeSeries(self.end_period, params).json()
+
+def test_sync_tabledata(requests_mock):
+    sync_client = Client(cache_backend='memory')
+    api = TimeSeriesAPI(requests_mock, '2019 Nov')
+    store = {}
+
+    tabledata = sync_client.sync_tabledata(GOOD_RESOURCE_ID, store)
+    assert store[GOOD_RESOURCE_ID] is tabledata
+    assert api.tabledata_params == [{}]
+
+    # Nothing new.
+    tabledata = sync_client.sync_tabledata(GOOD_RESOURCE_ID, store)
+    assert store[GOOD_RESOURCE_ID] is tabledata
+    assert len(api.tabledata_params) == 1
+
+    # Three new periods.
+    api.end_period = '2020 Feb'
+    sync_client.session.cache.clear()
+    tabledata = sync_client.sync_tabledata(GOOD_RESOURCE_ID, store)
+
+    assert api.tabledata_params[-1] == {
+        'timeFilter': '2019 Dec,2020 Jan,2020 Feb',
+    }
+    assert store[GOOD_RESOURCE_ID] is tabledata
+
+    expected_tabledata = sync_client.tabledata_all(GOOD_RESOURCE_ID)
+    rows = tabledata['Data']['row']
+    assert [row['seriesNo'] for row in rows] == list(TIME_SERIES_SERIES_NOS)
+    for row, expected_row in zip(rows, expected_tabledata['Data']['row']):
+        assert [column['key'] for column in row['columns']] == \
+            time_series_periods('2020 Feb')
+        assert len(row['columns']) == len(expected_row['columns'])
+    assert tabledata['Data'].get('timeFilter') is None
+
+def test_sync_tabledata_with_unknown_periods(requests_mock):
+    sync_client = Client(cache_backend='memory')
+    api = TimeSeriesAPI(requests_mock, '2019 Nov')
+    store = {
+        GOOD_RESOURCE_ID: {
+            'Data': {
+                'row': [{'seriesNo': '1', 'columns': [{'key': 'foo'}]}],
+            },
+        },
+    }
+
+    tabledata = sync_client.sync_tabledata(GOOD_RESOURCE_ID, store)
+
+    assert api.tabledata_params == [{}]
+    assert len(tabledata['Data']['row'][0]['columns']) == \
+        len(time_series_periods('2019 Nov'))
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'time_filter': '2018 Jan'},
+        {'offset': 1},
+    ],
+)
+def test_sync_tabledata_with_bad_inputs(client, kwargs):
+    with pytest.raises(ValueError):
+        _ = client.sync_tabledata(GOOD_RESOURCE_ID, {}, **kwargs)
+
+@pytest.fixture
+def paged_client(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponsePagedTabledata(kwargs.get('params'))
+
+    # Mock the method of all sessions, including those of the threads of
+    # ``map_concurrently()``.
+    monkeypatch.setattr(
+        CachedSession,
+        'get',
+        Mock(side_effect=mock_requests_get),
+    )
+
+    paged_client = Client()
+
+    return paged_client
+
+@pytest.mark.parametrize(
+    ('kwargs', 'expected_offsets'),
+    [
+        ({}, [0]),
+        ({'limit': 3}, [0, 3, 6]),
+        ({'limit': 7}, [0]),
+        ({'limit': 2, 'offset': 3}, [3, 5]),
+    ],
+)
+def test_iter_tabledata(paged_client, kwargs, expected_offsets):
+    rows = paged_client.iter_tabledata(GOOD_RESOURCE_ID, **kwargs)
+    paged_client.session.get.assert_not_called()
+
+    row_texts = [row['rowText'] for row in rows]
+
+    first_row = kwargs.get('offset', 0)
+    assert row_texts == [
+        f'Row {i}' for i in range(first_row, PAGED_TABLEDATA_TOTAL)
+    ]
+    offsets = [
+        called_kwargs['params']['offset']
+        for _, called_kwargs in paged_client.session.get.call_args_list
+    ]
+    assert offsets == expected_offsets
+
+def test_iter_tabledata_by_page(paged_client):
+    pages = list(paged_client.iter_tabledata(
+        GOOD_RESOURCE_ID,
+        by_page=True,
+        limit=3,
+    ))
+
+    assert [len(page['Data']['row']) for page in pages] == [3, 3, 1]
+    for page in pages:
+        assert check_type(page, TabledataDict) == page
+
+def test_iter_tabledata_with_bad_inputs(paged_client):
+    with pytest.raises(ValueError):
+        _ = list(paged_client.iter_tabledata(GOOD_RESOURCE_ID, limit=0))
+    with pytest.raises(ValueError):
+        _ = list(paged_client.iter_tabledata(GOOD_RESOURCE_ID, limit=3001))
+
+def test_tabledata_with_use_cached_table(requests_mock):
+    tabledata_url = f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+    requests_mock.get(
+        tabledata_url,
+        json=lambda request, context: APIResponsePagedTabledata({
+            key: values[0] for key, values in request.qs.items()
+        }).json(),
+    )
+
+    fresh_client = Client(cache_backend='memory')
+
+    # Nothing is cached, so the subset is requested.
+    _ = fresh_client.tabledata(
+        GOOD_RESOURCE_ID,
+        use_cached_table=True,
+        limit=2,
+    )
+    assert requests_mock.call_count == 1
+
+    _ = fresh_client.tabledata(GOOD_RESOURCE_ID)
+    assert requests_mock.call_count == 2
+
+    tabledata = fresh_client.tabledata(
+        GOOD_RESOURCE_ID,
+        use_cached_table=True,
+        sort_by='seriesNo desc',
+        between=(2, 5),
+        offset=1,
+        limit=2,
+    )
+    assert requests_mock.call_count == 2
+    assert [row['seriesNo'] for row in tabledata['Data']['row']] == [
+        '1.4',
+        '1.3',
+    ]
+    assert tabledata['DataCount'] == 4
+    assert check_type(tabledata, TabledataDict) == tabledata
+
+    # Without the argument, the subset is requested as usual.
+    _ = fresh_client.tabledata(GOOD_RESOURCE_ID, offset=1, limit=2)
+    assert requests_mock.call_count == 3
+
+    # Sorting the records in the rows is left to the endpoint.
+    _ = fresh_client.tabledata(
+        GOOD_RESOURCE_ID,
+        use_cached_table=True,
+        sort_by='value asc',
+    )
+    assert requests_mock.call_count == 4
+
+@pytest.mark.parametrize('cache_results', [False, True])
+def test_tabledata_with_use_cached_table_without_requests(
+    cache_results,
+    requests_mock,
+    monkeypatch,
+):
+    tabledata_url = f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+    requests_mock.get(
+        tabledata_url,
+        json=lambda request, context: APIResponsePagedTabledata({
+            key: values[0] for key, values in request.qs.items()
+        }).json(),
+    )
+
+    fresh_client = Client(cache_backend='memory', cache_results=cache_results)
+    _ = fresh_client.tabledata(GOOD_RESOURCE_ID)
+
+    # The cached table is read once, and not requested again, even from the
+    # cache.
+    session_get = Mock(wraps=fresh_client.session.get)
+    monkeypatch.setattr(fresh_client.session, 'get', session_get)
+    for _ in range(2):
+        tabledata = fresh_client.tabledata(
+            GOOD_RESOURCE_ID,
+            use_cached_table=True,
+            limit=2,
+        )
+        assert len(tabledata['Data']['row']) == 2
+    session_get.assert_not_called()
+    assert requests_mock.call_count == 1
+
+def test_tabledata_with_use_cached_table_and_no_matches(requests_mock):
+    tabledata_url = f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+    requests_mock.get(
+        tabledata_url,
+        json=APIResponsePagedTabledata({}).json(),
+    )
+
+    fresh_client = Client(cache_backend='memory')
+    _ = fresh_client.tabledata(GOOD_RESOURCE_ID)
+
+    # The same error as from the endpoint, which has no records to return.
+    with pytest.raises(APIError, match='No data records returned.'):
+        _ = fresh_client.tabledata(
+            GOOD_RESOURCE_ID,
+            use_cached_table=True,
+            search='no such row',
+        )
+    assert requests_mock.call_count == 1
+
+@pytest.mark.parametrize('stale_while_revalidate', [None, 60])
+def test_tabledata_with_use_cached_table_and_expired_table(
+    stale_while_revalidate,
+    requests_mock,
+):
+    tabledata_url = f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+    requests_mock.get(
+        tabledata_url,
+        json=lambda request, context: APIResponsePagedTabledata({
+            key: values[0] for key, values in request.qs.items()
+        }).json(),
+    )
+
+    fresh_client = Client(
+        cache_backend='memory',
+        stale_while_revalidate=stale_while_revalidate,
+    )
+    _ = fresh_client.tabledata(GOOD_RESOURCE_ID)
+    fresh_client.session.cache.reset_expiration(
+        datetime.now(timezone.utc) - timedelta(seconds=1),
+    )
+
+    # Only the subset is requested, not all of the data.
+    _ = fresh_client.tabledata(
+        GOOD_RESOURCE_ID,
+        use_cached_table=True,
+        limit=2,
+    )
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.qs == {'limit': ['2']}
+
+def test_tabledata_with_use_cached_table_and_partial_table(requests_mock):
+    tabledata_url = f'{TABLEDATA_ENDPOINT}/{GOOD_RESOURCE_ID}'
+    requests_mock.get(
+        tabledata_url,
+        json=APIResponsePagedTabledata({'limit': 3}).json(),
+    )
+
+    fresh_client = Client(cache_backend='memory')
+
+    # The cached response has 3 of the 7 rows, so it cannot answer queries.
+    _ = fresh_client.tabledata(GOOD_RESOURCE_ID)
+    _ = fresh_client.tabledata(
+        GOOD_RESOURCE_ID,
+        use_cached_table=True,
+        search='Row',
+    )
+    assert requests_mock.call_count == 2
+
+@pytest.mark.parametrize(
+    ('kwargs', 'expected_offsets'),
+    [
+        ({}, [0]),
+        ({'limit': 2}, [0, 2, 4, 6]),
+        ({'limit': 7}, [0]),
+        ({'limit': 2, 'offset': 3}, [3, 5]),
+    ],
+)
+def test_tabledata_all(paged_client, kwargs, expected_offsets):
+    tabledata = paged_client.tabledata_all(
+        GOOD_RESOURCE_ID,
+        max_workers=3,
+        **kwargs,
+    )
+
+    first_row = kwargs.get('offset', 0)
+    assert [row['rowText'] for row in tabledata['Data']['row']] == [
+        f'Row {i}' for i in range(first_row, PAGED_TABLEDATA_TOTAL)
+    ]
+    assert tabledata['Data']['offset'] == first_row
+    assert tabledata['Data']['limit'] == PAGED_TABLEDATA_TOTAL - first_row
+    assert check_type(tabledata, TabledataDict) == tabledata
+
+    offsets = sorted(
+        called_kwargs['params']['offset']
+        for _, called_kwargs in paged_client.session.get.call_args_list
+    )
+    assert offsets == expected_offsets
+
+def test_tabledata_all_requests_pages_concurrently(monkeypatch):
+    # Both of the remaining pages must be requested at the same time for
+    # them to pass the barrier.
+    barrier = Barrier(2, timeout=5)
+
+    def mock_requests_get(*args, **kwargs):
+        if kwargs['params']['offset'] > 0:
+            barrier.wait()
+        return APIResponsePagedTabledata(kwargs['params'])
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    tabledata = Client().tabledata_all(GOOD_RESOURCE_ID, max_workers=2, limit=3)
+    assert len(tabledata['Data']['row']) == PAGED_TABLEDATA_TOTAL
+
+def test_tabledata_all_with_lazy_sanitise(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponsePagedTabledata(kwargs['params'])
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    tabledata = Client(lazy_sanitise=True).tabledata_all(
+        GOOD_RESOURCE_ID,
+        limit=3,
+    )
+    rows = tabledata['Data']['row']
+    assert len(rows) == PAGED_TABLEDATA_TOTAL
+    assert isinstance(rows[0], SanitisedMapping)
+    assert rows[6]['columns'][0]['value'] == 6
+
+def test_tabledata_all_with_bad_inputs(paged_client):
+    with pytest.raises(ValueError):
+        _ = paged_client.tabledata_all(GOOD_RESOURCE_ID, max_workers=0)
+    with pytest.raises(ValueError):
+        _ = paged_client.tabledata_all(GOOD_RESOURCE_ID, limit=0)
+
+@pytest.fixture
+def many_client(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        url = args[-1]
+        if url.endswith(BAD_RESOURCE_ID):
+            return APIResponseZeroData()
+        if url.endswith(NOT_FOUND_RESOURCE_ID):
+            return APIResponseNotFound()
+        return APIResponsePagedTabledata(kwargs.get('params'))
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    many_client = Client()
+
+    original_tabledata = many_client.tabledata
+    many_client.tabledata = Mock(side_effect=original_tabledata)
+
+    return many_client
+
+def test_tabledata_many(many_client):
+    resource_ids = [
+        GOOD_RESOURCE_ID,
+        BAD_RESOURCE_ID,
+        GOOD_CUBE_RESOURCE_ID,
+        NOT_FOUND_RESOURCE_ID,
+        GOOD_RESOURCE_ID,
+    ]
+    results = many_client.tabledata_many(
+        iter(resource_ids),
+        max_workers=2,
+        limit=3,
+    )
+
+    assert list(results) == [
+        GOOD_RESOURCE_ID,
+        BAD_RESOURCE_ID,
+        GOOD_CUBE_RESOURCE_ID,
+        NOT_FOUND_RESOURCE_ID,
+    ]
+    # Repeated IDs are only requested once.
+    assert many_client.tabledata.call_count == 4
+    for resource_id in (GOOD_RESOURCE_ID, GOOD_CUBE_RESOURCE_ID):
+        assert check_type(results[resource_id], TabledataDict)
+        assert len(results[resource_id]['Data']['row']) == 3
+    assert isinstance(results[BAD_RESOURCE_ID], APIError)
+    assert isinstance(results[NOT_FOUND_RESOURCE_ID], HTTPError)
+
+def test_tabledata_many_with_bad_inputs(many_client):
+    with pytest.raises(ValueError):
+        _ = many_client.tabledata_many([GOOD_RESOURCE_ID], max_workers=0)
+    with pytest.raises(ValueError):
+        _ = many_client.tabledata_many([GOOD_RESOURCE_ID], limit=3001)
+    with pytest.raises(TypeError):
+        _ = many_client.tabledata_many(GOOD_RESOURCE_ID)
+    many_client.tabledata.assert_not_called()
+
+def test_metadata_many(many_client, monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        url = args[-1]
+        if url.endswith(BAD_RESOURCE_ID):
+            return APIResponseZeroData()
+        return APIResponseEmptyMetadata()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    with catch_warnings(record=True):
+        simplefilter('always')
+
+        results = many_client.metadata_many(
+            [GOOD_RESOURCE_ID, BAD_RESOURCE_ID, GOOD_RESOURCE_ID],
+        )
+
+    assert list(results) == [GOOD_RESOURCE_ID, BAD_RESOURCE_ID]
+    assert results[GOOD_RESOURCE_ID]['Data']['records'] == {}
+    assert isinstance(results[BAD_RESOURCE_ID], APIError)
+
+def test_metadata_many_with_bad_inputs(many_client):
+    original_metadata = many_client.metadata
+    many_client.metadata = Mock(side_effect=original_metadata)
+
+    with pytest.raises(TypeError):
+        _ = many_client.metadata_many(GOOD_RESOURCE_ID)
+    many_client.metadata.assert_not_called()
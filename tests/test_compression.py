@@ -0,0 +1,109 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-function-docstring
+
+"""Test that the compression of cached responses is working properly."""
+
+import gzip
+
+import pytest
+from requests_cache import CachedSession, SQLiteCache
+
+from singstat import compression
+from singstat.compression import (
+    CompressionStage,
+    compressed_serializer,
+)
+
+URL = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+CONTENT = b'{"Data": [' + b'{"key": "1995 1Q", "value": "81.4"}, ' * 1000 \
+    + b'{}]}'
+
+COMPRESSIONS = [
+    'gzip',
+    pytest.param(
+        'zstd',
+        marks=pytest.mark.skipif(
+            compression.zstd is None,
+            reason='zstandard is not installed',
+        ),
+    ),
+]
+
+@pytest.mark.parametrize('name', COMPRESSIONS)
+def test_compression_stage(name):
+    stage = CompressionStage(name)
+    assert stage.level == compression.COMPRESSION_LEVELS[name][0]
+    assert stage.info().ratio is None
+
+    value = stage.dumps(CONTENT)
+    assert len(value) < len(CONTENT)
+    assert stage.loads(value) == CONTENT
+
+    info = stage.info()
+    assert info.compression == name
+    assert info.count == 1
+    assert info.uncompressed_bytes == len(CONTENT)
+    assert info.compressed_bytes == len(value)
+    assert info.ratio == len(CONTENT) / len(value)
+
+    # Copies do not share statistics.
+    assert stage.copy().info().count == 0
+
+def test_compression_stage_reads_uncompressed_values():
+    stage = CompressionStage('gzip', 9)
+    assert stage.loads(CONTENT) == CONTENT
+    assert stage.loads(gzip.compress(CONTENT)) == CONTENT
+
+@pytest.mark.parametrize(
+    ('name', 'level'),
+    [
+        ('foo', None),
+        ('gzip', 10),
+        ('gzip', -1),
+        ('zstd', 0),
+        ('zstd', 23),
+    ],
+)
+def test_compression_stage_with_bad_values(name, level, monkeypatch):
+    monkeypatch.setattr(compression, 'zstd', object())
+    with pytest.raises(ValueError):
+        _ = CompressionStage(name, level)
+
+def test_compression_stage_without_zstd(monkeypatch):
+    monkeypatch.setattr(compression, 'zstd', None)
+    with pytest.raises(ImportError):
+        _ = CompressionStage('zstd')
+
+@pytest.mark.parametrize('name', COMPRESSIONS)
+def test_compressed_serializer(name, requests_mock, tmp_path):
+    requests_mock.get(URL, content=CONTENT)
+
+    cache = SQLiteCache(
+        tmp_path / 'cache',
+        serializer=compressed_serializer(name),
+    )
+    session = CachedSession(backend=cache)
+
+    _ = session.get(URL, expire_after=60)
+    response = session.get(URL, expire_after=60)
+    assert response.from_cache is True
+    assert response.content == CONTENT
+    assert requests_mock.call_count == 1
+
+    stage = cache.responses.serializer.stages[-1]
+    assert stage.info().count == 1
+    assert stage.info().ratio > 5
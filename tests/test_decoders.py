@@ -0,0 +1,76 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the JSON decoders are working properly."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from requests.exceptions import JSONDecodeError
+
+from singstat import decoders
+
+GOOD_CONTENT = b'{"Data": {"row": [{"value": "42"}]}, "DataCount": 1}'
+BAD_CONTENT = b'{"Data": '
+
+@pytest.fixture
+def fake_orjson(monkeypatch):
+    # Stand in for orjson, which has the same interface as this.
+    orjson = SimpleNamespace(
+        loads=json.loads,
+        JSONDecodeError=json.JSONDecodeError,
+    )
+    monkeypatch.setattr(decoders, 'orjson', orjson)
+    return orjson
+
+def test_get_json_decoder_json():
+    assert decoders.get_json_decoder('json') == ('json', None)
+
+def test_get_json_decoder_auto(monkeypatch, fake_orjson):
+    name, decode_json = decoders.get_json_decoder('auto')
+    assert name == 'orjson'
+    assert decode_json(GOOD_CONTENT) == json.loads(GOOD_CONTENT)
+
+    monkeypatch.setattr(decoders, 'orjson', None)
+    monkeypatch.setattr(decoders, 'msgspec', None)
+    assert decoders.get_json_decoder('auto') == ('json', None)
+
+def test_get_json_decoder_with_bad_name():
+    with pytest.raises(ValueError):
+        _ = decoders.get_json_decoder('foo')
+
+@pytest.mark.parametrize('name', ['orjson', 'msgspec'])
+def test_get_json_decoder_not_installed(monkeypatch, name):
+    monkeypatch.setattr(decoders, name, None)
+    with pytest.raises(ImportError):
+        _ = decoders.get_json_decoder(name)
+
+@pytest.mark.parametrize('name', ['orjson', 'msgspec'])
+def test_json_decoder(name):
+    pytest.importorskip(name)
+
+    decoder_name, decode_json = decoders.get_json_decoder(name)
+    assert decoder_name == name
+    assert decode_json(GOOD_CONTENT) == json.loads(GOOD_CONTENT)
+
+    with pytest.raises(JSONDecodeError):
+        _ = decode_json(BAD_CONTENT)
+
+def test_json_decoder_error(fake_orjson):
+    _, decode_json = decoders.get_json_decoder('orjson')
+    with pytest.raises(JSONDecodeError):
+        _ = decode_json(BAD_CONTENT)
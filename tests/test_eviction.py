@@ -0,0 +1,200 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+"""Test that the eviction of cached responses is working properly."""
+
+import pytest
+from requests_cache import BaseCache, CachedSession, SQLiteCache
+
+from singstat.constants import CACHE_USAGE_TABLE_NAME
+from singstat.eviction import CacheEvictor, CacheUsage
+from singstat.result_cache import ResultCache
+
+URL = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+@pytest.fixture
+def http_cache(tmp_path):
+    return SQLiteCache(tmp_path / 'cache')
+
+def counted_usage(http_cache, table_names=()):
+    responses = http_cache.responses
+    with responses.connection() as con:
+        entries, total_bytes = con.execute(
+            'SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) '
+            f'FROM {responses.table_name}'
+        ).fetchone()
+        for table_name in table_names:
+            total_bytes += con.execute(
+                f'SELECT COALESCE(SUM(LENGTH(value)), 0) FROM {table_name}'
+            ).fetchone()[0]
+    return CacheUsage(entries=entries, bytes=total_bytes)
+
+def recorded_uses(http_cache):
+    with http_cache.responses.connection() as con:
+        return dict(con.execute(
+            f'SELECT key, use_count FROM {CACHE_USAGE_TABLE_NAME}'
+        ).fetchall())
+
+def cache_responses(http_cache, requests_mock, names):
+    requests_mock.get(URL, json={'foo': 'bar'})
+    session = CachedSession(backend=http_cache)
+    return {
+        name: session.get(URL, params={'name': name}, expire_after=60) \
+            .cache_key
+        for name in names
+    }
+
+def test_evict_by_entries(http_cache, requests_mock):
+    keys = cache_responses(http_cache, requests_mock, ['a', 'b', 'c'])
+
+    evictor = CacheEvictor(http_cache, max_entries=2)
+    for name in ['a', 'b', 'c']:
+        evictor.record_use(keys[name])
+    evictor.record_use(keys['a'])
+
+    assert evictor.evict() == 1
+    assert evictor.usage().entries == 2
+    assert not http_cache.contains(keys['b'])
+    assert http_cache.contains(keys['a'])
+    assert evictor.evict() == 0
+
+@pytest.mark.parametrize(
+    ('policy', 'evicted'),
+    [
+        ('lru', 'a'),
+        ('lfu', 'b'),
+    ],
+)
+def test_evict_by_policy(policy, evicted, http_cache, requests_mock):
+    keys = cache_responses(http_cache, requests_mock, ['a', 'b'])
+
+    evictor = CacheEvictor(http_cache, max_entries=1, policy=policy)
+    for name in ['a', 'a', 'b']:
+        evictor.record_use(keys[name])
+
+    assert evictor.evict() == 1
+    assert not http_cache.contains(keys[evicted])
+
+def test_evict_by_bytes(http_cache, requests_mock):
+    keys = cache_responses(http_cache, requests_mock, ['a', 'b', 'c'])
+
+    evictor = CacheEvictor(http_cache)
+    usage = evictor.usage()
+    assert usage.entries == 3
+    assert evictor.evict() == 0
+
+    evictor.max_bytes = usage.bytes - 1
+    evictor.record_use(keys['c'])
+    assert evictor.evict() == 1
+    assert http_cache.contains(keys['c'])
+
+def test_record_new_use_evicts(http_cache, requests_mock):
+    keys = cache_responses(http_cache, requests_mock, ['a', 'b'])
+
+    evictor = CacheEvictor(http_cache, max_entries=1)
+    evictor.record_use(keys['b'], is_new=True)
+
+    assert evictor.usage().entries == 1
+    assert http_cache.contains(keys['b'])
+
+def test_usage(http_cache, requests_mock):
+    _ = cache_responses(http_cache, requests_mock, ['a', 'b'])
+
+    # Responses that were cached before the evictor was created are counted.
+    evictor = CacheEvictor(http_cache)
+    assert evictor.usage() == counted_usage(http_cache)
+    assert evictor.usage().entries == 2
+
+    # Responses that are saved, replaced and deleted afterwards are counted
+    # without counting all of the responses again.
+    requests_mock.get(URL, json={'foo': 'a much longer bar'})
+    session = CachedSession(backend=http_cache)
+    keys = {
+        name: session.get(
+            URL,
+            params={'name': name},
+            expire_after=60,
+            force_refresh=True,
+        ).cache_key
+        for name in ['b', 'c']
+    }
+    http_cache.delete(keys['c'])
+    assert evictor.usage() == counted_usage(http_cache)
+    assert evictor.usage().entries == 2
+
+    # The responses are counted again after they are cleared.
+    http_cache.clear()
+    assert evictor.usage() == CacheUsage(entries=0, bytes=0)
+    _ = cache_responses(http_cache, requests_mock, ['d'])
+    assert evictor.usage() == counted_usage(http_cache)
+
+def test_record_use_in_batches(http_cache, requests_mock):
+    keys = cache_responses(http_cache, requests_mock, ['a', 'b'])
+
+    evictor = CacheEvictor(http_cache)
+    evictor.flush()
+    for name in ['a', 'a', 'b']:
+        evictor.record_use(keys[name])
+    assert not recorded_uses(http_cache)
+
+    evictor.flush()
+    assert recorded_uses(http_cache) == {keys['a']: 2, keys['b']: 1}
+
+    # New responses are written at once.
+    evictor.record_use(keys['a'], is_new=True)
+    assert recorded_uses(http_cache) == {keys['a']: 1, keys['b']: 1}
+
+def test_evict_with_result_cache(http_cache, requests_mock):
+    keys = cache_responses(http_cache, requests_mock, ['a', 'b'])
+
+    result_cache = ResultCache(http_cache)
+    for name in ['a', 'b']:
+        _ = result_cache.save(
+            result_cache.create_key(keys[name], True, None, None),
+            keys[name],
+            {'foo': 'bar' * 100},
+        )
+
+    evictor = CacheEvictor(http_cache, result_cache=result_cache)
+    usage = evictor.usage()
+    # The results are counted towards the size of the cache.
+    assert usage == counted_usage(http_cache, ['sanitised_results'])
+    assert usage.bytes > counted_usage(http_cache).bytes
+
+    evictor.max_bytes = usage.bytes - 1
+    evictor.record_use(keys['b'])
+    assert evictor.evict() == 1
+
+    # The results of the evicted response are deleted with it.
+    assert not http_cache.contains(keys['a'])
+    assert len(result_cache) == 1
+    assert evictor.usage() == counted_usage(http_cache, ['sanitised_results'])
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'max_bytes': 0},
+        {'max_entries': 0},
+        {'policy': 'foo'},
+    ],
+)
+def test_cache_evictor_with_bad_values(kwargs, http_cache):
+    with pytest.raises(ValueError):
+        _ = CacheEvictor(http_cache, **kwargs)
+
+def test_cache_evictor_without_sqlite():
+    with pytest.raises(ValueError):
+        _ = CacheEvictor(BaseCache(), max_entries=1)
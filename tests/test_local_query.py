@@ -0,0 +1,141 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-function-docstring
+
+"""Test that queries are answered from all of a resource's data."""
+
+import pytest
+
+from singstat.client.local_query import query_tabledata
+
+TABLEDATA = {
+    'Data': {
+        'id': 'M212151',
+        'offset': None,
+        'limit': 3000,
+        'row': [
+            {
+                'seriesNo': '1.10',
+                'rowText': 'Total Residents',
+                'uoM': 'Number',
+                'footnote': '',
+                'columns': [
+                    {'key': '2017', 'value': 40},
+                    {'key': '2018', 'value': 50},
+                ],
+            },
+            {
+                'seriesNo': '1.9',
+                'rowText': 'Male Residents',
+                'uoM': 'Number',
+                'footnote': '',
+                'columns': [
+                    {'key': '2017', 'value': 20},
+                    {'key': '2018', 'value': 25},
+                ],
+            },
+            {
+                'seriesNo': '1.2',
+                'rowText': 'Female Residents',
+                'uoM': 'Number',
+                'footnote': '',
+                'columns': [
+                    {'key': '2017', 'value': 'na'},
+                    {'key': '2018', 'value': 5},
+                ],
+            },
+        ],
+    },
+    'DataCount': 3,
+    'StatusCode': 200,
+    'Message': '',
+}
+
+def series_nos(tabledata):
+    return [row['seriesNo'] for row in tabledata['Data']['row']]
+
+@pytest.mark.parametrize(
+    ('params', 'expected_series_nos', 'expected_count'),
+    [
+        ({}, ['1.10', '1.9', '1.2'], 3),
+        ({'seriesNoOrRowNo': '1.2,1.10'}, ['1.10', '1.2'], 2),
+        ({'search': 'male'}, ['1.9', '1.2'], 2),
+        ({'sortBy': 'seriesNo asc'}, ['1.2', '1.9', '1.10'], 3),
+        ({'sortBy': 'seriesNo desc'}, ['1.10', '1.9', '1.2'], 3),
+        ({'sortBy': 'rowText asc'}, ['1.2', '1.9', '1.10'], 3),
+        ({'between': '20,40'}, ['1.10', '1.9'], 2),
+        ({'between': '0,10', 'timeFilter': '2017'}, [], 0),
+        (
+            {'sortBy': 'seriesNo asc', 'offset': 1, 'limit': 1},
+            ['1.9'],
+            3,
+        ),
+    ],
+)
+def test_query_tabledata(params, expected_series_nos, expected_count):
+    tabledata = query_tabledata(TABLEDATA, params)
+
+    assert series_nos(tabledata) == expected_series_nos
+    assert tabledata['DataCount'] == expected_count
+    # The data that was queried is not changed.
+    assert series_nos(TABLEDATA) == ['1.10', '1.9', '1.2']
+
+def test_query_tabledata_filters_columns():
+    tabledata = query_tabledata(
+        TABLEDATA,
+        {'timeFilter': '2018', 'between': '20,50'},
+    )
+
+    assert series_nos(tabledata) == ['1.10', '1.9']
+    assert tabledata['Data']['row'][0]['columns'] == [
+        {'key': '2018', 'value': 50},
+    ]
+    assert tabledata['Data']['timeFilter'] == '2018'
+    assert tabledata['Data']['between'] == (20, 50)
+    assert len(TABLEDATA['Data']['row'][0]['columns']) == 2
+
+@pytest.mark.parametrize(
+    'params',
+    [
+        {'sortBy': 'key asc'},
+        {'sortBy': 'value desc'},
+        {'between': 'foo'},
+    ],
+)
+def test_query_tabledata_cannot_be_answered(params):
+    assert query_tabledata(TABLEDATA, params) is None
+
+def test_query_tabledata_with_cube():
+    cube_tabledata = {
+        'Data': {
+            'row': [
+                {
+                    'rowNo': '1',
+                    'rowText': 'Total',
+                    'uoM': 'Number',
+                    'footnote': '',
+                    'columns': [
+                        {
+                            'key': 'Total',
+                            'columns': [{'key': '2018', 'value': 1}],
+                        },
+                    ],
+                },
+            ],
+        },
+        'DataCount': 1,
+    }
+
+    assert query_tabledata(cube_tabledata, {'limit': 1}) is None
@@ -0,0 +1,76 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-function-docstring
+
+"""Test that the time periods are parsed properly."""
+
+import pytest
+
+from singstat.client.periods import (
+    Period,
+    latest_period,
+    parse_period,
+    periods_after,
+)
+
+@pytest.mark.parametrize(
+    ('period', 'expected_period'),
+    [
+        ('2018', Period(2018, 1, 1)),
+        ('2018 2H', Period(2018, 2, 2)),
+        ('2018 3Q', Period(2018, 3, 4)),
+        ('2018 Mar', Period(2018, 3, 12)),
+        (' 2018 Dec ', Period(2018, 12, 12)),
+        ('2018 5Q', None),
+        ('2018 March', None),
+        ('18 Mar', None),
+        ('foo', None),
+        ('', None),
+    ],
+)
+def test_parse_period(period, expected_period):
+    assert parse_period(period) == expected_period
+    if expected_period is not None:
+        assert str(expected_period) == period.strip()
+
+@pytest.mark.parametrize(
+    ('periods', 'expected_period'),
+    [
+        (['2018 Mar', '2019 Jan', '2018 Dec'], '2019 Jan'),
+        (['2017', '2016'], '2017'),
+        (['2018 Mar', 'foo'], None),
+        (['2018 Mar', '2018 1Q'], None),
+        ([], None),
+    ],
+)
+def test_latest_period(periods, expected_period):
+    period = latest_period(periods)
+    assert (str(period) if period else None) == expected_period
+
+@pytest.mark.parametrize(
+    ('start', 'end', 'expected_periods'),
+    [
+        ('2018 Nov', '2019 Feb', ['2018 Dec', '2019 Jan', '2019 Feb']),
+        ('2018 3Q', '2019 1Q', ['2018 4Q', '2019 1Q']),
+        ('2018 2H', '2019 2H', ['2019 1H', '2019 2H']),
+        ('2016', '2018', ['2017', '2018']),
+        ('2018', '2018', []),
+        ('2019', '2018', []),
+        ('2018 1Q', '2018 Mar', None),
+    ],
+)
+def test_periods_after(start, end, expected_periods):
+    periods = periods_after(parse_period(start), parse_period(end))
+    assert periods == expected_periods
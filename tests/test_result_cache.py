@@ -0,0 +1,261 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-function-docstring,redefined-outer-name
+
+from datetime import date
+
+import pytest
+from requests_cache import BaseCache, CachedSession, SQLiteCache
+
+from singstat import result_cache as result_cache_module
+from singstat.result_cache import CachedResult, MemoryCache, ResultCache
+
+URL = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+RESULT = {
+    'records': [{'date': date(2019, 7, 13), 'values': (37, 81)}],
+}
+
+@pytest.fixture(params=['sqlite', 'memory'])
+def http_cache(request, tmp_path):
+    if request.param == 'sqlite':
+        return SQLiteCache(tmp_path / 'cache')
+    return BaseCache()
+
+def cache_response(http_cache, requests_mock, **kwargs):
+    requests_mock.get(URL, json={'foo': 'bar'})
+    session = CachedSession(backend=http_cache)
+    response = session.get(URL, **({'expire_after': 60} | kwargs))
+    return response.cache_key
+
+def test_save_and_get(http_cache, requests_mock):
+    http_key = cache_response(http_cache, requests_mock)
+
+    cache = ResultCache(http_cache)
+    key = cache.create_key(http_key, True, None, None)
+
+    assert cache.get(key, http_key) is None
+    assert cache.save(key, http_key, RESULT) is True
+    assert len(cache) == 1
+
+    result = cache.get(key, http_key)
+    assert result.value == RESULT
+    assert result.value is not RESULT
+    assert isinstance(result.value['records'][0]['values'], tuple)
+
+    cache.clear()
+    assert cache.get(key, http_key) is None
+
+def test_save_without_http_response(http_cache):
+    cache = ResultCache(http_cache)
+    key = cache.create_key('foo', True, None, None)
+
+    assert cache.save(key, 'foo', RESULT) is False
+    assert cache.get(key, 'foo') is None
+
+def test_get_after_http_response_is_deleted(http_cache, requests_mock):
+    http_key = cache_response(http_cache, requests_mock)
+
+    cache = ResultCache(http_cache)
+    key = cache.create_key(http_key, True, None, None)
+    _ = cache.save(key, http_key, RESULT)
+
+    http_cache.delete(http_key)
+    assert cache.get(key, http_key) is None
+
+def test_get_after_http_response_is_replaced(http_cache, requests_mock):
+    http_key = cache_response(http_cache, requests_mock)
+
+    cache = ResultCache(http_cache)
+    key = cache.create_key(http_key, True, None, None)
+    _ = cache.save(key, http_key, RESULT)
+
+    _ = cache_response(
+        http_cache,
+        requests_mock,
+        expire_after=3600,
+        force_refresh=True,
+    )
+    assert cache.get(key, http_key) is None
+
+def test_get_after_expiry(http_cache, requests_mock, monkeypatch):
+    http_key = cache_response(http_cache, requests_mock)
+
+    cache = ResultCache(http_cache)
+    key = cache.create_key(http_key, True, None, None)
+    _ = cache.save(key, http_key, RESULT)
+
+    now = result_cache_module.time()
+    monkeypatch.setattr(result_cache_module, 'time', lambda: now + 120)
+    assert cache.get(key, http_key) is None
+
+def test_create_key(monkeypatch):
+    cache = ResultCache(BaseCache())
+
+    key = cache.create_key('foo', True, ['bar'], dict)
+    assert key == cache.create_key('foo', True, ['bar'], dict)
+    assert key != cache.create_key('baz', True, ['bar'], dict)
+    assert key != cache.create_key('foo', False, ['bar'], dict)
+    assert key != cache.create_key('foo', True, None, dict)
+    assert key != cache.create_key('foo', True, ['bar'], None)
+
+    monkeypatch.setattr(result_cache_module, 'VERSION', '0.0.0')
+    assert key != cache.create_key('foo', True, ['bar'], dict)
+
+    assert key.startswith('foo:')
+
+@pytest.mark.parametrize('memory_size', [0, 2])
+def test_delete(memory_size, http_cache, requests_mock):
+    http_keys = [
+        cache_response(http_cache, requests_mock, params={'name': name})
+        for name in ['a', 'b']
+    ]
+
+    cache = ResultCache(http_cache, memory_size=memory_size)
+    keys = [
+        cache.create_key(http_key, sanitise, None, None)
+        for http_key in http_keys
+        for sanitise in [True, False]
+    ]
+    for key, http_key in zip(keys, [http_keys[0]] * 2 + [http_keys[1]] * 2):
+        _ = cache.save(key, http_key, RESULT)
+
+    assert cache.delete(http_keys[0]) == 2
+    assert len(cache) == 2
+    assert cache.get(keys[0], http_keys[0]) is None
+    assert cache.get(keys[1], http_keys[0]) is None
+    assert cache.get(keys[2], http_keys[1]).value == RESULT
+
+def test_memory_cache():
+    cache = MemoryCache(maxsize=2, maxbytes=1024)
+
+    assert cache.get('a') is None
+    assert cache.save('a', CachedResult(RESULT, None)) is True
+
+    result = cache.get('a')
+    assert result.value == RESULT
+    # Each read returns a new copy.
+    assert result.value is not cache.get('a').value
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+    assert 0 < info.currbytes <= info.maxbytes
+
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 2, 0, 1024, 0)
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(maxsize=2, maxbytes=1024)
+
+    _ = cache.save('a', CachedResult('a', None))
+    _ = cache.save('b', CachedResult('b', None))
+    _ = cache.get('a')
+    _ = cache.save('c', CachedResult('c', None))
+
+    assert len(cache) == 2
+    assert cache.get('b') is None
+    assert cache.get('a').value == 'a'
+    assert cache.get('c').value == 'c'
+
+def test_memory_cache_evicts_by_bytes():
+    value = 'x' * 100
+    size = len(result_cache_module.RESULT_SERIALIZER.dumps(value))
+    cache = MemoryCache(maxsize=10, maxbytes=size * 2)
+
+    for key in 'abc':
+        _ = cache.save(key, CachedResult(value, None))
+
+    assert len(cache) == 2
+    assert cache.get('a') is None
+    assert cache.cache_info().currbytes == size * 2
+
+    # A result that is bigger than the cache is not kept.
+    assert cache.save('d', CachedResult(value * 3, None)) is False
+    assert cache.get('d') is None
+
+def test_memory_cache_expiry(monkeypatch):
+    cache = MemoryCache(maxsize=2, maxbytes=1024)
+    now = result_cache_module.time()
+
+    _ = cache.save('a', CachedResult('a', round(now) + 60))
+    assert cache.get('a').value == 'a'
+
+    monkeypatch.setattr(result_cache_module, 'time', lambda: now + 120)
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+@pytest.mark.parametrize(
+    ('maxsize', 'maxbytes'),
+    [
+        (0, 1024),
+        (2, 0),
+    ],
+)
+def test_memory_cache_with_bad_values(maxsize, maxbytes):
+    with pytest.raises(ValueError):
+        _ = MemoryCache(maxsize, maxbytes)
+
+def test_memory_tier(http_cache, requests_mock):
+    http_key = cache_response(http_cache, requests_mock)
+
+    cache = ResultCache(http_cache, memory_size=2)
+    key = cache.create_key(http_key, True, None, None)
+    _ = cache.save(key, http_key, RESULT)
+
+    assert cache.get(key, http_key).value == RESULT
+    # The memory tier does not check the HTTP cache.
+    http_cache.delete(http_key)
+    assert cache.get(key, http_key).value == RESULT
+
+    info = cache.cache_info()
+    assert info['memory'].hits == 2
+    assert info['persistent'].hits == 0
+
+    cache.clear()
+    assert cache.get(key, http_key) is None
+
+    info = cache.cache_info()
+    assert (info['memory'].hits, info['memory'].misses) == (0, 1)
+    assert (info['persistent'].hits, info['persistent'].misses) == (0, 1)
+
+def test_memory_tier_is_filled_from_persistent_tier(tmp_path, requests_mock):
+    # Results in a SQLite cache are shared by all of the result caches.
+    http_cache = SQLiteCache(tmp_path / 'cache')
+    http_key = cache_response(http_cache, requests_mock)
+
+    _ = ResultCache(http_cache).save('key', http_key, RESULT)
+
+    cache = ResultCache(http_cache, memory_size=2)
+    assert cache.get('key', http_key).value == RESULT
+    assert cache.get('key', http_key).value == RESULT
+
+    info = cache.cache_info()
+    assert (info['memory'].hits, info['memory'].misses) == (1, 1)
+    assert (info['persistent'].hits, info['persistent'].misses) == (1, 0)
+
+def test_memory_tier_disabled():
+    cache = ResultCache(BaseCache())
+    assert list(cache.cache_info()) == ['persistent']
+
+@pytest.mark.parametrize(
+    ('memory_size', 'memory_bytes'),
+    [
+        (-1, 1024),
+        (2, 0),
+    ],
+)
+def test_memory_tier_with_bad_values(memory_size, memory_bytes):
+    with pytest.raises(ValueError):
+        _ = ResultCache(BaseCache(), memory_size, memory_bytes)
@@ -0,0 +1,299 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the sanitise functions are working properly."""
+
+from datetime import date
+
+import pytest
+from typeguard import check_type
+
+from singstat import sanitise
+from singstat.client.constants import TABLEDATA_SANITISE_IGNORE_KEYS
+from singstat.client.types import MetadataDict, TabledataDict
+
+SANITISE_TREE_LIST = [
+    {
+        'rowNo': '1.1',
+        'rowText': 'Total',
+        'columns': [
+            {'key': '1', 'value': '1560'},
+            {'key': '2', 'value': '1677.5'},
+        ],
+    },
+    ['1,2', '1/7/2019'],
+    42,
+]
+
+@pytest.mark.parametrize(
+    ('key_path', 'expected_segments'),
+    [
+        ('', []),
+        ('Data', ['Data']),
+        ('Data.row[].columns[].key', ['Data', 'row', '[]', 'columns', '[]', 'key']),
+        ('[].rowNo', ['[]', 'rowNo']),
+    ],
+)
+def test_split_key_path(key_path, expected_segments):
+    assert sanitise.split_key_path(key_path) == expected_segments
+
+def test_compile_plan():
+    plan = sanitise.compile_plan(('Data.id', 'Data.row[].rowNo', 'Data.row[]'))
+
+    data_node = plan.children['Data']
+    assert data_node.ignore is False
+    assert data_node.children['id'].ignore is True
+    assert data_node.children['row'].ignore is False
+    assert data_node.children['row'].items.children['rowNo'].ignore is True
+    # list items cannot be ignored
+    assert data_node.children['row'].items.ignore is False
+
+    assert plan.descend('Data.row[]') is data_node.children['row'].items
+    assert plan.descend('Data.foo') is None
+
+    assert sanitise.compile_plan(('Data.id',)) is \
+        sanitise.compile_plan(('Data.id',))
+
+def test_compile_plan_with_schema():
+    plan = sanitise.compile_plan(
+        tuple(TABLEDATA_SANITISE_IGNORE_KEYS),
+        TabledataDict,
+    )
+
+    assert plan.descend('Data.offset').convert is not None
+    assert plan.descend('Data.row[].columns[].value').convert is not None
+    assert plan.descend('Data.row[].columns[].key').ignore is True
+    # Self-referencing type definitions are compiled, but the ignored key
+    # path is only the outermost one.
+    nested_key = plan.descend('Data.row[].columns[].columns[].columns[].key')
+    assert nested_key is not None
+    assert nested_key.ignore is False
+
+    assert sanitise.compile_plan((), MetadataDict) is \
+        sanitise.compile_plan((), MetadataDict)
+
+def test_sanitise_tree_with_schema():
+    value = {
+        'Data': {
+            'id': '8865',
+            'title': '2018',
+            'generatedBy': 'SingStat Table Builder',
+            'dateGenerated': '17/10/2026',
+            'offset': None,
+            'limit': '3000',
+            'between': '1560,1677',
+            'row': [
+                {
+                    'rowNo': '1.1',
+                    'rowText': '2018',
+                    'uoM': 'Number',
+                    'footnote': '',
+                    'columns': [
+                        {'key': '2018', 'value': '1560'},
+                        {'key': 'Total', 'columns': [
+                            {'key': '2019', 'value': '1677.5'},
+                        ]},
+                        {'key': '2020', 'value': '2018'},
+                        {'key': '2021', 'value': 'na'},
+                    ],
+                },
+            ],
+            'unknown': '42',
+        },
+        'DataCount': 1,
+        'StatusCode': 200,
+        'Message': '',
+    }
+
+    plan = sanitise.compile_plan((), TabledataDict)
+    result = sanitise.sanitise_tree(value, plan=plan)
+
+    assert result['Data']['id'] == '8865'
+    assert result['Data']['title'] == '2018'
+    assert result['Data']['dateGenerated'] == date(2026, 10, 17)
+    assert result['Data']['offset'] is None
+    assert result['Data']['limit'] == 3000
+    assert result['Data']['between'] == (1560, 1677)
+    row = result['Data']['row'][0]
+    assert row['rowNo'] == '1.1'
+    assert row['rowText'] == '2018'
+    assert row['columns'][0] == {'key': '2018', 'value': 1560}
+    assert row['columns'][1]['columns'][0] == {'key': '2019', 'value': 1677.5}
+    # Data values are numbers, not dates or times, or are left as-is.
+    assert row['columns'][2] == {'key': '2020', 'value': 2018}
+    assert row['columns'][3] == {'key': '2021', 'value': 'na'}
+    # Keys that are not in the type definition are sanitised by guessing.
+    assert result['Data'].pop('unknown') == 42
+
+    assert check_type(result, TabledataDict) == result
+
+@pytest.mark.parametrize(
+    ('value', 'expected_value'),
+    [
+        ('foo bar', 'foo bar'),
+        ('', ''),
+        ('42', 42),
+        ('4.2', 4.2),
+        ('1/7/2019', date(2019, 7, 1)),
+        ('1,2,3', (1, 2, 3)),
+        ('1.1, 2.2', (1.1, 2.2)),
+        ('1,2.2', '1,2.2'),
+        ('foo,bar', 'foo,bar'),
+    ],
+)
+def test_sanitise_value(value, expected_value):
+    assert sanitise.sanitise_value(value) == expected_value
+
+@pytest.mark.parametrize(
+    ('ignore_keys', 'expected_result'),
+    [
+        (
+            (),
+            [
+                {
+                    'rowNo': 1.1,
+                    'rowText': 'Total',
+                    'columns': [
+                        {'key': 1, 'value': 1560},
+                        {'key': 2, 'value': 1677.5},
+                    ],
+                },
+                [(1, 2), date(2019, 7, 1)],
+                42,
+            ],
+        ),
+        (
+            ('[].rowNo', '[].columns[].key'),
+            [
+                {
+                    'rowNo': '1.1',
+                    'rowText': 'Total',
+                    'columns': [
+                        {'key': '1', 'value': 1560},
+                        {'key': '2', 'value': 1677.5},
+                    ],
+                },
+                [(1, 2), date(2019, 7, 1)],
+                42,
+            ],
+        ),
+        (
+            ('[].columns',),
+            [
+                {
+                    'rowNo': 1.1,
+                    'rowText': 'Total',
+                    'columns': [
+                        {'key': '1', 'value': '1560'},
+                        {'key': '2', 'value': '1677.5'},
+                    ],
+                },
+                [(1, 2), date(2019, 7, 1)],
+                42,
+            ],
+        ),
+    ],
+)
+def test_sanitise_tree(ignore_keys, expected_result):
+    plan = sanitise.compile_plan(ignore_keys)
+    result = sanitise.sanitise_tree(SANITISE_TREE_LIST, plan=plan)
+    assert result == expected_result
+
+    # The original value must not be changed.
+    assert SANITISE_TREE_LIST[0]['rowNo'] == '1.1'
+
+def test_sanitise_tree_with_deep_nesting():
+    depth = 5000
+    value: list = ['1']
+    for _ in range(depth):
+        value = [value]
+
+    result = sanitise.sanitise_tree(value)
+    for _ in range(depth):
+        result = result[0]
+    assert result == [1]
+
+def test_sanitise_view():
+    plan = sanitise.compile_plan(('[].rowNo', '[].columns[].key'))
+    convert_calls = []
+
+    def convert(value):
+        convert_calls.append(value)
+        return sanitise.sanitise_value(value)
+
+    view = sanitise.sanitise_view(SANITISE_TREE_LIST, plan=plan, convert=convert)
+    assert isinstance(view, sanitise.SanitisedSequence)
+    assert len(view) == 3
+    assert not convert_calls
+
+    row = view[0]
+    assert isinstance(row, sanitise.SanitisedMapping)
+    assert row['rowNo'] == '1.1'
+    assert row['columns'][1]['value'] == 1677.5
+    assert convert_calls == ['1677.5']
+
+    # Sanitised values are kept.
+    assert row['columns'] is row['columns']
+    _ = row['columns'][1]['value']
+    assert convert_calls == ['1677.5']
+
+    assert view[-1] == 42
+    assert view[1:] == [[(1, 2), date(2019, 7, 1)], 42]
+    assert 'rowText' in row
+    assert 'foo' not in row
+    with pytest.raises(KeyError):
+        _ = row['foo']
+    with pytest.raises(IndexError):
+        _ = view[3]
+    with pytest.raises(TypeError):
+        row['rowNo'] = '1.2' # pylint: disable=unsupported-assignment-operation
+
+    expected_result = sanitise.sanitise_tree(SANITISE_TREE_LIST, plan=plan)
+    assert view == expected_result
+    assert view.to_list() == expected_result
+    assert isinstance(view.to_list()[0], dict)
+    assert row.to_dict() == expected_result[0]
+
+    # The original value must not be changed.
+    assert SANITISE_TREE_LIST[0]['columns'][1]['value'] == '1677.5'
+
+def test_sanitise_view_with_schema():
+    plan = sanitise.compile_plan((), MetadataDict)
+    view = sanitise.sanitise_view(
+        {'Data': {'records': {'title': '2018'}, 'dateGenerated': '17/10/2026'}},
+        plan=plan,
+    )
+
+    assert view['Data']['records']['title'] == '2018'
+    assert view['Data']['dateGenerated'] == date(2026, 10, 17)
+    assert sanitise.sanitise_view('42') == 42
+
+def test_sanitise_tree_in_place():
+    value = [
+        {'rowNo': '1.1', 'columns': [{'key': '1', 'value': '1560'}]},
+        ['1,2', '1/7/2019'],
+        42,
+    ]
+    plan = sanitise.compile_plan(('[].columns[].key',))
+    expected_result = sanitise.sanitise_tree(value, plan=plan)
+
+    columns = value[0]['columns']
+    result = sanitise.sanitise_tree(value, plan=plan, in_place=True)
+
+    assert result is value
+    assert result[0]['columns'] is columns
+    assert result == expected_result
+    assert columns[0] == {'key': '1', 'value': 1560}
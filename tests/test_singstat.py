@@ -16,16 +16,24 @@
 
 """Test that the SingStat class is working properly."""
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
+from threading import Barrier, current_thread
+from time import sleep
+from types import SimpleNamespace
 from unittest.mock import Mock
 from zoneinfo import ZoneInfo
 
 import pytest
+import requests_mock
 from requests import HTTPError
-from requests_cache import CachedSession
+from requests_cache import CachedSession, SQLiteCache
 
 from singstat.constants import USER_AGENT
+from singstat import decoders
 from singstat.exceptions import APIError
+from singstat.sanitise import SanitisedMapping
 from singstat.singstat import SingStat
 
 from tests.mocks.api_response_bad_request import APIResponseBadRequest
@@ -212,6 +220,594 @@ def test_sanitise_data(
     result = client.sanitise_data(value=SANITISE_DATA_DICT, **kwargs)
     assert result == expected_result
 
+def test_sanitise_data_with_schema(client):
+    result = client.sanitise_data(
+        value={'foobar': '2018', 'date': '1/7/2019', 'meaning_of_universe': '42'},
+        schema=MockArgsDict,
+    )
+    assert result == {
+        'foobar': '2018',
+        'date': date(2019, 7, 1),
+        'meaning_of_universe': 42,
+    }
+
+def test_sanitise_data_lazily(client):
+    result = client.sanitise_data(
+        value=SANITISE_DATA_DICT,
+        ignore_keys=['value_ignore'],
+        lazy=True,
+    )
+    assert isinstance(result, SanitisedMapping)
+    assert result['value_ignore'] == '37'
+    assert result['value_list'][2]['key1'] == 205
+    assert result == client.sanitise_data(
+        value=SANITISE_DATA_DICT,
+        ignore_keys=['value_ignore'],
+    )
+
+def test_sanitise_data_in_place(client):
+    value = {'value_list': ['1', {'key1': '2'}], 'value_ignore': '3'}
+    value_list = value['value_list']
+
+    result = client.sanitise_data(
+        value=value,
+        ignore_keys=['value_ignore'],
+        in_place=True,
+    )
+    assert result is value
+    assert result['value_list'] is value_list
+    assert result == {'value_list': [1, {'key1': 2}], 'value_ignore': '3'}
+
+def test_sanitise_cache_info():
+    client = SingStat(sanitise_cache_size=2)
+    client.sanitise_data(['42', '42', 'foo', '42', 'bar', 'baz'])
+
+    cache_info = client.sanitise_cache_info()
+    assert cache_info.hits == 2
+    assert cache_info.misses == 4
+    assert cache_info.maxsize == 2
+    assert cache_info.currsize == 2
+
+    client.sanitise_cache_clear()
+    cache_info = client.sanitise_cache_info()
+    assert cache_info.hits == 0
+    assert cache_info.currsize == 0
+
+def test_sanitise_cache_disabled():
+    client = SingStat(sanitise_cache_size=0)
+    result = client.sanitise_data(['42', '42'])
+    assert result == [42, 42]
+
+    cache_info = client.sanitise_cache_info()
+    assert cache_info.hits == 0
+    assert cache_info.currsize == 0
+
+def test_sanitise_cache_size_with_bad_value():
+    with pytest.raises(ValueError):
+        _ = SingStat(sanitise_cache_size=-1)
+
+def test_keyword_only_arguments():
+    with pytest.raises(TypeError):
+        _ = SingStat('memory', False, 10)
+
+def test_pool_size():
+    client = SingStat(pool_size=25)
+    adapter = client.session.get_adapter('https://')
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 25
+
+def test_pool_size_with_bad_value():
+    with pytest.raises(ValueError):
+        _ = SingStat(pool_size=0)
+
+def test_thread_safe_sqlite_cache():
+    client = SingStat(thread_safe=True)
+    assert client.thread_safe is True
+    assert client.session.cache.responses.wal is True
+
+    client_not_thread_safe = SingStat()
+    assert client_not_thread_safe.session.cache.responses.wal is False
+
+def test_thread_safe(tmp_path):
+    client = SingStat(
+        cache_backend=SQLiteCache(tmp_path / 'cache', wal=True),
+        thread_safe=True,
+        pool_size=4,
+    )
+    url = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+    def send_request(i):
+        data = client.send_request(url, params={'i': i % 4}, cache_duration=60)
+        return data, client.session
+
+    with requests_mock.Mocker() as m:
+        m.get(url, json=APIResponseSendRequest.json())
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(send_request, range(64)))
+
+    expected_data = results[0][0]
+    assert all(data == expected_data for data, _ in results)
+
+    # Each thread has its own session, but all of them share the cache.
+    sessions = {id(session): session for _, session in results}
+    assert len(sessions) > 1
+    assert client.session not in sessions.values()
+    assert all(
+        session.cache is client.session.cache for session in sessions.values()
+    )
+    assert client.session.cache.responses.count() == 4
+
+@pytest.mark.parametrize('thread_safe', [False, True])
+def test_map_concurrently(thread_safe):
+    client = SingStat(cache_backend='memory', thread_safe=thread_safe)
+    barrier = Barrier(2, timeout=5)
+
+    def get_session(i):
+        # Both threads must be used for them to pass the barrier.
+        barrier.wait()
+        return i, client.session
+
+    results = list(client.map_concurrently(get_session, range(2), 2))
+    assert [i for i, _ in results] == [0, 1]
+
+    # Each thread has its own session, which is not the client's session.
+    sessions = {id(session): session for _, session in results}
+    assert len(sessions) == 2
+    assert client.session not in sessions.values()
+
+    # The threads, and their sessions, are reused by later calls.
+    barrier.reset()
+    later_results = client.map_concurrently(get_session, range(2), 2)
+    assert {id(session) for _, session in later_results} == set(sessions)
+
+def test_map_concurrently_nested():
+    client = SingStat(cache_backend='memory')
+
+    def outer(i):
+        # The pool has one thread, which would wait for itself if the
+        # nested call was sent to the pool.
+        inner = client.map_concurrently(
+            lambda j: (j, current_thread()),
+            range(3),
+            1,
+        )
+        return i, current_thread(), list(inner)
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(
+        lambda: list(client.map_concurrently(outer, range(2), 1)),
+    )
+    executor.shutdown(wait=False)
+    results = future.result(timeout=5)
+
+    assert [i for i, _, _ in results] == [0, 1]
+    for _, thread, inner in results:
+        assert inner == [(j, thread) for j in range(3)]
+
+def test_map_concurrently_with_bad_max_workers():
+    client = SingStat(cache_backend='memory')
+    with pytest.raises(ValueError):
+        _ = client.map_concurrently(str, range(2), 0)
+
+def test_cache_results(tmp_path):
+    client = SingStat(
+        cache_backend=SQLiteCache(tmp_path / 'cache'),
+        cache_results=True,
+    )
+    url = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+    original_sanitise_data = client.sanitise_data
+    client.sanitise_data = Mock(side_effect=original_sanitise_data)
+
+    with requests_mock.Mocker() as m:
+        m.get(url, json=APIResponseSendRequest.json())
+
+        first = client.send_request(url, cache_duration=60)
+        second = client.send_request(url, cache_duration=60)
+
+        # The response is decoded and sanitised only once.
+        assert m.call_count == 1
+        client.sanitise_data.assert_called_once()
+        assert second == first
+        assert second is not first
+        assert second['Data']['records']['may_ignore'] == (37, 81)
+        assert len(client.result_cache) == 1
+
+        # A result is kept for each set of sanitise options.
+        raw = client.send_request(url, cache_duration=60, sanitise=False)
+        assert raw['Data']['records']['number'] == '42'
+        assert len(client.result_cache) == 2
+
+        # The result is invalidated with its response.
+        client.session.cache.clear()
+        _ = client.send_request(url, cache_duration=60)
+        assert m.call_count == 2
+        assert client.sanitise_data.call_count == 2
+
+def test_send_request_with_force_refresh():
+    client_cached = SingStat(cache_backend='memory', cache_results=True)
+    url = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+    with requests_mock.Mocker() as m:
+        m.get(url, json=APIResponseSendRequest.json())
+
+        _ = client_cached.send_request(url, cache_duration=60)
+        _ = client_cached.send_request(url, cache_duration=60)
+        assert m.call_count == 1
+
+        data = client_cached.send_request(
+            url,
+            cache_duration=60,
+            force_refresh=True,
+        )
+        assert m.call_count == 2
+        assert data['Data']['records']['number'] == 42
+
+def test_cache_results_in_memory(tmp_path):
+    client = SingStat(
+        cache_backend=SQLiteCache(tmp_path / 'cache'),
+        cache_results=True,
+        memory_cache_size=8,
+        memory_cache_bytes=1024 * 1024,
+    )
+    url = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+    with requests_mock.Mocker() as m:
+        m.get(url, json=APIResponseSendRequest.json())
+
+        for _ in range(3):
+            _ = client.send_request(url, cache_duration=60)
+
+    info = client.result_cache.cache_info()
+    assert (info['memory'].hits, info['memory'].misses) == (2, 1)
+    assert info['memory'].maxsize == 8
+    assert info['memory'].maxbytes == 1024 * 1024
+
+def test_cache_compression(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    client = SingStat(cache_compression='gzip', cache_compression_level=9)
+    url = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+    with requests_mock.Mocker() as m:
+        m.get(url, json=APIResponseSendRequest.json())
+
+        first = client.send_request(url, cache_duration=60)
+        second = client.send_request(url, cache_duration=60)
+        assert m.call_count == 1
+        assert second == first
+
+    info = client.cache_compression_info()
+    assert (info.compression, info.level, info.count) == ('gzip', 9, 1)
+    assert info.compressed_bytes < info.uncompressed_bytes
+
+def test_cache_compression_disabled():
+    client = SingStat(cache_backend='memory')
+    assert client.cache_compression_info() is None
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'cache_compression': 'foo'},
+        {'cache_compression': 'gzip', 'cache_compression_level': 10},
+        {'cache_compression': 'gzip', 'cache_backend': SQLiteCache(':memory:')},
+    ],
+)
+def test_cache_compression_with_bad_values(kwargs):
+    with pytest.raises(ValueError):
+        _ = SingStat(**kwargs)
+
+@pytest.mark.parametrize('cache_results', [False, True])
+def test_cache_max_entries(cache_results, tmp_path):
+    client = SingStat(
+        cache_backend=SQLiteCache(tmp_path / 'cache'),
+        cache_results=cache_results,
+        cache_max_entries=2,
+    )
+    url = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+    with requests_mock.Mocker() as m:
+        m.get(url, json=APIResponseSendRequest.json())
+
+        for name in ['a', 'b', 'a', 'c']:
+            _ = client.send_request(url, {'name': name}, cache_duration=60)
+        assert m.call_count == 3
+
+        # "b" was the least recently used response, so it was evicted.
+        _ = client.send_request(url, {'name': 'a'}, cache_duration=60)
+        assert m.call_count == 3
+        _ = client.send_request(url, {'name': 'b'}, cache_duration=60)
+        assert m.call_count == 4
+
+    assert client.cache_evictor.usage().entries == 2
+
+def test_compact_cache(tmp_path):
+    client = SingStat(
+        cache_backend=SQLiteCache(tmp_path / 'cache'),
+        cache_results=True,
+    )
+    url = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+    with requests_mock.Mocker() as m:
+        m.get(url, json=APIResponseSendRequest.json())
+
+        _ = client.send_request(url, {'name': 'a'}, cache_duration=60)
+        _ = client.send_request(url, {'name': 'b'}, cache_duration=1)
+
+    sleep(2)
+    info = client.compact_cache()
+    assert (info.expired, info.evicted) == (1, 0)
+    assert info.bytes_after <= info.bytes_before
+    assert len(client.session.cache.responses) == 1
+    assert len(client.result_cache) == 1
+
+def test_compact_cache_periodically(tmp_path):
+    client = SingStat(
+        cache_backend=SQLiteCache(tmp_path / 'cache'),
+        cache_compaction_interval=1,
+    )
+    client.compact_cache = Mock()
+
+    sleep(1.5)
+    client.stop_compaction()
+    sleep(1)
+    client.compact_cache.assert_called_once()
+
+def test_close(tmp_path, monkeypatch):
+    session_close = Mock()
+    monkeypatch.setattr(CachedSession, 'close', session_close)
+    client = SingStat(
+        cache_backend=SQLiteCache(tmp_path / 'cache'),
+        cache_max_entries=2,
+    )
+    client.cache_evictor.flush = Mock()
+
+    threads = list(client.map_concurrently(
+        lambda _: (client.session, current_thread()),
+        range(2),
+        2,
+    ))
+    client.close()
+
+    # The threads are shut down, and the sessions of the client and of
+    # the threads are closed.
+    assert not any(thread.is_alive() for _, thread in threads)
+    assert session_close.call_count == 1 + len({id(s) for s, _ in threads})
+    client.cache_evictor.flush.assert_called_once()
+
+def test_context_manager():
+    with SingStat(cache_backend='memory') as client:
+        client.close = Mock()
+
+    client.close.assert_called_once()
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'cache_max_entries': 0},
+        {'cache_max_bytes': 0},
+        {'cache_max_entries': 1, 'cache_eviction_policy': 'foo'},
+        {'cache_max_entries': 1, 'cache_backend': 'memory'},
+        {'cache_compaction_interval': 0},
+    ],
+)
+def test_cache_limits_with_bad_values(kwargs, tmp_path):
+    kwargs = {'cache_backend': SQLiteCache(tmp_path / 'cache')} | kwargs
+    with pytest.raises(ValueError):
+        _ = SingStat(**kwargs)
+
+@pytest.mark.parametrize('cache_results', [False, True])
+def test_stale_while_revalidate(cache_results):
+    client = SingStat(
+        cache_backend='memory',
+        cache_results=cache_results,
+        stale_while_revalidate=60,
+    )
+    url = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+    def response(count):
+        return APIResponseSendRequest.json() | {'DataCount': count}
+
+    with requests_mock.Mocker() as m:
+        m.get(url, [{'json': response(1)}, {'json': response(2)}])
+
+        _ = client.send_request(url, cache_duration=1)
+        sleep(2)
+
+        # The stale response is returned, and refreshed in the background.
+        data = client.send_request(url, cache_duration=1)
+        assert data['DataCount'] == 1
+        key = client.create_cache_key(url)
+        for _ in range(50):
+            if not client.session.cache.get_response(key).is_expired:
+                break
+            sleep(0.1)
+        assert m.call_count == 2
+
+        data = client.send_request(url, cache_duration=1)
+        assert data['DataCount'] == 2
+        assert m.call_count == 2
+
+def test_stale_while_revalidate_with_bad_value():
+    with pytest.raises(ValueError):
+        _ = SingStat(cache_backend='memory', stale_while_revalidate=0)
+
+@pytest.mark.parametrize(
+    'response',
+    [
+        {'json': APIResponseBadRequest.json(), 'status_code': 400},
+        {'json': APIResponseZeroData.json()},
+    ],
+)
+def test_negative_cache_duration(response):
+    client = SingStat(cache_backend='memory', negative_cache_duration=1)
+    url = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+    with requests_mock.Mocker() as m:
+        m.get(url, [response, {'json': APIResponseSendRequest.json()}])
+
+        errors = []
+        for _ in range(2):
+            with pytest.raises(APIError) as e:
+                _ = client.send_request(url, cache_duration=60)
+            errors.append(e.value)
+
+        # The error is raised again from the cache.
+        assert m.call_count == 1
+        assert errors[1].message == errors[0].message
+        assert errors[1].data == errors[0].data
+
+        # Until the error expires.
+        sleep(1.1)
+        data = client.send_request(url, cache_duration=60)
+        assert data['DataCount'] == 1
+        assert m.call_count == 2
+
+def test_negative_cache_duration_disabled():
+    client = SingStat(cache_backend='memory')
+    url = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+    with requests_mock.Mocker() as m:
+        m.get(url, json=APIResponseBadRequest.json(), status_code=400)
+
+        for _ in range(2):
+            with pytest.raises(APIError):
+                _ = client.send_request(url, cache_duration=60)
+        assert m.call_count == 2
+
+def test_negative_cache_duration_with_bad_value():
+    with pytest.raises(ValueError):
+        _ = SingStat(cache_backend='memory', negative_cache_duration=0)
+
+def test_memory_cache_size_with_bad_value():
+    with pytest.raises(ValueError):
+        _ = SingStat(cache_results=True, memory_cache_size=-1)
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'memory_cache_size': 8},
+        {'memory_cache_bytes': 1024 * 1024},
+        {'cache_results': True, 'memory_cache_bytes': 1024 * 1024},
+    ],
+)
+def test_memory_cache_without_its_requirement(kwargs):
+    with pytest.raises(ValueError):
+        _ = SingStat(cache_backend='memory', **kwargs)
+
+def test_cache_results_without_caching(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseSendRequest()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client_patched = SingStat(cache_backend='memory', cache_results=True)
+    _ = client_patched.send_request(
+        'https://tablebuilder.singstat.gov.sg/api/gndn',
+    )
+    assert len(client_patched.result_cache) == 0
+
+    client_lazy = SingStat(
+        cache_backend='memory',
+        lazy_sanitise=True,
+        cache_results=True,
+    )
+    data = client_lazy.send_request(
+        'https://tablebuilder.singstat.gov.sg/api/gndn',
+    )
+    assert isinstance(data, SanitisedMapping)
+    assert len(client_lazy.result_cache) == 0
+
+    assert SingStat(cache_backend='memory').result_cache is None
+
+def make_single_flight_client(workers, response):
+    """Return a client whose session sends a slow request, after all of the \
+        workers have created their cache keys."""
+    client = SingStat(cache_backend='memory', single_flight=True)
+
+    barrier = Barrier(workers)
+    original_create_cache_key = client.create_cache_key
+
+    def create_cache_key(*args, **kwargs):
+        barrier.wait()
+        return original_create_cache_key(*args, **kwargs)
+
+    def session_get(*args, **kwargs):
+        sleep(0.2)
+        return response
+
+    client.create_cache_key = create_cache_key
+    client.session.get = Mock(side_effect=session_get)
+
+    return client
+
+def test_single_flight():
+    workers = 8
+    client = make_single_flight_client(workers, APIResponseSendRequest())
+    assert client.single_flight is True
+
+    def send_request(_):
+        return client.send_request(
+            'https://tablebuilder.singstat.gov.sg/api/gndn',
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(send_request, range(workers)))
+
+    client.session.get.assert_called_once()
+    # All of the callers share the same result.
+    assert all(data is results[0] for data in results)
+    assert results[0]['Data']['records']['number'] == 42
+
+    # The request is sent again after it is no longer in flight.
+    client.create_cache_key = Mock(return_value='key')
+    _ = client.send_request('https://tablebuilder.singstat.gov.sg/api/gndn')
+    assert client.session.get.call_count == 2
+
+def test_single_flight_with_error():
+    workers = 4
+    client = make_single_flight_client(workers, APIResponseBadRequest())
+
+    def send_request(_):
+        try:
+            return client.send_request(
+                'https://tablebuilder.singstat.gov.sg/api/table/resourceid',
+                {'keyword': 'house'},
+            )
+        except APIError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        errors = list(executor.map(send_request, range(workers)))
+
+    client.session.get.assert_called_once()
+    assert all(isinstance(e, APIError) for e in errors)
+
+def test_single_flight_disabled(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseSendRequest()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client_patched = SingStat(cache_backend='memory')
+    assert client_patched.single_flight is False
+
+    first = client_patched.send_request(
+        'https://tablebuilder.singstat.gov.sg/api/gndn',
+    )
+    second = client_patched.send_request(
+        'https://tablebuilder.singstat.gov.sg/api/gndn',
+    )
+    assert first == second
+    assert first is not second
+
+def test_create_cache_key(client):
+    url = 'https://tablebuilder.singstat.gov.sg/api/gndn'
+
+    key = client.create_cache_key(url, {'foo': 'bar'})
+    assert isinstance(key, str)
+    assert key == client.create_cache_key(url, {'foo': 'bar'})
+    assert key != client.create_cache_key(url, {'foo': 'baz'})
+
 @pytest.mark.parametrize(
     ('kwargs', 'expected_data'),
     [
@@ -340,6 +936,57 @@ def test_send_request(kwargs, expected_data, monkeypatch):
 
     assert data == expected_data
 
+def test_send_request_with_lazy_sanitise(monkeypatch):
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseSendRequest()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+
+    client_patched = SingStat(lazy_sanitise=True)
+    assert client_patched.lazy_sanitise is True
+
+    data = client_patched.send_request(
+        'https://tablebuilder.singstat.gov.sg/api/gndn',
+    )
+    assert isinstance(data, SanitisedMapping)
+    assert data['Data']['records']['may_ignore'] == (37, 81)
+
+    data = client_patched.send_request(
+        'https://tablebuilder.singstat.gov.sg/api/gndn',
+        sanitise=False,
+    )
+    assert isinstance(data, dict)
+
+def test_send_request_with_json_decoder(monkeypatch):
+    class APIResponseContent(APIResponseSendRequest):
+        content = json.dumps(APIResponseSendRequest.json()).encode()
+
+        @staticmethod
+        def json():
+            raise AssertionError('json() must not be called.')
+
+    def mock_requests_get(*args, **kwargs):
+        return APIResponseContent()
+
+    monkeypatch.setattr(CachedSession, 'get', mock_requests_get)
+    # Stand in for orjson, which has the same interface as this.
+    monkeypatch.setattr(decoders, 'orjson', SimpleNamespace(
+        loads=json.loads,
+        JSONDecodeError=json.JSONDecodeError,
+    ))
+
+    client_patched = SingStat(json_decoder='orjson')
+    assert client_patched.json_decoder == 'orjson'
+
+    data = client_patched.send_request(
+        'https://tablebuilder.singstat.gov.sg/api/gndn',
+    )
+    assert data['Data']['records']['number'] == 42
+
+def test_json_decoder_with_bad_value():
+    with pytest.raises(ValueError):
+        _ = SingStat(json_decoder='foo')
+
 def test_send_request_with_invalid_endpoint(client):
     with pytest.raises(HTTPError):
         _ = client.send_request(
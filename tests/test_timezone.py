@@ -17,6 +17,8 @@
 """Test that the timezone functions are working properly."""
 
 from datetime import date, datetime, time
+from random import Random
+from re import fullmatch, match
 from zoneinfo import ZoneInfo
 
 import pytest
@@ -26,6 +28,67 @@ from singstat import timezone
 
 SGT_TIMEZONE = ZoneInfo('Asia/Singapore')
 
+def _datetime_from_string_by_all_formats(val):
+    """Reference implementation that tries every allowed date format."""
+    dt_datetime = None
+    dt_format = ''
+    for date_format in timezone.ALLOWED_DATE_FORMATS:
+        try:
+            if date_format == '%H%M' and len(val) != 4:
+                raise ValueError('val is not a 4-digit time')
+            if date_format == '%H:%M' and len(val) != 5:
+                raise ValueError('val is not a 5-digit time')
+
+            dt_datetime = datetime.strptime(val, date_format)
+            dt_format = date_format
+        except ValueError:
+            continue
+
+    if dt_datetime is None:
+        raise ValueError('val is not a recognised datetime string')
+
+    dt_datetime_sgt = dt_datetime.replace(tzinfo=SGT_TIMEZONE)
+    if match('%H:?%M', dt_format) is not None:
+        return dt_datetime_sgt.time()
+    if fullmatch('%Y-?%m-?%d', dt_format) is not None:
+        return dt_datetime_sgt.date()
+    if fullmatch('%d/%m/%Y', dt_format) is not None:
+        return dt_datetime_sgt.date()
+    return dt_datetime_sgt
+
+def _parity_strings():
+    """Strings of every allowed date format, near-misses and non-dates."""
+    random = Random(20260416)
+    strings = {
+        'foobar', '', '2018', '2018 1Q', '2018 Mar', '1560', '1677.5',
+        '-12.5', '1e5', '123456', '20190713', '2019-7-1', '1/7/2019',
+        ' 1/7/2019', '2019-07-13  08:32:17', '2019-07-13\t08:32:17',
+        '2019-07-13t08:32:17z', '2019-07-13T08:32:17Z',
+        '2019-07-13T08:32:17+08:00:00.5', '8:3-0800', '08:3+08',
+        '08:32:17', '0832', '832', '08:32:1', '2019-07- 1',
+    }
+    datetimes = [
+        datetime(2019, 7, 13, 8, 32, 17, 456000, tzinfo=SGT_TIMEZONE),
+        datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=ZoneInfo('UTC')),
+        datetime(1999, 12, 31, 23, 59, 59, tzinfo=ZoneInfo('America/New_York')),
+    ]
+    for dt in datetimes:
+        for date_format in timezone.ALLOWED_DATE_FORMATS:
+            formatted = dt.strftime(date_format)
+            strings.add(formatted)
+            strings.add(formatted.replace('+', '-'))
+            strings.add(formatted.replace('-0', '-').replace(':0', ':'))
+            strings.add(formatted[:-1])
+            strings.add(f'{formatted}Z')
+    alphabet = '0123456789-:/. +TtZ'
+    for _ in range(2000):
+        strings.add(''.join(
+            random.choice(alphabet) for _ in range(random.randint(1, 26))
+        ))
+    return sorted(strings)
+
+PARITY_STRINGS = _parity_strings()
+
 @pytest.mark.parametrize(
     ('date_time', 'expected_hour'),
     [
@@ -201,3 +264,31 @@ def test_datetime_from_string(date_time_str, expected_date_time):
 def test_datetime_from_bad_string(date_time_str):
     with pytest.raises(ValueError):
         _ = timezone.datetime_from_string(date_time_str)
+
+def test_candidate_date_formats():
+    for date_format in timezone.ALLOWED_DATE_FORMATS:
+        for val in PARITY_STRINGS:
+            try:
+                _ = datetime.strptime(val, date_format)
+            except ValueError:
+                continue
+            if date_format == '%H%M' and len(val) != 4:
+                continue
+            if date_format == '%H:%M' and len(val) != 5:
+                continue
+            assert date_format in timezone.candidate_date_formats(val), val
+
+def test_datetime_from_string_parity():
+    for val in PARITY_STRINGS:
+        try:
+            expected_date_time = _datetime_from_string_by_all_formats(val)
+        except ValueError:
+            with pytest.raises(ValueError):
+                _ = timezone.datetime_from_string(val)
+            continue
+
+        date_time = timezone.datetime_from_string(val)
+        assert type(date_time) is type(expected_date_time), val
+        assert date_time == expected_date_time, val
+        if isinstance(date_time, (datetime, time)):
+            assert date_time.tzinfo == expected_date_time.tzinfo, val
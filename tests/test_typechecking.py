@@ -0,0 +1,112 @@
+# Copyright 2026 Yuhui. All rights reserved.
+#
+# Licensed under the GNU General Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=invalid-name,missing-function-docstring,redefined-outer-name,unused-argument
+
+"""Test that the runtime type checks and fast mode are working properly."""
+
+import asyncio
+from inspect import iscoroutinefunction
+
+import pytest
+from typeguard import TypeCheckError
+
+from singstat import typechecking
+from singstat.singstat import SingStat
+from singstat.timezone import datetime_from_string
+
+from tests.mocks.types_args import MockArgsDict
+
+@pytest.fixture
+def fast_mode():
+    typechecking.set_fast_mode(True)
+    yield
+    typechecking.set_fast_mode(False)
+
+def test_type_checks_are_run():
+    assert typechecking.is_fast_mode() is False
+
+    with pytest.raises(TypeCheckError):
+        _ = datetime_from_string(42)
+
+    with pytest.raises(TypeCheckError):
+        _ = typechecking.check_type({'foobar': 42}, MockArgsDict)
+
+def test_type_checks_are_skipped_in_fast_mode(fast_mode):
+    assert typechecking.is_fast_mode() is True
+
+    # ``datetime_from_string()`` fails on its own, not from a type check.
+    with pytest.raises(TypeError):
+        _ = datetime_from_string(42)
+
+    value = {'foobar': 42}
+    assert typechecking.check_type(value, MockArgsDict) is value
+
+    params = SingStat().build_params(MockArgsDict, {'foobar': 42})
+    assert params == {'foobar': 42}
+
+def test_fast_mode_from_constructor():
+    try:
+        _ = SingStat(fast_mode=True)
+        assert typechecking.is_fast_mode() is True
+
+        # Leave the mode as-is when ``fast_mode`` is not specified.
+        _ = SingStat()
+        assert typechecking.is_fast_mode() is True
+    finally:
+        _ = SingStat(fast_mode=False)
+
+    assert typechecking.is_fast_mode() is False
+
+@pytest.mark.parametrize(
+    ('env_value', 'expected_fast_mode'),
+    [
+        (None, False),
+        ('', False),
+        ('0', False),
+        ('false', False),
+        ('1', True),
+        ('true', True),
+        ('Yes', True),
+        ('ON', True),
+    ],
+)
+def test_fast_mode_from_env(monkeypatch, env_value, expected_fast_mode):
+    if env_value is None:
+        monkeypatch.delenv(typechecking.FAST_MODE_ENV_VAR, raising=False)
+    else:
+        monkeypatch.setenv(typechecking.FAST_MODE_ENV_VAR, env_value)
+
+    assert typechecking.fast_mode_from_env() is expected_fast_mode
+
+def test_typechecked_class():
+    @typechecking.typechecked
+    class Foo:
+        def bar(self, value: int) -> int:
+            return value
+
+    with pytest.raises(TypeCheckError):
+        _ = Foo().bar('42')
+
+def test_typechecked_coroutine_function(fast_mode):
+    @typechecking.typechecked
+    async def foo(value: int) -> int:
+        return value
+
+    assert iscoroutinefunction(foo)
+    assert asyncio.run(foo('42')) == '42'
+
+    typechecking.set_fast_mode(False)
+    with pytest.raises(TypeCheckError):
+        _ = asyncio.run(foo('42'))